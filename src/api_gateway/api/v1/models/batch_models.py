@@ -0,0 +1,10 @@
+import os
+
+from pydantic import UUID4, BaseModel, Field
+
+
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "100"))
+
+
+class BatchGetModel(BaseModel):
+    ids: list[UUID4] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
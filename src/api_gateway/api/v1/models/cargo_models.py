@@ -1,9 +1,10 @@
+from datetime import datetime, timezone
 from typing import Optional
 from pydantic import UUID4, BaseModel, ValidationError
 
 from api.v1.models.delivery_models import BriefDeliveryModel
 
-from grpc_build.cargo_service_pb2 import CargoData, CreateCargoData, UpdateCargoData
+from grpc_build.cargo_service_pb2 import CargoBatch, CargoData, CreateCargoData, UpdateCargoData
 
 
 class CreateCargoModel(BaseModel):
@@ -39,6 +40,7 @@ class CargoModel(BaseModel):
     creator_id: UUID4
     weight: int
     delivery: Optional[BriefDeliveryModel] = None
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_grpc_message(cls, grpc_message: CargoData):
@@ -48,8 +50,26 @@ class CargoModel(BaseModel):
             }
 
             if "delivery_data" in cargo_data:
-                cargo_data["delivery_data"] =  BriefDeliveryModel.from_grpc_message(cargo_data["delivery_data"])
+                cargo_data["delivery"] = BriefDeliveryModel.from_grpc_message(
+                    cargo_data.pop("delivery_data")
+                )
 
-            return CargoData(**cargo_data)
+            if "updated_at" in cargo_data:
+                cargo_data["updated_at"] = cargo_data["updated_at"].ToDatetime(
+                    tzinfo=timezone.utc
+                )
+
+            return CargoModel(**cargo_data)
         except ValidationError:
-            return None
\ No newline at end of file
+            return None
+
+class CargoBatchModel(BaseModel):
+    items: list[CargoModel]
+    missing_ids: list[UUID4]
+
+    @classmethod
+    def from_grpc_message(cls, grpc_message: CargoBatch):
+        return CargoBatchModel(
+            items=[CargoModel.from_grpc_message(item) for item in grpc_message.items],
+            missing_ids=list(grpc_message.missing_ids),
+        )
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, ValidationError
 
-from models.item_models import ItemModel
+from api.v1.models.item_models import ItemModel
 from grpc_build.payment_service_pb2 import CostRuleData
 from google.protobuf.json_format import ParseDict
 
@@ -0,0 +1,36 @@
+from typing import Optional
+from pydantic import BaseModel
+
+from api.v1.models.cargo_models import CargoModel
+from api.v1.models.delivery_models import DeliveryModel
+from api.v1.models.payment_models import PaymentInfoModel
+from api.v1.models.user_models import UserModel
+
+
+class SectionErrorModel(BaseModel):
+    code: int
+    message: str
+
+
+class DeliveryDetailsModel(BaseModel):
+    delivery: DeliveryModel
+    cargo: Optional[CargoModel] = None
+    sender: Optional[UserModel] = None
+    receiver: Optional[UserModel] = None
+    payment: Optional[PaymentInfoModel] = None
+    # Sections missing because of access rules or backend failures
+    errors: dict[str, SectionErrorModel]
+
+    @classmethod
+    def from_sections(cls, sections: dict, errors: dict[str, dict]):
+        converters = {
+            "delivery": DeliveryModel.from_grpc_message,
+            "cargo": CargoModel.from_grpc_message,
+            "sender": UserModel.from_grpc_message,
+            "receiver": UserModel.from_grpc_message,
+            "payment": PaymentInfoModel.from_grpc_message,
+        }
+        return DeliveryDetailsModel(
+            **{name: converters[name](data) for name, data in sections.items()},
+            errors=errors,
+        )
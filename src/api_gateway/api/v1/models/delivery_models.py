@@ -1,7 +1,8 @@
+from datetime import datetime, timezone
 from typing import Optional
 from pydantic import UUID4, BaseModel, ValidationError
 
-from grpc_build.delivery_service_pb2 import CreateDeliveryData, DeliveryData, SearchDeliveryData, UpdateDeliveryData
+from grpc_build.delivery_service_pb2 import CreateDeliveryData, DeliveryBatch, DeliveryData, SearchDeliveryData, UpdateDeliveryData
 from grpc_build.cargo_service_pb2 import BriefDeliveryData
 
 
@@ -16,7 +17,7 @@ class BriefDeliveryModel(BaseModel):
                 desc.name: value for desc, value in grpc_message.ListFields()
             }
 
-            return BriefDeliveryData(**delivery_data)
+            return BriefDeliveryModel(**delivery_data)
         except ValidationError:
             return None
 
@@ -73,9 +74,10 @@ class DeliveryModel(BaseModel):
     sender_id: UUID4
     receiver_id: UUID4
     cargo_id: UUID4
-    bill_id: Optional[UUID4]
+    bill_id: Optional[UUID4] = None
     send_address_id: UUID4
     receive_address_id: UUID4
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_grpc_message(cls, grpc_message: DeliveryData):
@@ -84,6 +86,11 @@ class DeliveryModel(BaseModel):
                 desc.name: value for desc, value in grpc_message.ListFields()
             }
 
+            if "updated_at" in delivery_data:
+                delivery_data["updated_at"] = delivery_data["updated_at"].ToDatetime(
+                    tzinfo=timezone.utc
+                )
+
             return DeliveryModel(**delivery_data)
         except ValidationError:
             return None
@@ -94,8 +101,23 @@ class DeliveryModel(BaseModel):
         res["sender_id"] = str(res["sender_id"])
         res["receiver_id"] = str(res["receiver_id"])
         res["cargo_id"] = str(res["cargo_id"])
-        res["bill_id"] = str(res["bill_id"])
+
+        if "bill_id" in res:
+            res["bill_id"] = str(res["bill_id"])
+
         res["send_address_id"] = str(res["send_address_id"])
         res["receive_address_id"] = str(res["receive_address_id"])
 
         return DeliveryData(**res)
+
+
+class DeliveryBatchModel(BaseModel):
+    items: list[DeliveryModel]
+    missing_ids: list[UUID4]
+
+    @classmethod
+    def from_grpc_message(cls, grpc_message: DeliveryBatch):
+        return DeliveryBatchModel(
+            items=[DeliveryModel.from_grpc_message(item) for item in grpc_message.items],
+            missing_ids=list(grpc_message.missing_ids),
+        )
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from asyncpg import Record
 from pydantic import UUID4, BaseModel, EmailStr, ValidationError
@@ -87,6 +87,7 @@ class UserModel(BaseModel):
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
     groups: list[GroupModel]
+    updated_at: Optional[datetime] = None
 
 
     @classmethod
@@ -102,6 +103,10 @@ class UserModel(BaseModel):
                     for group in user_data["groups"]
                 ]
 
+            for name in ("birth", "updated_at"):
+                if name in user_data:
+                    user_data[name] = user_data[name].ToDatetime(tzinfo=timezone.utc)
+
             return UserModel(**user_data)
         except ValidationError:
             return None
@@ -2,11 +2,15 @@ from fastapi import APIRouter, Body, Depends, Form, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import UUID4
 
+from lib.concurrency_limiter import CRITICAL, request_priority
 from lib.http_tools import make_http_error
+from lib.token_verifier import TokenVerifier
 from api.v1.models.token_models import TokenModel
 from grpc_build.account_service_pb2 import (
     AuthRequest,
     AuthResponse,
+    CheckPermissionsBatchRequest,
+    CheckPermissionsBatchResponse,
     CheckPermissionsRequest,
     CheckPermissionsResponse,
     LogoutRequest,
@@ -44,10 +48,17 @@ def get_refresh_token(refresh_token: str = Form(...), grant_type: str = Form(...
 # TODO Remove returning user_id from JWT token
 def check_permission(permission: str):
     async def check_permissions_wrap(access_token=Depends(oauth2_scheme)) -> str:
-        account_stub: AccountServiceStub = app.state.account_stub
-        resp: CheckPermissionsResponse = await account_stub.CheckPermissions(
-            CheckPermissionsRequest(access_token=access_token, permission=permission)
-        )
+        token_verifier: TokenVerifier | None = app.state.token_verifier
+        resp = None
+        if token_verifier is not None and token_verifier.synced:
+            resp = token_verifier.check_permission(access_token, permission)
+        if resp is None:
+            account_stub: AccountServiceStub = app.state.account_stub
+            resp: CheckPermissionsResponse = await account_stub.CheckPermissions(
+                CheckPermissionsRequest(
+                    access_token=access_token, permission=permission
+                )
+            )
         if resp.code == 200:
             return
         else:
@@ -56,7 +67,66 @@ def check_permission(permission: str):
     return Depends(check_permissions_wrap)
 
 
-@router.post("/token", response_model=TokenModel, responses=token_responses)
+async def check_access(
+    access_token: str, permissions: list[str]
+) -> list[CheckPermissionsResponse]:
+    token_verifier: TokenVerifier | None = app.state.token_verifier
+    if token_verifier is not None and token_verifier.synced:
+        resps = token_verifier.check_permissions(access_token, permissions)
+        if resps is not None:
+            return resps
+
+    # Token is decoded once by the account service for all permissions
+    account_stub: AccountServiceStub = app.state.account_stub
+    resp: CheckPermissionsBatchResponse = await account_stub.CheckPermissionsBatch(
+        CheckPermissionsBatchRequest(access_token=access_token, permissions=permissions)
+    )
+    return list(resp.results)
+
+
+async def require_permissions(
+    access_token: str, permissions, optional_permissions=()
+) -> set[str]:
+    # One local check or one CheckPermissionsBatch call for all permissions. Fails with
+    # the first denied required permission, returns the granted optional ones
+    resps = await check_access(access_token, [*permissions, *optional_permissions])
+    for resp in resps[: len(permissions)]:
+        if resp.code != 200:
+            make_http_error(resp)
+    return {
+        optional_permission
+        for optional_permission, resp in zip(
+            optional_permissions, resps[len(permissions) :]
+        )
+        if resp.code == 200
+    }
+
+
+def check_permissions(*permissions: str):
+    # Route needs every permission, it is denied when any of them is missing
+    async def check_permissions_wrap(access_token=Depends(oauth2_scheme)):
+        await require_permissions(access_token, permissions)
+
+    return Depends(check_permissions_wrap)
+
+
+def check_section_permissions(permission: str, *section_permissions: str):
+    # Composite routes check the token once: the route needs permission, every
+    # section of the response is filled only when its own permission is granted
+    async def check_section_permissions_wrap(
+        access_token=Depends(oauth2_scheme),
+    ) -> set[str]:
+        return await require_permissions(access_token, [permission], section_permissions)
+
+    return Depends(check_section_permissions_wrap)
+
+
+@router.post(
+    "/token",
+    response_model=TokenModel,
+    dependencies=[request_priority(CRITICAL)],
+    responses=token_responses,
+)
 async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     account_stub: AccountServiceStub = app.state.account_stub
     resp: AuthResponse = await account_stub.Auth(
@@ -72,7 +142,12 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
         make_http_error(resp)
 
 
-@router.post("/refresh", response_model=TokenModel, responses=refresh_responses)
+@router.post(
+    "/refresh",
+    response_model=TokenModel,
+    dependencies=[request_priority(CRITICAL)],
+    responses=refresh_responses,
+)
 async def refresh(refresh_token: str = Depends(get_refresh_token)):
     account_stub: AccountServiceStub = app.state.account_stub
     resp: RefreshResponse = await account_stub.Refresh(
@@ -88,7 +163,9 @@ async def refresh(refresh_token: str = Depends(get_refresh_token)):
         make_http_error(resp)
 
 
-@router.post("/logout", responses=logout_responses)
+@router.post(
+    "/logout", dependencies=[request_priority(CRITICAL)], responses=logout_responses
+)
 async def logout(token: str = Depends(oauth2_scheme)):
     account_stub: AccountServiceStub = app.state.account_stub
     resp: LogoutResponse = await account_stub.Logout(LogoutRequest(access_token=token))
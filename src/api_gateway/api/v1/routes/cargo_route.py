@@ -1,24 +1,32 @@
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 
-from api.v1.models.cargo_models import CargoModel, CreateCargoModel, UpdateCargoModel
+from api.v1.models.batch_models import BatchGetModel
+from api.v1.models.cargo_models import CargoBatchModel, CargoModel, CreateCargoModel, UpdateCargoModel
 from api.v1.routes.account_route import check_permission
+from lib.concurrency_limiter import BULK, request_priority
 from grpc_build.cargo_service_pb2 import (
     CreateCargoRequest,
     CreateCargoResponse,
     GetCargoRequest,
     GetCargoResponse,
+    GetCargosRequest,
+    GetCargosResponse,
     GetUserCargosRequest,
     GetUserCargosResponse,
+    StreamUserCargosRequest,
     UpdateCargoRequest,
     UpdateCargoResponse,
 )
 
 from grpc_build.cargo_service_pb2_grpc import CargoServiceStub
-from lib.http_tools import make_http_error
+from lib.http_tools import get_known_versions, make_http_error, make_validators
+from lib.ndjson_stream import stream_ndjson
+from lib.proto_json import FAST_JSON_RESPONSES, ProtoJSONResponse
 from context import app
 
-from api.v1.routes.responses.cargo_responses import get_cargo_responses, create_cargo_responses, update_cargo_responses, get_user_cargos_responses
+from api.v1.routes.responses.cargo_responses import get_cargo_responses, create_cargo_responses, update_cargo_responses, get_user_cargos_responses, get_cargos_batch_responses, stream_user_cargos_responses
 
 
 router = APIRouter(prefix="/api/v1/cargo", tags=["cargo"])
@@ -39,6 +47,8 @@ async def create_cargo(cargo: CreateCargoModel):
     )
 
     if resp.code == 201:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.cargo_data, status_code=201)
         return CargoModel.from_grpc_message(resp.cargo_data)
     else:
         make_http_error(resp)
@@ -46,16 +56,56 @@ async def create_cargo(cargo: CreateCargoModel):
 @router.get(
     "/user_cargos",
     response_model=list[CargoModel],
-    dependencies=[check_permission("READ_CARGO")],
+    dependencies=[request_priority(BULK), check_permission("READ_CARGO")],
+    response_model_exclude_unset=True,
     responses=get_user_cargos_responses
 )
 async def get_user_cargos(page: int = Query(...), user_id: UUID4 = Query(...)):
     cargo_stub: CargoServiceStub = app.state.cargo_stub
-    resp: GetUserCargosResponse = cargo_stub.GetUserCargos(
+    resp: GetUserCargosResponse = await cargo_stub.GetUserCargos(
         GetUserCargosRequest(page=page, user_id=str(user_id))
     )
     if resp.code == 200:
-        return [CargoModel.from_grpc_message(cargo_data) for cargo_data in resp.arr]
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.arr.cargo_data)
+        return [
+            CargoModel.from_grpc_message(cargo_data)
+            for cargo_data in resp.arr.cargo_data
+        ]
+    else:
+        make_http_error(resp)
+
+
+@router.get(
+    "/user_cargos/stream",
+    response_class=StreamingResponse,
+    dependencies=[request_priority(BULK), check_permission("READ_CARGO")],
+    responses=stream_user_cargos_responses
+)
+async def stream_user_cargos(user_id: UUID4 = Query(...)):
+    cargo_stub: CargoServiceStub = app.state.cargo_stub
+    return await stream_ndjson(
+        cargo_stub.StreamUserCargos(StreamUserCargosRequest(user_id=str(user_id))),
+        lambda resp: resp.arr.cargo_data,
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=CargoBatchModel,
+    dependencies=[request_priority(BULK), check_permission("READ_CARGO")],
+    response_model_exclude_unset=True,
+    responses=get_cargos_batch_responses
+)
+async def get_cargos_batch(batch: BatchGetModel):
+    cargo_stub: CargoServiceStub = app.state.cargo_stub
+    resp: GetCargosResponse = await cargo_stub.GetCargos(
+        GetCargosRequest(cargo_ids=[str(cargo_id) for cargo_id in batch.ids])
+    )
+    if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.batch)
+        return CargoBatchModel.from_grpc_message(resp.batch)
     else:
         make_http_error(resp)
 
@@ -64,12 +114,23 @@ async def get_user_cargos(page: int = Query(...), user_id: UUID4 = Query(...)):
     "/{cargo_id}",
     response_model=CargoModel,
     dependencies=[check_permission("READ_CARGO")],
+    response_model_exclude_unset=True,
     responses=get_cargo_responses
 )
-async def get_cargo(cargo_id: UUID4):
+async def get_cargo(cargo_id: UUID4, request: Request, response: Response):
     cargo_stub: CargoServiceStub = app.state.cargo_stub
-    resp: GetCargoResponse = cargo_stub.GetCargo(GetCargoRequest(cargo_id=str(cargo_id)))
-    if resp.code == 200:
+    resp: GetCargoResponse = await cargo_stub.GetCargo(
+        GetCargoRequest(
+            cargo_id=str(cargo_id), **get_known_versions(request)
+        )
+    )
+    if resp.code == 304:
+        return Response(status_code=304, headers=make_validators(resp))
+    elif resp.code == 200:
+        validators = make_validators(resp.cargo_data)
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.cargo_data, headers=validators)
+        response.headers.update(validators)
         return CargoModel.from_grpc_message(resp.cargo_data)
     else:
         make_http_error(resp)
@@ -79,18 +140,21 @@ async def get_cargo(cargo_id: UUID4):
     "/{cargo_id}",
     response_model=CargoModel,
     dependencies=[check_permission("UPDATE_CARGO")],
+    response_model_exclude_unset=True,
     responses=update_cargo_responses
 )
 async def update_cargo(cargo_id: UUID4, updating_cargo: UpdateCargoModel):
     cargo_stub: CargoServiceStub = app.state.cargo_stub
 
-    resp: UpdateCargoResponse = cargo_stub.UpdateCargo(
+    resp: UpdateCargoResponse = await cargo_stub.UpdateCargo(
         UpdateCargoRequest(
             cargo_id=str(cargo_id), updating_cargo_data=updating_cargo.to_UpdateCargoData()
         )
     )
 
     if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.cargo_data)
         return CargoModel.from_grpc_message(resp.cargo_data)
     else:
         make_http_error(resp)
@@ -1,15 +1,33 @@
-from fastapi import APIRouter, Query, status
+import asyncio
+
+from fastapi import APIRouter, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
+from api.v1.models.batch_models import BatchGetModel
+from api.v1.models.delivery_details_models import DeliveryDetailsModel
 from api.v1.models.delivery_models import (
     CreateDeliveryModel,
+    DeliveryBatchModel,
     DeliveryModel,
     SearchDeliveryModel,
     UpdateDeliveryModel,
 )
-from api.v1.routes.account_route import check_permission
-from lib.http_tools import make_http_error
+from api.v1.routes.account_route import check_permission, check_section_permissions
+from lib.concurrency_limiter import BULK, request_priority
+from lib.http_tools import get_known_versions, make_http_error, make_validators
+from lib.ndjson_stream import stream_ndjson
+from lib.proto_json import FAST_JSON_RESPONSES, ProtoJSONResponse
+from lib.sections import ACCESS_DENIED, fetch_section
+from grpc_build.cargo_service_pb2 import GetCargoRequest
+from grpc_build.cargo_service_pb2_grpc import CargoServiceStub
+from grpc_build.payment_service_pb2 import MakePaymentRequest
+from grpc_build.payment_service_pb2_grpc import PaymentServiceStub
+from grpc_build.user_service_pb2 import GetUserDataRequest
+from grpc_build.user_service_pb2_grpc import UserServiceStub
 from grpc_build.delivery_service_pb2 import (
     GetDeliveryResponse,
+    GetDeliveriesRequest,
+    GetDeliveriesResponse,
     GetDeliveryRequest,
     CreateDeliveryRequest,
     CreateDeliveryResponse,
@@ -17,6 +35,7 @@ from grpc_build.delivery_service_pb2 import (
     UpdateDeliveryResponse,
     SearchDeliveriesRequest,
     SearchDeliveriesResponse,
+    StreamDeliveriesRequest,
 )
 
 from api.v1.routes.responses.delivery_responses import (
@@ -24,6 +43,9 @@ from api.v1.routes.responses.delivery_responses import (
     create_delivery_responses,
     update_delivery_responses,
     search_deliveries_responses,
+    get_deliveries_batch_responses,
+    stream_deliveries_responses,
+    get_delivery_details_responses,
 )
 from grpc_build.delivery_service_pb2_grpc import DeliveryServiceStub
 from context import app
@@ -35,7 +57,7 @@ router = APIRouter(prefix="/api/v1/delivery", tags=["delivery"])
 @router.get(
     "/search",
     response_model=list[DeliveryModel],
-    dependencies=[check_permission("READ_DELIVERY")],
+    dependencies=[request_priority(BULK), check_permission("READ_DELIVERY")],
     response_model_exclude_unset=True,
     responses=search_deliveries_responses,
 )
@@ -45,7 +67,7 @@ async def search_deliveries(
     receiver_id: UUID4 | None = Query(None),
 ):
     delivery_stub: DeliveryServiceStub = app.state.delivery_stub
-    resp: SearchDeliveriesResponse = delivery_stub.SearchDeliveries(
+    resp: SearchDeliveriesResponse = await delivery_stub.SearchDeliveries(
         SearchDeliveriesRequest(
             page=page,
             searching_delivery_data=SearchDeliveryModel(
@@ -55,6 +77,8 @@ async def search_deliveries(
     )
 
     if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.deliveries.arr)
         return [
             DeliveryModel.from_grpc_message(delivery)
             for delivery in resp.deliveries.arr
@@ -63,6 +87,51 @@ async def search_deliveries(
         make_http_error(resp)
 
 
+@router.get(
+    "/search/stream",
+    response_class=StreamingResponse,
+    dependencies=[request_priority(BULK), check_permission("READ_DELIVERY")],
+    responses=stream_deliveries_responses,
+)
+async def stream_deliveries(
+    sender_id: UUID4 | None = Query(None),
+    receiver_id: UUID4 | None = Query(None),
+):
+    delivery_stub: DeliveryServiceStub = app.state.delivery_stub
+    return await stream_ndjson(
+        delivery_stub.StreamDeliveries(
+            StreamDeliveriesRequest(
+                searching_delivery_data=SearchDeliveryModel(
+                    sender_id=sender_id, receiver_id=receiver_id
+                ).to_SearchDeliveryData(),
+            )
+        ),
+        lambda resp: resp.deliveries.arr,
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=DeliveryBatchModel,
+    dependencies=[request_priority(BULK), check_permission("READ_DELIVERY")],
+    response_model_exclude_unset=True,
+    responses=get_deliveries_batch_responses,
+)
+async def get_deliveries_batch(batch: BatchGetModel):
+    delivery_stub: DeliveryServiceStub = app.state.delivery_stub
+    resp: GetDeliveriesResponse = await delivery_stub.GetDeliveries(
+        GetDeliveriesRequest(
+            delivery_ids=[str(delivery_id) for delivery_id in batch.ids]
+        )
+    )
+    if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.batch)
+        return DeliveryBatchModel.from_grpc_message(resp.batch)
+    else:
+        make_http_error(resp)
+
+
 @router.get(
     "/{delivery_id}",
     response_model=DeliveryModel,
@@ -70,17 +139,112 @@ async def search_deliveries(
     response_model_exclude_unset=True,
     responses=get_delivery_responses
 )
-async def get_delivery(delivery_id: UUID4):
+async def get_delivery(delivery_id: UUID4, request: Request, response: Response):
     delivery_stub: DeliveryServiceStub = app.state.delivery_stub
-    resp: GetDeliveryResponse = delivery_stub.GetDelivery(
-        GetDeliveryRequest(delivery_id=str(delivery_id))
+    resp: GetDeliveryResponse = await delivery_stub.GetDelivery(
+        GetDeliveryRequest(
+            delivery_id=str(delivery_id),
+            **get_known_versions(request),
+        )
     )
-    if resp.code == 200:
+    if resp.code == 304:
+        return Response(status_code=304, headers=make_validators(resp))
+    elif resp.code == 200:
+        validators = make_validators(resp.delivery_data)
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.delivery_data, headers=validators)
+        response.headers.update(validators)
         return DeliveryModel.from_grpc_message(resp.delivery_data)
     else:
         make_http_error(resp)
 
 
+@router.get(
+    "/{delivery_id}/details",
+    response_model=DeliveryDetailsModel,
+    response_model_exclude_unset=True,
+    responses=get_delivery_details_responses,
+)
+async def get_delivery_details(
+    delivery_id: UUID4,
+    granted: set[str] = check_section_permissions(
+        "READ_DELIVERY", "READ_CARGO", "READ_USER", "MAKE_PAYMENT"
+    ),
+):
+    delivery_stub: DeliveryServiceStub = app.state.delivery_stub
+    cargo_stub: CargoServiceStub = app.state.cargo_stub
+    user_stub: UserServiceStub = app.state.user_stub
+    payment_stub: PaymentServiceStub = app.state.payment_stub
+
+    sections = {}
+    errors = {}
+    pending = {}
+    # Payment needs only the delivery id, so it is requested together with the delivery
+    if "MAKE_PAYMENT" in granted:
+        pending["payment"] = asyncio.create_task(
+            fetch_section(
+                payment_stub.MakePayment(MakePaymentRequest(delivery_id=str(delivery_id))),
+                lambda resp: resp.payment_data,
+            )
+        )
+    else:
+        errors["payment"] = ACCESS_DENIED
+
+    try:
+        resp: GetDeliveryResponse = await delivery_stub.GetDelivery(
+            GetDeliveryRequest(delivery_id=str(delivery_id))
+        )
+        if resp.code != 200:
+            make_http_error(resp)
+        delivery = sections["delivery"] = resp.delivery_data
+
+        # Sections depending on the delivery start as soon as it is known
+        if "READ_CARGO" in granted:
+            pending["cargo"] = asyncio.create_task(
+                fetch_section(
+                    cargo_stub.GetCargo(GetCargoRequest(cargo_id=delivery.cargo_id)),
+                    lambda resp: resp.cargo_data,
+                )
+            )
+        else:
+            errors["cargo"] = ACCESS_DENIED
+
+        for section, user_id in (
+            ("sender", delivery.sender_id),
+            ("receiver", delivery.receiver_id),
+        ):
+            if "READ_USER" in granted:
+                pending[section] = asyncio.create_task(
+                    fetch_section(
+                        user_stub.GetUserData(GetUserDataRequest(user_id=user_id)),
+                        lambda resp: resp.user_data,
+                    )
+                )
+            else:
+                errors[section] = ACCESS_DENIED
+
+        results = await asyncio.gather(*pending.values())
+    finally:
+        for task in pending.values():
+            task.cancel()
+
+    for section, (data, error) in zip(pending, results):
+        if error is None:
+            sections[section] = data
+        else:
+            errors[section] = error
+
+    if FAST_JSON_RESPONSES:
+        # Keys in the order of the model fields, as the pydantic path renders them
+        document = {
+            name: sections[name]
+            for name in DeliveryDetailsModel.model_fields
+            if name in sections
+        }
+        return ProtoJSONResponse({**document, "errors": errors})
+    return DeliveryDetailsModel.from_sections(sections, errors)
+
+
 @router.post(
     "/",
     response_model=DeliveryModel,
@@ -91,12 +255,14 @@ async def get_delivery(delivery_id: UUID4):
 )
 async def create_delivery(creating_delivery: CreateDeliveryModel):
     delivery_stub: DeliveryServiceStub = app.state.delivery_stub
-    resp: CreateDeliveryResponse = delivery_stub.CreateDelivery(
+    resp: CreateDeliveryResponse = await delivery_stub.CreateDelivery(
         CreateDeliveryRequest(
             creating_delivery_data=creating_delivery.to_CreateDeliveryData()
         )
     )
     if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.delivery_data, status_code=201)
         return DeliveryModel.from_grpc_message(resp.delivery_data)
     else:
         make_http_error(resp)
@@ -111,12 +277,14 @@ async def create_delivery(creating_delivery: CreateDeliveryModel):
 )
 async def update_delivery(delivery_id: UUID4, updating_delivery: UpdateDeliveryModel):
     delivery_stub: DeliveryServiceStub = app.state.delivery_stub
-    resp: UpdateDeliveryResponse = delivery_stub.UpdateDelivery(
+    resp: UpdateDeliveryResponse = await delivery_stub.UpdateDelivery(
         UpdateDeliveryRequest(
             delivery_id=str(delivery_id), updating_delivery_data=updating_delivery
         )
     )
     if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.delivery_data)
         return DeliveryModel.from_grpc_message(resp.delivery_data)
     else:
         make_http_error(resp)
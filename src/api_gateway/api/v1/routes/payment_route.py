@@ -2,6 +2,7 @@ import json
 from pydantic import UUID4
 from api.v1.models.payment_models import PaymentInfoModel, PaymentRuleModel
 from api.v1.routes.account_route import check_permission
+from lib.concurrency_limiter import BULK, request_priority
 from api.v1.models.item_models import ItemModel
 from lib.http_tools import make_http_error
 from grpc_build.payment_service_pb2 import (
@@ -61,7 +62,7 @@ async def accept_payment(body=Body(...)):
 @router.get(
     "/search",
     response_model=list[dict],
-    dependencies=[check_permission("READ_PAYMENT")],
+    dependencies=[request_priority(BULK), check_permission("READ_PAYMENT")],
     responses=search_payments_responses,
 )
 async def search_payments(
@@ -1,5 +1,6 @@
 from api.v1.routes.responses.responses_parts.server_responses_parts import (
     internal_error_response,
+    not_modified_response,
 )
 from api.v1.routes.responses.responses_parts.account_responses_parts import (
     check_permission_error_response,
@@ -9,6 +10,7 @@ from api.v1.routes.responses.responses_parts.account_responses_parts import (
 from api.v1.routes.responses.responses_parts.cargo_responses_parts import (
     cargo_not_found_response,
     cargo_created_response,
+    cargo_stream_response,
 )
 
 create_cargo_responses = {
@@ -25,6 +27,7 @@ get_user_cargos_responses = {
 }
 
 get_cargo_responses = {
+    **not_modified_response,
     **check_permission_error_response,
     **check_permission_failed_response,
     **internal_error_response,
@@ -38,3 +41,15 @@ update_cargo_responses = {
     **cargo_not_found_response,
 }
 
+get_cargos_batch_responses = {
+    **internal_error_response,
+    **check_permission_error_response,
+    **check_permission_failed_response,
+}
+
+stream_user_cargos_responses = {
+    **cargo_stream_response,
+    **internal_error_response,
+    **check_permission_error_response,
+    **check_permission_failed_response,
+}
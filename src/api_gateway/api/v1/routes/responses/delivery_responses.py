@@ -1,5 +1,6 @@
 from api.v1.routes.responses.responses_parts.server_responses_parts import (
     internal_error_response,
+    not_modified_response,
 )
 from api.v1.routes.responses.responses_parts.account_responses_parts import (
     check_permission_error_response,
@@ -9,9 +10,11 @@ from api.v1.routes.responses.responses_parts.account_responses_parts import (
 from api.v1.routes.responses.responses_parts.delivery_responses_parts import (
     delivery_not_found_response,
     delivery_created_response,
+    delivery_stream_response,
 )
 
 get_delivery_responses = {
+    **not_modified_response,
     **internal_error_response,
     **check_permission_error_response,
     **check_permission_failed_response,
@@ -36,3 +39,23 @@ search_deliveries_responses = {
     **check_permission_error_response,
     **check_permission_failed_response,
 }
+
+get_deliveries_batch_responses = {
+    **internal_error_response,
+    **check_permission_error_response,
+    **check_permission_failed_response,
+}
+
+stream_deliveries_responses = {
+    **delivery_stream_response,
+    **internal_error_response,
+    **check_permission_error_response,
+    **check_permission_failed_response,
+}
+
+get_delivery_details_responses = {
+    **internal_error_response,
+    **check_permission_error_response,
+    **check_permission_failed_response,
+    **delivery_not_found_response,
+}
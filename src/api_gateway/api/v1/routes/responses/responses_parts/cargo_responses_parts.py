@@ -1,6 +1,7 @@
 from api.v1.routes.responses.responses_parts.content.error_contents import error_content
 from api.v1.routes.responses.responses_parts.content.cargo_contents import (
     cargo_model_content,
+    cargo_model_ndjson_content,
 )
 
 
@@ -9,3 +10,7 @@ cargo_not_found_response = {404: {**error_content, "description": "Cargo not fou
 cargo_created_response = {
     201: {**cargo_model_content, "description": "Cargo successfully created"}
 }
+
+cargo_stream_response = {
+    200: {**cargo_model_ndjson_content, "description": "Cargos stream, one JSON object per line"}
+}
@@ -4,4 +4,12 @@ cargo_model_content = {"content" :  {"application/json": {
                             }
                         }
                       }
-}
\ No newline at end of file
+}
+
+cargo_model_ndjson_content = {"content" :  {"application/x-ndjson": {
+                        "schema": {
+                            "$ref": "#/components/schemas/CargoModel"
+                            }
+                        }
+                      }
+}
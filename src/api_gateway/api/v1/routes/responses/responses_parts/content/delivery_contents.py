@@ -4,4 +4,12 @@ delivery_model_content = {"content" :  {"application/json": {
                             }
                         }
                       }
-}
\ No newline at end of file
+}
+
+delivery_model_ndjson_content = {"content" :  {"application/x-ndjson": {
+                        "schema": {
+                            "$ref": "#/components/schemas/DeliveryModel"
+                            }
+                        }
+                      }
+}
@@ -1,6 +1,7 @@
 from api.v1.routes.responses.responses_parts.content.error_contents import error_content
 from api.v1.routes.responses.responses_parts.content.delivery_contents import (
     delivery_model_content,
+    delivery_model_ndjson_content,
 )
 
 
@@ -9,3 +10,7 @@ delivery_not_found_response = {404: {**error_content, "description": "Delivery n
 delivery_created_response = {
     201: {**delivery_model_content, "description": "Delivery successfully created"}
 }
+
+delivery_stream_response = {
+    200: {**delivery_model_ndjson_content, "description": "Deliveries stream, one JSON object per line"}
+}
@@ -3,3 +3,7 @@ from api.v1.routes.responses.responses_parts.content.error_contents import error
 internal_error_response = {
     500: {**error_content, "description": "Internal server error"}
 }
+
+not_modified_response = {
+    304: {"description": "Not modified since the version known to the client"}
+}
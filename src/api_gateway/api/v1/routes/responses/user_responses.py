@@ -1,5 +1,6 @@
 from api.v1.routes.responses.responses_parts.server_responses_parts import (
     internal_error_response,
+    not_modified_response,
 )
 from api.v1.routes.responses.responses_parts.account_responses_parts import (
     check_permission_error_response,
@@ -12,6 +13,7 @@ from api.v1.routes.responses.responses_parts.user_responses_parts import (
 )
 
 get_user_responses = {
+    **not_modified_response,
     **check_permission_error_response,
     **check_permission_failed_response,
     **internal_error_response,
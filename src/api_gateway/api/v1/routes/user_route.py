@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi import APIRouter, Body, Depends, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 from pydantic import UUID4
-from lib.http_tools import make_http_error
+from lib.http_tools import get_known_versions, make_http_error, make_validators
+from lib.proto_json import FAST_JSON_RESPONSES, ProtoJSONResponse
 from api.v1.routes.account_route import check_permission
+from lib.concurrency_limiter import BULK, request_priority
 from api.v1.models.user_models import BriefUserModel, CreateUserModel, UpdateUserModel, UserModel
 
 from grpc_build.user_service_pb2_grpc import UserServiceStub
@@ -49,13 +51,21 @@ router = APIRouter(prefix="/api/v1/user", tags=["user"])
     response_model_exclude_unset=True,
     responses=get_user_responses,
 )
-async def get_user(user_id: UUID4):
+async def get_user(user_id: UUID4, request: Request, response: Response):
     user_stub: UserServiceStub = app.state.user_stub
     resp: GetUserDataResponse = await user_stub.GetUserData(
-        GetUserDataRequest(user_id=str(user_id))
+        GetUserDataRequest(
+            user_id=str(user_id), **get_known_versions(request)
+        )
     )
 
-    if resp.code == 200:
+    if resp.code == 304:
+        return Response(status_code=304, headers=make_validators(resp))
+    elif resp.code == 200:
+        validators = make_validators(resp.user_data)
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.user_data, headers=validators)
+        response.headers.update(validators)
         return UserModel.from_grpc_message(resp.user_data)
     else:
         make_http_error(resp)
@@ -76,6 +86,8 @@ async def get_user_by_username(username: str = Query(...)):
     )
 
     if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.user_data)
         return UserModel.from_grpc_message(resp.user_data)
     else:
         make_http_error(resp)
@@ -85,7 +97,7 @@ async def get_user_by_username(username: str = Query(...)):
 @router.post(
     "/search_users",
     response_model=list[BriefUserModel],
-    dependencies=[check_permission("READ_USER")],
+    dependencies=[request_priority(BULK), check_permission("READ_USER")],
     response_model_exclude_unset=True,
     responses=search_users_responses,
 )
@@ -100,6 +112,8 @@ async def search_users_by_first_name_last_name(
     )
 
     if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.users.arr)
         return [BriefUserModel.from_grpc_message(user) for user in resp.users.arr]
     else:
         make_http_error(resp)
@@ -121,6 +135,8 @@ async def create_user(user: CreateUserModel):
     )
 
     if resp.code == 201:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.user_data, status_code=201)
         return JSONResponse(
             status_code=201,
             content=UserModel.from_grpc_message(resp.user_data).model_dump(),
@@ -144,6 +160,8 @@ async def update_user(user_id: UUID4, updating_user: UpdateUserModel):
     )
 
     if resp.code == 200:
+        if FAST_JSON_RESPONSES:
+            return ProtoJSONResponse(resp.user_data)
         return UserModel.from_grpc_message(resp.user_data)
     else:
         make_http_error(resp)
@@ -0,0 +1,78 @@
+# Measures tail latency of point reads with and without hedging.
+# Replicas are simulated: every copy of a call answers in about BENCH_LATENCY seconds,
+# BENCH_SLOW_RATE of copies take BENCH_SLOW_LATENCY, like a replica in a GC pause.
+# Nothing but the policy code has to run.
+# Run from the api_gateway folder after generating grpc_build (see Dockerfile):
+# python -m benchmarks.bench_hedging
+import asyncio
+import os
+import random
+import time
+
+from lib.hedging import HedgingPolicy
+
+
+CALLS = int(os.environ.get("BENCH_CALLS", "5000"))
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", "20"))
+LATENCY = float(os.environ.get("BENCH_LATENCY", "0.002"))
+SLOW_RATE = float(os.environ.get("BENCH_SLOW_RATE", "0.02"))
+SLOW_LATENCY = float(os.environ.get("BENCH_SLOW_LATENCY", "0.2"))
+
+METHOD = "/user.UserService/GetUserData"
+
+
+class FakeMultiCallable:
+    method = METHOD
+
+
+async def call_replica(multicallable, request, kwargs):
+    if random.random() < SLOW_RATE:
+        await asyncio.sleep(SLOW_LATENCY)
+    else:
+        await asyncio.sleep(LATENCY * random.uniform(0.5, 1.5))
+
+
+async def run(policy: HedgingPolicy | None) -> list[float]:
+    multicallable = FakeMultiCallable()
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one_call():
+        async with semaphore:
+            start = time.monotonic()
+            if policy is None:
+                await call_replica(multicallable, None, {})
+            else:
+                await policy(multicallable, None, {}, call_replica)
+            latencies.append(time.monotonic() - start)
+
+    await asyncio.gather(*(one_call() for _ in range(CALLS)))
+    return latencies
+
+
+def report(name: str, latencies: list[float]):
+    ordered = sorted(latencies)
+
+    def percentile(value: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * value))] * 1000
+
+    print(
+        f"{name}: p50 {percentile(0.5):.1f} ms, p95 {percentile(0.95):.1f} ms, "
+        f"p99 {percentile(0.99):.1f} ms, max {ordered[-1] * 1000:.1f} ms"
+    )
+
+
+async def main():
+    report("without hedging", await run(None))
+
+    policy = HedgingPolicy("bench", methods={METHOD})
+    report("with hedging", await run(policy))
+    stats = policy.stats()
+    print(
+        f"hedge rate {stats["hedge_rate"]:.3f}, win rate {stats["win_rate"]:.3f}, "
+        f"delay {stats["delays"].get(METHOD, 0) * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
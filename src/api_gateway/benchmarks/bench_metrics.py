@@ -0,0 +1,102 @@
+# Measures the cost of request and gRPC call metrics on the hot path.
+# Run from the api_gateway folder after generating grpc_build (see Dockerfile):
+# python -m benchmarks.bench_metrics
+import asyncio
+import time
+
+from fastapi import FastAPI, Response
+
+from lib.metrics import MetricsMiddleware, MetricsPolicy
+
+
+CALLS = 20000
+
+
+def make_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/user/{user_id}")
+    async def get_user(user_id: str):
+        return Response(b'{"id":"1"}', media_type="application/json")
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def call_app(app, calls: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/user/1",
+            "raw_path": b"/api/v1/user/1",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [],
+            "server": ("localhost", 8000),
+            "client": ("127.0.0.1", 12345),
+            "app": app,
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+class FakeMultiCallable:
+    method = "/user.UserService/GetUserData"
+
+
+async def call_policy(policy, calls: int) -> float:
+    async def call_next(multicallable, request, kwargs):
+        return None
+
+    multicallable = FakeMultiCallable()
+    start = time.perf_counter()
+    for _ in range(calls):
+        if policy is None:
+            await call_next(multicallable, None, {})
+        else:
+            await policy(multicallable, None, {}, call_next)
+    return time.perf_counter() - start
+
+
+def report(name: str, base: float, measured: float):
+    print(
+        f"{name}: without {base / CALLS * 1e6:.2f} us, "
+        f"with {measured / CALLS * 1e6:.2f} us, "
+        f"overhead {(measured - base) / CALLS * 1e6:.2f} us per call"
+    )
+
+
+async def main():
+    plain_app, metrics_app = make_app(False), make_app(True)
+    # Warm up routing caches and metric children
+    await call_app(plain_app, 100)
+    await call_app(metrics_app, 100)
+    report(
+        "http request",
+        await call_app(plain_app, CALLS),
+        await call_app(metrics_app, CALLS),
+    )
+
+    policy = MetricsPolicy()
+    await call_policy(policy, 100)
+    report(
+        "grpc call",
+        await call_policy(None, CALLS),
+        await call_policy(policy, CALLS),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
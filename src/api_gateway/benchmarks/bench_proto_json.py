@@ -0,0 +1,87 @@
+# Compares the pydantic response path with the direct protobuf to JSON encoder.
+# Run from the api_gateway folder after generating grpc_build (see Dockerfile):
+# python -m benchmarks.bench_proto_json
+import json
+import timeit
+import uuid
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from api.v1.models.user_models import BriefUserModel, UserModel
+from grpc_build.user_service_pb2 import BriefUserArray, BriefUserData, GroupData, UserData
+from lib.proto_json import encode_messages
+
+
+ROWS = 1000
+ROUNDS = 20
+
+
+def make_brief_users():
+    return BriefUserArray(
+        arr=[
+            BriefUserData(
+                id=str(uuid.uuid4()),
+                username=f"user_{ind}",
+                first_name="Ivan",
+                second_name="Ivanov",
+            )
+            for ind in range(ROWS)
+        ]
+    ).arr
+
+
+def make_user():
+    return UserData(
+        id=str(uuid.uuid4()),
+        username="user",
+        first_name="Ivan",
+        second_name="Ivanov",
+        email="ivan@example.com",
+        groups=[GroupData(id=str(uuid.uuid4()), name="Admin")],
+    )
+
+
+def pydantic_path(messages, model, adapter: TypeAdapter):
+    # from_grpc_message, response_model validation and JSONResponse rendering
+    models = [model.from_grpc_message(message) for message in messages]
+    validated = adapter.validate_python(models)
+    return json.dumps(
+        jsonable_encoder(validated, exclude_unset=True),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def report(name: str, pydantic_time: float, proto_time: float):
+    print(
+        f"{name}: pydantic {pydantic_time / ROUNDS * 1000:.3f} ms, "
+        f"proto json {proto_time / ROUNDS * 1000:.3f} ms, "
+        f"speedup x{pydantic_time / proto_time:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    brief_users = make_brief_users()
+    brief_adapter = TypeAdapter(list[BriefUserModel])
+    report(
+        f"search_users ({ROWS} rows)",
+        timeit.timeit(
+            lambda: pydantic_path(brief_users, BriefUserModel, brief_adapter),
+            number=ROUNDS,
+        ),
+        timeit.timeit(lambda: encode_messages(brief_users), number=ROUNDS),
+    )
+
+    user = make_user()
+    user_adapter = TypeAdapter(list[UserModel])
+    report(
+        "get_user (1 row x 1000 calls)",
+        timeit.timeit(
+            lambda: [pydantic_path([user], UserModel, user_adapter) for _ in range(ROWS)],
+            number=ROUNDS,
+        ),
+        timeit.timeit(
+            lambda: [encode_messages(user) for _ in range(ROWS)], number=ROUNDS
+        ),
+    )
@@ -0,0 +1,104 @@
+# Measures gateway throughput for different numbers of launcher workers.
+# Requests are rejected by the permission check before any backend call,
+# so only gateway work is measured and no services have to run.
+# Run from the api_gateway folder after generating grpc_build (see Dockerfile):
+# python -m benchmarks.bench_workers 1 2 4
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("BENCH_PORT", "8765"))
+DURATION = float(os.environ.get("BENCH_DURATION", "10"))
+CLIENT_PROCESSES = int(os.environ.get("BENCH_CLIENT_PROCESSES", os.cpu_count() or 1))
+CONNECTIONS = int(os.environ.get("BENCH_CONNECTIONS", "64"))
+
+REQUEST = (
+    f"GET /api/v1/user/3fa85f64-5717-4562-b3fc-2c963f66afa6 HTTP/1.1\r\n"
+    f"Host: {HOST}\r\n\r\n"
+).encode()
+
+
+async def run_connection(deadline: float) -> int:
+    reader, writer = await asyncio.open_connection(HOST, PORT)
+    responses = 0
+    try:
+        while time.monotonic() < deadline:
+            writer.write(REQUEST)
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in headers.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            responses += 1
+    finally:
+        writer.close()
+    return responses
+
+
+def run_client(connections: int) -> int:
+    async def run():
+        deadline = time.monotonic() + DURATION
+        results = await asyncio.gather(
+            *(run_connection(deadline) for _ in range(connections))
+        )
+        return sum(results)
+
+    return asyncio.run(run())
+
+
+def wait_for_port(timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((HOST, PORT), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError("Gateway did not start")
+
+
+def measure(workers: int) -> float:
+    launcher = subprocess.Popen(
+        [
+            sys.executable,
+            "launcher.py",
+            "--host", HOST,
+            "--port", str(PORT),
+            "--workers", str(workers),
+            "--log-level", "warning",
+        ]
+    )
+    try:
+        wait_for_port()
+        # Every worker has to finish its lifespan before it takes connections
+        time.sleep(1 + workers * 0.2)
+        with multiprocessing.Pool(CLIENT_PROCESSES) as pool:
+            per_process = max(1, CONNECTIONS // CLIENT_PROCESSES)
+            responses = sum(pool.map(run_client, [per_process] * CLIENT_PROCESSES))
+        return responses / DURATION
+    finally:
+        launcher.send_signal(signal.SIGTERM)
+        launcher.wait()
+
+
+def main():
+    worker_counts = [int(value) for value in sys.argv[1:]] or [1, 2, 4]
+    print(f"{os.cpu_count()} cpus, {CLIENT_PROCESSES} client processes, {CONNECTIONS} connections")
+    base = None
+    for workers in worker_counts:
+        throughput = measure(workers)
+        base = base or throughput
+        print(f"{workers} workers: {throughput:.0f} requests/s, x{throughput / base:.2f}")
+
+
+if __name__ == "__main__":
+    main()
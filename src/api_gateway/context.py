@@ -1,22 +1,61 @@
+import asyncio
 from contextlib import asynccontextmanager
-import os
 from fastapi import FastAPI
-import grpc
 from grpc_build.payment_service_pb2_grpc import PaymentServiceStub
 from grpc_build.delivery_service_pb2_grpc import DeliveryServiceStub
 from grpc_build.cargo_service_pb2_grpc import CargoServiceStub
 from grpc_build.user_service_pb2_grpc import UserServiceStub
 from grpc_build.account_service_pb2_grpc import AccountServiceStub
+from lib.channel_pool import ChannelPool
+from lib.circuit_breaker import CircuitBreakerPolicy
+from lib.concurrency_limiter import ConcurrencyLimitPolicy
+from lib.deadlines import DeadlinePolicy
+from lib.hedging import HedgingPolicy
+from lib.metrics import MetricsPolicy
+from lib.retries import RetryPolicy
+from lib.shared_state import get_shared_revocation_list, is_feeding_worker
+from lib.singleflight import CoalescingPolicy
+from lib.token_verifier import TokenVerifier
 
 # TODO Add secure channel
-async def get_channel(service_name: str, default_port: int):
-    return grpc.aio.insecure_channel(
-        f"{os.environ.get(f"{service_name}_SERVICE_HOST", "localhost")}:{os.environ.get(f"{service_name}_SERVICE_PORT", default_port)}"
-    )
+async def get_channel(service_name: str, default_port: int, *policies) -> ChannelPool:
+    channel_pool = ChannelPool.from_env(service_name, default_port)
+    for policy in policies:
+        channel_pool.add_policy(policy)
+    await channel_pool.start()
+    return channel_pool
+
+
+def get_concurrency_limit(app: FastAPI, backend: str) -> ConcurrencyLimitPolicy:
+    app.state.concurrency_limits[backend] = ConcurrencyLimitPolicy(backend)
+    return app.state.concurrency_limits[backend]
+
+
+def get_circuit_breaker(app: FastAPI, backend: str) -> CircuitBreakerPolicy:
+    app.state.circuit_breakers[backend] = CircuitBreakerPolicy(backend)
+    return app.state.circuit_breakers[backend]
+
+
+def get_hedging_policy(app: FastAPI, backend: str) -> HedgingPolicy:
+    app.state.hedging[backend] = HedgingPolicy(backend)
+    return app.state.hedging[backend]
+
+
+def get_retry_policy(app: FastAPI, backend: str) -> RetryPolicy:
+    app.state.retries[backend] = RetryPolicy(backend)
+    return app.state.retries[backend]
 
 
 async def connect_to_grpc_account(app: FastAPI):
-    app.state.account_grpc_channel = await get_channel("ACCOUNT", 50051)
+    app.state.account_grpc_channel = await get_channel(
+        "ACCOUNT",
+        50051,
+        get_retry_policy(app, "account"),
+        app.state.deadlines,
+        get_circuit_breaker(app, "account"),
+        get_concurrency_limit(app, "account"),
+        app.state.grpc_metrics,
+    )
     app.state.account_stub = AccountServiceStub(app.state.account_grpc_channel)
 
 
@@ -24,8 +63,37 @@ async def disconnect_from_grpc_account(app: FastAPI):
     await app.state.account_grpc_channel.close()
 
 
+async def start_token_verifier(app: FastAPI):
+    app.state.token_verifier = TokenVerifier.from_env(get_shared_revocation_list())
+    app.state.revoked_tokens_task = None
+    # Under the launcher one worker keeps the shared revocation list for all of them
+    if app.state.token_verifier is not None and is_feeding_worker():
+        app.state.revoked_tokens_task = asyncio.create_task(
+            app.state.token_verifier.watch_revoked_tokens(app.state.account_stub)
+        )
+
+
+async def stop_token_verifier(app: FastAPI):
+    if app.state.revoked_tokens_task is not None:
+        app.state.revoked_tokens_task.cancel()
+        try:
+            await app.state.revoked_tokens_task
+        except asyncio.CancelledError:
+            pass
+
+
 async def connect_to_grpc_user(app: FastAPI):
-    app.state.user_grpc_channel = await get_channel("USER", 50052)
+    app.state.user_grpc_channel = await get_channel(
+        "USER",
+        50052,
+        get_retry_policy(app, "user"),
+        app.state.deadlines,
+        app.state.coalescing,
+        get_hedging_policy(app, "user"),
+        get_circuit_breaker(app, "user"),
+        get_concurrency_limit(app, "user"),
+        app.state.grpc_metrics,
+    )
     app.state.user_stub = UserServiceStub(app.state.user_grpc_channel)
 
 
@@ -34,7 +102,17 @@ async def disconnect_from_grpc_user(app: FastAPI):
 
 
 async def connect_to_grpc_cargo(app: FastAPI):
-    app.state.cargo_grpc_channel = await get_channel("CARGO", 50053)
+    app.state.cargo_grpc_channel = await get_channel(
+        "CARGO",
+        50053,
+        get_retry_policy(app, "cargo"),
+        app.state.deadlines,
+        app.state.coalescing,
+        get_hedging_policy(app, "cargo"),
+        get_circuit_breaker(app, "cargo"),
+        get_concurrency_limit(app, "cargo"),
+        app.state.grpc_metrics,
+    )
     app.state.cargo_stub = CargoServiceStub(app.state.cargo_grpc_channel)
 
 
@@ -43,7 +121,17 @@ async def disconnect_from_grpc_cargo(app: FastAPI):
 
 
 async def connect_to_grpc_delivery(app: FastAPI):
-    app.state.delivery_grpc_channel = await get_channel("DELIVERY", 50054)
+    app.state.delivery_grpc_channel = await get_channel(
+        "DELIVERY",
+        50054,
+        get_retry_policy(app, "delivery"),
+        app.state.deadlines,
+        app.state.coalescing,
+        get_hedging_policy(app, "delivery"),
+        get_circuit_breaker(app, "delivery"),
+        get_concurrency_limit(app, "delivery"),
+        app.state.grpc_metrics,
+    )
     app.state.delivery_stub = DeliveryServiceStub(app.state.delivery_grpc_channel)
 
 
@@ -52,7 +140,15 @@ async def disconnect_from_grpc_delivery(app: FastAPI):
 
 
 async def connect_to_grpc_payment(app: FastAPI):
-    app.state.payment_grpc_channel = await get_channel("PAYMENT", 50055)
+    app.state.payment_grpc_channel = await get_channel(
+        "PAYMENT",
+        50055,
+        get_retry_policy(app, "payment"),
+        app.state.deadlines,
+        get_circuit_breaker(app, "payment"),
+        get_concurrency_limit(app, "payment"),
+        app.state.grpc_metrics,
+    )
     app.state.payment_stub = PaymentServiceStub(app.state.payment_grpc_channel)
 
 async def disconnect_from_grpc_payment(app: FastAPI):
@@ -60,7 +156,22 @@ async def disconnect_from_grpc_payment(app: FastAPI):
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Idempotent reads are retried while the per backend retry budget allows it
+    app.state.retries = {}
+    # Remaining route budget becomes the deadline of every backend call
+    app.state.deadlines = DeadlinePolicy()
+    # Concurrent identical read calls share one backend call, permission checks stay per caller
+    app.state.coalescing = CoalescingPolicy()
+    # Slow point reads get a second copy sent to another replica, within a budget
+    app.state.hedging = {}
+    # Backends failing or slowing down past thresholds are failed fast until they recover
+    app.state.circuit_breakers = {}
+    # Per backend limits adapt to observed latency and shed calls beyond them
+    app.state.concurrency_limits = {}
+    # Added last, so it times every real backend call and not the coalesced waiters
+    app.state.grpc_metrics = MetricsPolicy()
     await connect_to_grpc_account(app)
+    await start_token_verifier(app)
     await connect_to_grpc_user(app)
     await connect_to_grpc_cargo(app)
     await connect_to_grpc_delivery(app)
@@ -70,6 +181,7 @@ async def lifespan(app: FastAPI):
     await disconnect_from_grpc_delivery(app)
     await disconnect_from_grpc_cargo(app)
     await disconnect_from_grpc_user(app)
+    await stop_token_verifier(app)
     await disconnect_from_grpc_account(app)
 
 
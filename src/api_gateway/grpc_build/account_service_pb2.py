@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: grpc_build/account_service.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'grpc_build/account_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n grpc_build/account_service.proto\x12\x07\x61\x63\x63ount\"\x1b\n\x19WatchRevokedTokensRequest\",\n\x10RevokedTokenData\x12\x0b\n\x03jti\x18\x01 \x01(\t\x12\x0b\n\x03\x65xp\x18\x02 \x01(\x03\"<\n\x12RevokedTokensArray\x12&\n\x03\x61rr\x18\x01 \x03(\x0b\x32\x19.account.RevokedTokenData\"%\n\rLogoutRequest\x12\x14\n\x0c\x61\x63\x63\x65ss_token\x18\x01 \x01(\t\"@\n\x0eLogoutResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x14\n\x07message\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_message\"1\n\x0b\x41uthRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"\'\n\x0eRefreshRequest\x12\x15\n\rrefresh_token\x18\x01 \x01(\t\"p\n\x0fRefreshResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12$\n\x06tokens\x18\x03 \x01(\x0b\x32\x12.account.TokenPairH\x00\x42\x16\n\x14RefreshResponseOneof\"8\n\tTokenPair\x12\x14\n\x0c\x61\x63\x63\x65ss_token\x18\x01 \x01(\t\x12\x15\n\rrefresh_token\x18\x02 \x01(\t\"j\n\x0c\x41uthResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12$\n\x06tokens\x18\x03 \x01(\x0b\x32\x12.account.TokenPairH\x00\x42\x13\n\x11\x41uthResponseOneof\"C\n\x17\x43heckPermissionsRequest\x12\x14\n\x0c\x61\x63\x63\x65ss_token\x18\x01 \x01(\t\x12\x12\n\npermission\x18\x02 \x01(\t\"o\n\x18\x43heckPermissionsResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12\x11\n\x07user_id\x18\x03 \x01(\tH\x00\x42\x1f\n\x1d\x43heckPermissionsResponseOneOf\"{\n\x1c\x43heckPermissionsBatchRequest\x12\x14\n\x0c\x61\x63\x63\x65ss_token\x18\x01 \x01(\t\x12\x13\n\x0bpermissions\x18\x02 \x03(\t\x12\x30\n\x06\x63hecks\x18\x03 \x03(\x0b\x32 .account.CheckPermissionsRequest\"S\n\x1d\x43heckPermissionsBatchResponse\x12\x32\n\x07results\x18\x01 \x03(\x0b\x32!.account.CheckPermissionsResponse2\xd8\x03\n\x0e\x41\x63\x63ountService\x12\x33\n\x04\x41uth\x12\x14.account.AuthRequest\x1a\x15.account.AuthResponse\x12W\n\x10\x43heckPermissions\x12 .account.CheckPermissionsRequest\x1a!.account.CheckPermissionsResponse\x12\x66\n\x15\x43heckPermissionsBatch\x12%.account.CheckPermissionsBatchRequest\x1a&.account.CheckPermissionsBatchResponse\x12<\n\x07Refresh\x12\x17.account.RefreshRequest\x1a\x18.account.RefreshResponse\x12\x39\n\x06Logout\x12\x16.account.LogoutRequest\x1a\x17.account.LogoutResponse\x12W\n\x12WatchRevokedTokens\x12\".account.WatchRevokedTokensRequest\x1a\x1b.account.RevokedTokensArray0\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_build.account_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_WATCHREVOKEDTOKENSREQUEST']._serialized_start=45
+  _globals['_WATCHREVOKEDTOKENSREQUEST']._serialized_end=72
+  _globals['_REVOKEDTOKENDATA']._serialized_start=74
+  _globals['_REVOKEDTOKENDATA']._serialized_end=118
+  _globals['_REVOKEDTOKENSARRAY']._serialized_start=120
+  _globals['_REVOKEDTOKENSARRAY']._serialized_end=180
+  _globals['_LOGOUTREQUEST']._serialized_start=182
+  _globals['_LOGOUTREQUEST']._serialized_end=219
+  _globals['_LOGOUTRESPONSE']._serialized_start=221
+  _globals['_LOGOUTRESPONSE']._serialized_end=285
+  _globals['_AUTHREQUEST']._serialized_start=287
+  _globals['_AUTHREQUEST']._serialized_end=336
+  _globals['_REFRESHREQUEST']._serialized_start=338
+  _globals['_REFRESHREQUEST']._serialized_end=377
+  _globals['_REFRESHRESPONSE']._serialized_start=379
+  _globals['_REFRESHRESPONSE']._serialized_end=491
+  _globals['_TOKENPAIR']._serialized_start=493
+  _globals['_TOKENPAIR']._serialized_end=549
+  _globals['_AUTHRESPONSE']._serialized_start=551
+  _globals['_AUTHRESPONSE']._serialized_end=657
+  _globals['_CHECKPERMISSIONSREQUEST']._serialized_start=659
+  _globals['_CHECKPERMISSIONSREQUEST']._serialized_end=726
+  _globals['_CHECKPERMISSIONSRESPONSE']._serialized_start=728
+  _globals['_CHECKPERMISSIONSRESPONSE']._serialized_end=839
+  _globals['_CHECKPERMISSIONSBATCHREQUEST']._serialized_start=841
+  _globals['_CHECKPERMISSIONSBATCHREQUEST']._serialized_end=964
+  _globals['_CHECKPERMISSIONSBATCHRESPONSE']._serialized_start=966
+  _globals['_CHECKPERMISSIONSBATCHRESPONSE']._serialized_end=1049
+  _globals['_ACCOUNTSERVICE']._serialized_start=1052
+  _globals['_ACCOUNTSERVICE']._serialized_end=1524
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,115 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class WatchRevokedTokensRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class RevokedTokenData(_message.Message):
+    __slots__ = ("jti", "exp")
+    JTI_FIELD_NUMBER: _ClassVar[int]
+    EXP_FIELD_NUMBER: _ClassVar[int]
+    jti: str
+    exp: int
+    def __init__(self, jti: _Optional[str] = ..., exp: _Optional[int] = ...) -> None: ...
+
+class RevokedTokensArray(_message.Message):
+    __slots__ = ("arr",)
+    ARR_FIELD_NUMBER: _ClassVar[int]
+    arr: _containers.RepeatedCompositeFieldContainer[RevokedTokenData]
+    def __init__(self, arr: _Optional[_Iterable[_Union[RevokedTokenData, _Mapping]]] = ...) -> None: ...
+
+class LogoutRequest(_message.Message):
+    __slots__ = ("access_token",)
+    ACCESS_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    access_token: str
+    def __init__(self, access_token: _Optional[str] = ...) -> None: ...
+
+class LogoutResponse(_message.Message):
+    __slots__ = ("code", "message")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ...) -> None: ...
+
+class AuthRequest(_message.Message):
+    __slots__ = ("username", "password")
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    PASSWORD_FIELD_NUMBER: _ClassVar[int]
+    username: str
+    password: str
+    def __init__(self, username: _Optional[str] = ..., password: _Optional[str] = ...) -> None: ...
+
+class RefreshRequest(_message.Message):
+    __slots__ = ("refresh_token",)
+    REFRESH_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    refresh_token: str
+    def __init__(self, refresh_token: _Optional[str] = ...) -> None: ...
+
+class RefreshResponse(_message.Message):
+    __slots__ = ("code", "message", "tokens")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    TOKENS_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    tokens: TokenPair
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., tokens: _Optional[_Union[TokenPair, _Mapping]] = ...) -> None: ...
+
+class TokenPair(_message.Message):
+    __slots__ = ("access_token", "refresh_token")
+    ACCESS_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    REFRESH_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    access_token: str
+    refresh_token: str
+    def __init__(self, access_token: _Optional[str] = ..., refresh_token: _Optional[str] = ...) -> None: ...
+
+class AuthResponse(_message.Message):
+    __slots__ = ("code", "message", "tokens")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    TOKENS_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    tokens: TokenPair
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., tokens: _Optional[_Union[TokenPair, _Mapping]] = ...) -> None: ...
+
+class CheckPermissionsRequest(_message.Message):
+    __slots__ = ("access_token", "permission")
+    ACCESS_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    PERMISSION_FIELD_NUMBER: _ClassVar[int]
+    access_token: str
+    permission: str
+    def __init__(self, access_token: _Optional[str] = ..., permission: _Optional[str] = ...) -> None: ...
+
+class CheckPermissionsResponse(_message.Message):
+    __slots__ = ("code", "message", "user_id")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    user_id: str
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., user_id: _Optional[str] = ...) -> None: ...
+
+class CheckPermissionsBatchRequest(_message.Message):
+    __slots__ = ("access_token", "permissions", "checks")
+    ACCESS_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    PERMISSIONS_FIELD_NUMBER: _ClassVar[int]
+    CHECKS_FIELD_NUMBER: _ClassVar[int]
+    access_token: str
+    permissions: _containers.RepeatedScalarFieldContainer[str]
+    checks: _containers.RepeatedCompositeFieldContainer[CheckPermissionsRequest]
+    def __init__(self, access_token: _Optional[str] = ..., permissions: _Optional[_Iterable[str]] = ..., checks: _Optional[_Iterable[_Union[CheckPermissionsRequest, _Mapping]]] = ...) -> None: ...
+
+class CheckPermissionsBatchResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[CheckPermissionsResponse]
+    def __init__(self, results: _Optional[_Iterable[_Union[CheckPermissionsResponse, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,312 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from grpc_build import account_service_pb2 as grpc__build_dot_account__service__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in grpc_build/account_service_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class AccountServiceStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Auth = channel.unary_unary(
+                '/account.AccountService/Auth',
+                request_serializer=grpc__build_dot_account__service__pb2.AuthRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_account__service__pb2.AuthResponse.FromString,
+                _registered_method=True)
+        self.CheckPermissions = channel.unary_unary(
+                '/account.AccountService/CheckPermissions',
+                request_serializer=grpc__build_dot_account__service__pb2.CheckPermissionsRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_account__service__pb2.CheckPermissionsResponse.FromString,
+                _registered_method=True)
+        self.CheckPermissionsBatch = channel.unary_unary(
+                '/account.AccountService/CheckPermissionsBatch',
+                request_serializer=grpc__build_dot_account__service__pb2.CheckPermissionsBatchRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_account__service__pb2.CheckPermissionsBatchResponse.FromString,
+                _registered_method=True)
+        self.Refresh = channel.unary_unary(
+                '/account.AccountService/Refresh',
+                request_serializer=grpc__build_dot_account__service__pb2.RefreshRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_account__service__pb2.RefreshResponse.FromString,
+                _registered_method=True)
+        self.Logout = channel.unary_unary(
+                '/account.AccountService/Logout',
+                request_serializer=grpc__build_dot_account__service__pb2.LogoutRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_account__service__pb2.LogoutResponse.FromString,
+                _registered_method=True)
+        self.WatchRevokedTokens = channel.unary_stream(
+                '/account.AccountService/WatchRevokedTokens',
+                request_serializer=grpc__build_dot_account__service__pb2.WatchRevokedTokensRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_account__service__pb2.RevokedTokensArray.FromString,
+                _registered_method=True)
+
+
+class AccountServiceServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def Auth(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CheckPermissions(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CheckPermissionsBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Refresh(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Logout(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchRevokedTokens(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_AccountServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Auth': grpc.unary_unary_rpc_method_handler(
+                    servicer.Auth,
+                    request_deserializer=grpc__build_dot_account__service__pb2.AuthRequest.FromString,
+                    response_serializer=grpc__build_dot_account__service__pb2.AuthResponse.SerializeToString,
+            ),
+            'CheckPermissions': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckPermissions,
+                    request_deserializer=grpc__build_dot_account__service__pb2.CheckPermissionsRequest.FromString,
+                    response_serializer=grpc__build_dot_account__service__pb2.CheckPermissionsResponse.SerializeToString,
+            ),
+            'CheckPermissionsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckPermissionsBatch,
+                    request_deserializer=grpc__build_dot_account__service__pb2.CheckPermissionsBatchRequest.FromString,
+                    response_serializer=grpc__build_dot_account__service__pb2.CheckPermissionsBatchResponse.SerializeToString,
+            ),
+            'Refresh': grpc.unary_unary_rpc_method_handler(
+                    servicer.Refresh,
+                    request_deserializer=grpc__build_dot_account__service__pb2.RefreshRequest.FromString,
+                    response_serializer=grpc__build_dot_account__service__pb2.RefreshResponse.SerializeToString,
+            ),
+            'Logout': grpc.unary_unary_rpc_method_handler(
+                    servicer.Logout,
+                    request_deserializer=grpc__build_dot_account__service__pb2.LogoutRequest.FromString,
+                    response_serializer=grpc__build_dot_account__service__pb2.LogoutResponse.SerializeToString,
+            ),
+            'WatchRevokedTokens': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchRevokedTokens,
+                    request_deserializer=grpc__build_dot_account__service__pb2.WatchRevokedTokensRequest.FromString,
+                    response_serializer=grpc__build_dot_account__service__pb2.RevokedTokensArray.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'account.AccountService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('account.AccountService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class AccountService:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def Auth(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/account.AccountService/Auth',
+            grpc__build_dot_account__service__pb2.AuthRequest.SerializeToString,
+            grpc__build_dot_account__service__pb2.AuthResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CheckPermissions(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/account.AccountService/CheckPermissions',
+            grpc__build_dot_account__service__pb2.CheckPermissionsRequest.SerializeToString,
+            grpc__build_dot_account__service__pb2.CheckPermissionsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CheckPermissionsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/account.AccountService/CheckPermissionsBatch',
+            grpc__build_dot_account__service__pb2.CheckPermissionsBatchRequest.SerializeToString,
+            grpc__build_dot_account__service__pb2.CheckPermissionsBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Refresh(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/account.AccountService/Refresh',
+            grpc__build_dot_account__service__pb2.RefreshRequest.SerializeToString,
+            grpc__build_dot_account__service__pb2.RefreshResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Logout(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/account.AccountService/Logout',
+            grpc__build_dot_account__service__pb2.LogoutRequest.SerializeToString,
+            grpc__build_dot_account__service__pb2.LogoutResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchRevokedTokens(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/account.AccountService/WatchRevokedTokens',
+            grpc__build_dot_account__service__pb2.WatchRevokedTokensRequest.SerializeToString,
+            grpc__build_dot_account__service__pb2.RevokedTokensArray.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: grpc_build/cargo_service.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'grpc_build/cargo_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1egrpc_build/cargo_service.proto\x12\x05\x63\x61rgo\x1a\x1fgoogle/protobuf/timestamp.proto\"\xa7\x01\n\x0fGetCargoRequest\x12\x10\n\x08\x63\x61rgo_id\x18\x01 \x01(\t\x12\x39\n\x10known_updated_at\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12\x32\n\x0eknown_versions\x18\x03 \x03(\x0b\x32\x1a.google.protobuf.TimestampB\x13\n\x11_known_updated_at\"\xb8\x01\n\x10GetCargoResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12&\n\ncargo_data\x18\x03 \x01(\x0b\x32\x10.cargo.CargoDataH\x00\x12\x33\n\nupdated_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x17\n\x15GetCargoResponseOneOfB\r\n\x0b_updated_at\"%\n\x10GetCargosRequest\x12\x11\n\tcargo_ids\x18\x01 \x03(\t\"r\n\x11GetCargosResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12\"\n\x05\x62\x61tch\x18\x03 \x01(\x0b\x32\x11.cargo.CargoBatchH\x00\x42\x18\n\x16GetCargosResponseOneOf\"B\n\nCargoBatch\x12\x1f\n\x05items\x18\x01 \x03(\x0b\x32\x10.cargo.CargoData\x12\x13\n\x0bmissing_ids\x18\x02 \x03(\t\"I\n\x12\x43reateCargoRequest\x12\x33\n\x13\x63reating_cargo_data\x18\x01 \x01(\x0b\x32\x16.cargo.CreateCargoData\"z\n\x13\x43reateCargoResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12&\n\ncargo_data\x18\x03 \x01(\x0b\x32\x10.cargo.CargoDataH\x00\x42\x1a\n\x18\x43reateCargoResponseOneOf\"5\n\x14GetUserCargosRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\t\"|\n\x15GetUserCargosResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12$\n\x03\x61rr\x18\x03 \x01(\x0b\x32\x15.cargo.CargoDataArrayH\x00\x42\x1c\n\x1aGetUserCargosResponseOneOf\"*\n\x17StreamUserCargosRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"\x82\x01\n\x18StreamUserCargosResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12$\n\x03\x61rr\x18\x03 \x01(\x0b\x32\x15.cargo.CargoDataArrayH\x00\x42\x1f\n\x1dStreamUserCargosResponseOneOf\"6\n\x0e\x43\x61rgoDataArray\x12$\n\ncargo_data\x18\x01 \x03(\x0b\x32\x10.cargo.CargoData\"g\n\x0f\x43reateCargoData\x12\r\n\x05title\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x12\n\ncreator_id\x18\x04 \x01(\t\x12\x0e\n\x06weight\x18\x05 \x01(\x05\".\n\x11\x42riefDeliveryData\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\"[\n\x12UpdateCargoRequest\x12\x10\n\x08\x63\x61rgo_id\x18\x01 \x01(\t\x12\x33\n\x13updating_cargo_data\x18\x02 \x01(\x0b\x32\x16.cargo.UpdateCargoData\"z\n\x13UpdateCargoResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12&\n\ncargo_data\x18\x03 \x01(\x0b\x32\x10.cargo.CargoDataH\x00\x42\x1a\n\x18UpdateCargoResponseOneOf\"\x9d\x01\n\x0fUpdateCargoData\x12\x12\n\x05title\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\x04type\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x17\n\ncreator_id\x18\x04 \x01(\tH\x03\x88\x01\x01\x42\x08\n\x06_titleB\x07\n\x05_typeB\x0e\n\x0c_descriptionB\r\n\x0b_creator_id\"\xf9\x01\n\tCargoData\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x12\n\ncreator_id\x18\x05 \x01(\t\x12\x34\n\rdelivery_data\x18\x06 \x01(\x0b\x32\x18.cargo.BriefDeliveryDataH\x00\x88\x01\x01\x12\x0e\n\x06weight\x18\x07 \x01(\x05\x12\x33\n\nupdated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x10\n\x0e_delivery_dataB\r\n\x0b_updated_at2\xba\x03\n\x0c\x43\x61rgoService\x12\x44\n\x0b\x43reateCargo\x12\x19.cargo.CreateCargoRequest\x1a\x1a.cargo.CreateCargoResponse\x12J\n\rGetUserCargos\x12\x1b.cargo.GetUserCargosRequest\x1a\x1c.cargo.GetUserCargosResponse\x12\x44\n\x0bUpdateCargo\x12\x19.cargo.UpdateCargoRequest\x1a\x1a.cargo.UpdateCargoResponse\x12;\n\x08GetCargo\x12\x16.cargo.GetCargoRequest\x1a\x17.cargo.GetCargoResponse\x12>\n\tGetCargos\x12\x17.cargo.GetCargosRequest\x1a\x18.cargo.GetCargosResponse\x12U\n\x10StreamUserCargos\x12\x1e.cargo.StreamUserCargosRequest\x1a\x1f.cargo.StreamUserCargosResponse0\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_build.cargo_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_GETCARGOREQUEST']._serialized_start=75
+  _globals['_GETCARGOREQUEST']._serialized_end=242
+  _globals['_GETCARGORESPONSE']._serialized_start=245
+  _globals['_GETCARGORESPONSE']._serialized_end=429
+  _globals['_GETCARGOSREQUEST']._serialized_start=431
+  _globals['_GETCARGOSREQUEST']._serialized_end=468
+  _globals['_GETCARGOSRESPONSE']._serialized_start=470
+  _globals['_GETCARGOSRESPONSE']._serialized_end=584
+  _globals['_CARGOBATCH']._serialized_start=586
+  _globals['_CARGOBATCH']._serialized_end=652
+  _globals['_CREATECARGOREQUEST']._serialized_start=654
+  _globals['_CREATECARGOREQUEST']._serialized_end=727
+  _globals['_CREATECARGORESPONSE']._serialized_start=729
+  _globals['_CREATECARGORESPONSE']._serialized_end=851
+  _globals['_GETUSERCARGOSREQUEST']._serialized_start=853
+  _globals['_GETUSERCARGOSREQUEST']._serialized_end=906
+  _globals['_GETUSERCARGOSRESPONSE']._serialized_start=908
+  _globals['_GETUSERCARGOSRESPONSE']._serialized_end=1032
+  _globals['_STREAMUSERCARGOSREQUEST']._serialized_start=1034
+  _globals['_STREAMUSERCARGOSREQUEST']._serialized_end=1076
+  _globals['_STREAMUSERCARGOSRESPONSE']._serialized_start=1079
+  _globals['_STREAMUSERCARGOSRESPONSE']._serialized_end=1209
+  _globals['_CARGODATAARRAY']._serialized_start=1211
+  _globals['_CARGODATAARRAY']._serialized_end=1265
+  _globals['_CREATECARGODATA']._serialized_start=1267
+  _globals['_CREATECARGODATA']._serialized_end=1370
+  _globals['_BRIEFDELIVERYDATA']._serialized_start=1372
+  _globals['_BRIEFDELIVERYDATA']._serialized_end=1418
+  _globals['_UPDATECARGOREQUEST']._serialized_start=1420
+  _globals['_UPDATECARGOREQUEST']._serialized_end=1511
+  _globals['_UPDATECARGORESPONSE']._serialized_start=1513
+  _globals['_UPDATECARGORESPONSE']._serialized_end=1635
+  _globals['_UPDATECARGODATA']._serialized_start=1638
+  _globals['_UPDATECARGODATA']._serialized_end=1795
+  _globals['_CARGODATA']._serialized_start=1798
+  _globals['_CARGODATA']._serialized_end=2047
+  _globals['_CARGOSERVICE']._serialized_start=2050
+  _globals['_CARGOSERVICE']._serialized_end=2492
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,184 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetCargoRequest(_message.Message):
+    __slots__ = ("cargo_id", "known_updated_at", "known_versions")
+    CARGO_ID_FIELD_NUMBER: _ClassVar[int]
+    KNOWN_UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    KNOWN_VERSIONS_FIELD_NUMBER: _ClassVar[int]
+    cargo_id: str
+    known_updated_at: _timestamp_pb2.Timestamp
+    known_versions: _containers.RepeatedCompositeFieldContainer[_timestamp_pb2.Timestamp]
+    def __init__(self, cargo_id: _Optional[str] = ..., known_updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., known_versions: _Optional[_Iterable[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]]] = ...) -> None: ...
+
+class GetCargoResponse(_message.Message):
+    __slots__ = ("code", "message", "cargo_data", "updated_at")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    CARGO_DATA_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    cargo_data: CargoData
+    updated_at: _timestamp_pb2.Timestamp
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., cargo_data: _Optional[_Union[CargoData, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class GetCargosRequest(_message.Message):
+    __slots__ = ("cargo_ids",)
+    CARGO_IDS_FIELD_NUMBER: _ClassVar[int]
+    cargo_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, cargo_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetCargosResponse(_message.Message):
+    __slots__ = ("code", "message", "batch")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    batch: CargoBatch
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., batch: _Optional[_Union[CargoBatch, _Mapping]] = ...) -> None: ...
+
+class CargoBatch(_message.Message):
+    __slots__ = ("items", "missing_ids")
+    ITEMS_FIELD_NUMBER: _ClassVar[int]
+    MISSING_IDS_FIELD_NUMBER: _ClassVar[int]
+    items: _containers.RepeatedCompositeFieldContainer[CargoData]
+    missing_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, items: _Optional[_Iterable[_Union[CargoData, _Mapping]]] = ..., missing_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class CreateCargoRequest(_message.Message):
+    __slots__ = ("creating_cargo_data",)
+    CREATING_CARGO_DATA_FIELD_NUMBER: _ClassVar[int]
+    creating_cargo_data: CreateCargoData
+    def __init__(self, creating_cargo_data: _Optional[_Union[CreateCargoData, _Mapping]] = ...) -> None: ...
+
+class CreateCargoResponse(_message.Message):
+    __slots__ = ("code", "message", "cargo_data")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    CARGO_DATA_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    cargo_data: CargoData
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., cargo_data: _Optional[_Union[CargoData, _Mapping]] = ...) -> None: ...
+
+class GetUserCargosRequest(_message.Message):
+    __slots__ = ("page", "user_id")
+    PAGE_FIELD_NUMBER: _ClassVar[int]
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    page: int
+    user_id: str
+    def __init__(self, page: _Optional[int] = ..., user_id: _Optional[str] = ...) -> None: ...
+
+class GetUserCargosResponse(_message.Message):
+    __slots__ = ("code", "message", "arr")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    ARR_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    arr: CargoDataArray
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., arr: _Optional[_Union[CargoDataArray, _Mapping]] = ...) -> None: ...
+
+class StreamUserCargosRequest(_message.Message):
+    __slots__ = ("user_id",)
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    def __init__(self, user_id: _Optional[str] = ...) -> None: ...
+
+class StreamUserCargosResponse(_message.Message):
+    __slots__ = ("code", "message", "arr")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    ARR_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    arr: CargoDataArray
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., arr: _Optional[_Union[CargoDataArray, _Mapping]] = ...) -> None: ...
+
+class CargoDataArray(_message.Message):
+    __slots__ = ("cargo_data",)
+    CARGO_DATA_FIELD_NUMBER: _ClassVar[int]
+    cargo_data: _containers.RepeatedCompositeFieldContainer[CargoData]
+    def __init__(self, cargo_data: _Optional[_Iterable[_Union[CargoData, _Mapping]]] = ...) -> None: ...
+
+class CreateCargoData(_message.Message):
+    __slots__ = ("title", "type", "description", "creator_id", "weight")
+    TITLE_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    CREATOR_ID_FIELD_NUMBER: _ClassVar[int]
+    WEIGHT_FIELD_NUMBER: _ClassVar[int]
+    title: str
+    type: str
+    description: str
+    creator_id: str
+    weight: int
+    def __init__(self, title: _Optional[str] = ..., type: _Optional[str] = ..., description: _Optional[str] = ..., creator_id: _Optional[str] = ..., weight: _Optional[int] = ...) -> None: ...
+
+class BriefDeliveryData(_message.Message):
+    __slots__ = ("id", "state")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    state: str
+    def __init__(self, id: _Optional[str] = ..., state: _Optional[str] = ...) -> None: ...
+
+class UpdateCargoRequest(_message.Message):
+    __slots__ = ("cargo_id", "updating_cargo_data")
+    CARGO_ID_FIELD_NUMBER: _ClassVar[int]
+    UPDATING_CARGO_DATA_FIELD_NUMBER: _ClassVar[int]
+    cargo_id: str
+    updating_cargo_data: UpdateCargoData
+    def __init__(self, cargo_id: _Optional[str] = ..., updating_cargo_data: _Optional[_Union[UpdateCargoData, _Mapping]] = ...) -> None: ...
+
+class UpdateCargoResponse(_message.Message):
+    __slots__ = ("code", "message", "cargo_data")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    CARGO_DATA_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    cargo_data: CargoData
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., cargo_data: _Optional[_Union[CargoData, _Mapping]] = ...) -> None: ...
+
+class UpdateCargoData(_message.Message):
+    __slots__ = ("title", "type", "description", "creator_id")
+    TITLE_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    CREATOR_ID_FIELD_NUMBER: _ClassVar[int]
+    title: str
+    type: str
+    description: str
+    creator_id: str
+    def __init__(self, title: _Optional[str] = ..., type: _Optional[str] = ..., description: _Optional[str] = ..., creator_id: _Optional[str] = ...) -> None: ...
+
+class CargoData(_message.Message):
+    __slots__ = ("id", "title", "type", "description", "creator_id", "delivery_data", "weight", "updated_at")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    TITLE_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    CREATOR_ID_FIELD_NUMBER: _ClassVar[int]
+    DELIVERY_DATA_FIELD_NUMBER: _ClassVar[int]
+    WEIGHT_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    title: str
+    type: str
+    description: str
+    creator_id: str
+    delivery_data: BriefDeliveryData
+    weight: int
+    updated_at: _timestamp_pb2.Timestamp
+    def __init__(self, id: _Optional[str] = ..., title: _Optional[str] = ..., type: _Optional[str] = ..., description: _Optional[str] = ..., creator_id: _Optional[str] = ..., delivery_data: _Optional[_Union[BriefDeliveryData, _Mapping]] = ..., weight: _Optional[int] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
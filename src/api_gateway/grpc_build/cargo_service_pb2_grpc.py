@@ -0,0 +1,312 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from grpc_build import cargo_service_pb2 as grpc__build_dot_cargo__service__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in grpc_build/cargo_service_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class CargoServiceStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateCargo = channel.unary_unary(
+                '/cargo.CargoService/CreateCargo',
+                request_serializer=grpc__build_dot_cargo__service__pb2.CreateCargoRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_cargo__service__pb2.CreateCargoResponse.FromString,
+                _registered_method=True)
+        self.GetUserCargos = channel.unary_unary(
+                '/cargo.CargoService/GetUserCargos',
+                request_serializer=grpc__build_dot_cargo__service__pb2.GetUserCargosRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_cargo__service__pb2.GetUserCargosResponse.FromString,
+                _registered_method=True)
+        self.UpdateCargo = channel.unary_unary(
+                '/cargo.CargoService/UpdateCargo',
+                request_serializer=grpc__build_dot_cargo__service__pb2.UpdateCargoRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_cargo__service__pb2.UpdateCargoResponse.FromString,
+                _registered_method=True)
+        self.GetCargo = channel.unary_unary(
+                '/cargo.CargoService/GetCargo',
+                request_serializer=grpc__build_dot_cargo__service__pb2.GetCargoRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_cargo__service__pb2.GetCargoResponse.FromString,
+                _registered_method=True)
+        self.GetCargos = channel.unary_unary(
+                '/cargo.CargoService/GetCargos',
+                request_serializer=grpc__build_dot_cargo__service__pb2.GetCargosRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_cargo__service__pb2.GetCargosResponse.FromString,
+                _registered_method=True)
+        self.StreamUserCargos = channel.unary_stream(
+                '/cargo.CargoService/StreamUserCargos',
+                request_serializer=grpc__build_dot_cargo__service__pb2.StreamUserCargosRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_cargo__service__pb2.StreamUserCargosResponse.FromString,
+                _registered_method=True)
+
+
+class CargoServiceServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def CreateCargo(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUserCargos(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateCargo(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCargo(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCargos(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamUserCargos(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_CargoServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateCargo': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateCargo,
+                    request_deserializer=grpc__build_dot_cargo__service__pb2.CreateCargoRequest.FromString,
+                    response_serializer=grpc__build_dot_cargo__service__pb2.CreateCargoResponse.SerializeToString,
+            ),
+            'GetUserCargos': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUserCargos,
+                    request_deserializer=grpc__build_dot_cargo__service__pb2.GetUserCargosRequest.FromString,
+                    response_serializer=grpc__build_dot_cargo__service__pb2.GetUserCargosResponse.SerializeToString,
+            ),
+            'UpdateCargo': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateCargo,
+                    request_deserializer=grpc__build_dot_cargo__service__pb2.UpdateCargoRequest.FromString,
+                    response_serializer=grpc__build_dot_cargo__service__pb2.UpdateCargoResponse.SerializeToString,
+            ),
+            'GetCargo': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCargo,
+                    request_deserializer=grpc__build_dot_cargo__service__pb2.GetCargoRequest.FromString,
+                    response_serializer=grpc__build_dot_cargo__service__pb2.GetCargoResponse.SerializeToString,
+            ),
+            'GetCargos': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCargos,
+                    request_deserializer=grpc__build_dot_cargo__service__pb2.GetCargosRequest.FromString,
+                    response_serializer=grpc__build_dot_cargo__service__pb2.GetCargosResponse.SerializeToString,
+            ),
+            'StreamUserCargos': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamUserCargos,
+                    request_deserializer=grpc__build_dot_cargo__service__pb2.StreamUserCargosRequest.FromString,
+                    response_serializer=grpc__build_dot_cargo__service__pb2.StreamUserCargosResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'cargo.CargoService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('cargo.CargoService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class CargoService:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def CreateCargo(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/cargo.CargoService/CreateCargo',
+            grpc__build_dot_cargo__service__pb2.CreateCargoRequest.SerializeToString,
+            grpc__build_dot_cargo__service__pb2.CreateCargoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetUserCargos(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/cargo.CargoService/GetUserCargos',
+            grpc__build_dot_cargo__service__pb2.GetUserCargosRequest.SerializeToString,
+            grpc__build_dot_cargo__service__pb2.GetUserCargosResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateCargo(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/cargo.CargoService/UpdateCargo',
+            grpc__build_dot_cargo__service__pb2.UpdateCargoRequest.SerializeToString,
+            grpc__build_dot_cargo__service__pb2.UpdateCargoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCargo(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/cargo.CargoService/GetCargo',
+            grpc__build_dot_cargo__service__pb2.GetCargoRequest.SerializeToString,
+            grpc__build_dot_cargo__service__pb2.GetCargoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCargos(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/cargo.CargoService/GetCargos',
+            grpc__build_dot_cargo__service__pb2.GetCargosRequest.SerializeToString,
+            grpc__build_dot_cargo__service__pb2.GetCargosResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamUserCargos(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/cargo.CargoService/StreamUserCargos',
+            grpc__build_dot_cargo__service__pb2.StreamUserCargosRequest.SerializeToString,
+            grpc__build_dot_cargo__service__pb2.StreamUserCargosResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
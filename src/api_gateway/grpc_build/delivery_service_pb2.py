@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: grpc_build/delivery_service.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'grpc_build/delivery_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!grpc_build/delivery_service.proto\x12\x08\x64\x65livery\x1a\x1fgoogle/protobuf/timestamp.proto\"\xad\x01\n\x12GetDeliveryRequest\x12\x13\n\x0b\x64\x65livery_id\x18\x01 \x01(\t\x12\x39\n\x10known_updated_at\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12\x32\n\x0eknown_versions\x18\x03 \x03(\x0b\x32\x1a.google.protobuf.TimestampB\x13\n\x11_known_updated_at\"\xc7\x01\n\x13GetDeliveryResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12/\n\rdelivery_data\x18\x03 \x01(\x0b\x32\x16.delivery.DeliveryDataH\x00\x12\x33\n\nupdated_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x1a\n\x18GetDeliveryResponseOneOfB\r\n\x0b_updated_at\",\n\x14GetDeliveriesRequest\x12\x14\n\x0c\x64\x65livery_ids\x18\x01 \x03(\t\"\x80\x01\n\x15GetDeliveriesResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12(\n\x05\x62\x61tch\x18\x03 \x01(\x0b\x32\x17.delivery.DeliveryBatchH\x00\x42\x1c\n\x1aGetDeliveriesResponseOneOf\"K\n\rDeliveryBatch\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.delivery.DeliveryData\x12\x13\n\x0bmissing_ids\x18\x02 \x03(\t\"f\n\x17SearchDeliveriesRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12=\n\x17searching_delivery_data\x18\x02 \x01(\x0b\x32\x1c.delivery.SearchDeliveryData\"\x88\x01\n\x18SearchDeliveriesResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12\x31\n\ndeliveries\x18\x03 \x01(\x0b\x32\x1b.delivery.DeliveryDataArrayH\x00\x42\x18\n\x16\x44\x65liveryDataArrayOneOf\"X\n\x17StreamDeliveriesRequest\x12=\n\x17searching_delivery_data\x18\x01 \x01(\x0b\x32\x1c.delivery.SearchDeliveryData\"\x8f\x01\n\x18StreamDeliveriesResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12\x31\n\ndeliveries\x18\x03 \x01(\x0b\x32\x1b.delivery.DeliveryDataArrayH\x00\x42\x1f\n\x1dStreamDeliveriesResponseOneOf\"U\n\x15\x43reateDeliveryRequest\x12<\n\x16\x63reating_delivery_data\x18\x01 \x01(\x0b\x32\x1c.delivery.CreateDeliveryData\"\x89\x01\n\x16\x43reateDeliveryResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12/\n\rdelivery_data\x18\x03 \x01(\x0b\x32\x16.delivery.DeliveryDataH\x00\x42\x1d\n\x1b\x43reateDeliveryResponseOneOf\"j\n\x15UpdateDeliveryRequest\x12\x13\n\x0b\x64\x65livery_id\x18\x01 \x01(\t\x12<\n\x16updating_delivery_data\x18\x02 \x01(\x0b\x32\x1c.delivery.UpdateDeliveryData\"\x89\x01\n\x16UpdateDeliveryResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12/\n\rdelivery_data\x18\x03 \x01(\x0b\x32\x16.delivery.DeliveryDataH\x00\x42\x1d\n\x1bUpdateDeliveryResponseOneOf\"8\n\x11\x44\x65liveryDataArray\x12#\n\x03\x61rr\x18\x01 \x03(\x0b\x32\x16.delivery.DeliveryData\"d\n\x12SearchDeliveryData\x12\x16\n\tsender_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0breceiver_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x0c\n\n_sender_idB\x0e\n\x0c_receiver_id\"\x8e\x01\n\x12UpdateDeliveryData\x12\x12\n\x05state\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08priority\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12\x1f\n\x12receive_address_id\x18\x03 \x01(\tH\x02\x88\x01\x01\x42\x08\n\x06_stateB\x0b\n\t_priorityB\x15\n\x13_receive_address_id\"\x90\x02\n\x0c\x44\x65liveryData\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x03 \x01(\x05\x12\x11\n\tsender_id\x18\x04 \x01(\t\x12\x13\n\x0breceiver_id\x18\x05 \x01(\t\x12\x10\n\x08\x63\x61rgo_id\x18\x06 \x01(\t\x12\x17\n\x0fsend_address_id\x18\x07 \x01(\t\x12\x1a\n\x12receive_address_id\x18\x08 \x01(\t\x12\x33\n\nupdated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12\x14\n\x07\x62ill_id\x18\n \x01(\tH\x01\x88\x01\x01\x42\r\n\x0b_updated_atB\n\n\x08_bill_id\"\x95\x01\n\x12\x43reateDeliveryData\x12\x10\n\x08priority\x18\x01 \x01(\x05\x12\x11\n\tsender_id\x18\x02 \x01(\t\x12\x13\n\x0breceiver_id\x18\x03 \x01(\t\x12\x10\n\x08\x63\x61rgo_id\x18\x04 \x01(\t\x12\x17\n\x0fsend_address_id\x18\x05 \x01(\t\x12\x1a\n\x12receive_address_id\x18\x06 \x01(\t2\x91\x04\n\x0f\x44\x65liveryService\x12S\n\x0e\x43reateDelivery\x12\x1f.delivery.CreateDeliveryRequest\x1a .delivery.CreateDeliveryResponse\x12S\n\x0eUpdateDelivery\x12\x1f.delivery.UpdateDeliveryRequest\x1a .delivery.UpdateDeliveryResponse\x12Y\n\x10SearchDeliveries\x12!.delivery.SearchDeliveriesRequest\x1a\".delivery.SearchDeliveriesResponse\x12J\n\x0bGetDelivery\x12\x1c.delivery.GetDeliveryRequest\x1a\x1d.delivery.GetDeliveryResponse\x12P\n\rGetDeliveries\x12\x1e.delivery.GetDeliveriesRequest\x1a\x1f.delivery.GetDeliveriesResponse\x12[\n\x10StreamDeliveries\x12!.delivery.StreamDeliveriesRequest\x1a\".delivery.StreamDeliveriesResponse0\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_build.delivery_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_GETDELIVERYREQUEST']._serialized_start=81
+  _globals['_GETDELIVERYREQUEST']._serialized_end=254
+  _globals['_GETDELIVERYRESPONSE']._serialized_start=257
+  _globals['_GETDELIVERYRESPONSE']._serialized_end=456
+  _globals['_GETDELIVERIESREQUEST']._serialized_start=458
+  _globals['_GETDELIVERIESREQUEST']._serialized_end=502
+  _globals['_GETDELIVERIESRESPONSE']._serialized_start=505
+  _globals['_GETDELIVERIESRESPONSE']._serialized_end=633
+  _globals['_DELIVERYBATCH']._serialized_start=635
+  _globals['_DELIVERYBATCH']._serialized_end=710
+  _globals['_SEARCHDELIVERIESREQUEST']._serialized_start=712
+  _globals['_SEARCHDELIVERIESREQUEST']._serialized_end=814
+  _globals['_SEARCHDELIVERIESRESPONSE']._serialized_start=817
+  _globals['_SEARCHDELIVERIESRESPONSE']._serialized_end=953
+  _globals['_STREAMDELIVERIESREQUEST']._serialized_start=955
+  _globals['_STREAMDELIVERIESREQUEST']._serialized_end=1043
+  _globals['_STREAMDELIVERIESRESPONSE']._serialized_start=1046
+  _globals['_STREAMDELIVERIESRESPONSE']._serialized_end=1189
+  _globals['_CREATEDELIVERYREQUEST']._serialized_start=1191
+  _globals['_CREATEDELIVERYREQUEST']._serialized_end=1276
+  _globals['_CREATEDELIVERYRESPONSE']._serialized_start=1279
+  _globals['_CREATEDELIVERYRESPONSE']._serialized_end=1416
+  _globals['_UPDATEDELIVERYREQUEST']._serialized_start=1418
+  _globals['_UPDATEDELIVERYREQUEST']._serialized_end=1524
+  _globals['_UPDATEDELIVERYRESPONSE']._serialized_start=1527
+  _globals['_UPDATEDELIVERYRESPONSE']._serialized_end=1664
+  _globals['_DELIVERYDATAARRAY']._serialized_start=1666
+  _globals['_DELIVERYDATAARRAY']._serialized_end=1722
+  _globals['_SEARCHDELIVERYDATA']._serialized_start=1724
+  _globals['_SEARCHDELIVERYDATA']._serialized_end=1824
+  _globals['_UPDATEDELIVERYDATA']._serialized_start=1827
+  _globals['_UPDATEDELIVERYDATA']._serialized_end=1969
+  _globals['_DELIVERYDATA']._serialized_start=1972
+  _globals['_DELIVERYDATA']._serialized_end=2244
+  _globals['_CREATEDELIVERYDATA']._serialized_start=2247
+  _globals['_CREATEDELIVERYDATA']._serialized_end=2396
+  _globals['_DELIVERYSERVICE']._serialized_start=2399
+  _globals['_DELIVERYSERVICE']._serialized_end=2928
+# @@protoc_insertion_point(module_scope)
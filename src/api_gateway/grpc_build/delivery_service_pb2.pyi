@@ -0,0 +1,188 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetDeliveryRequest(_message.Message):
+    __slots__ = ("delivery_id", "known_updated_at", "known_versions")
+    DELIVERY_ID_FIELD_NUMBER: _ClassVar[int]
+    KNOWN_UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    KNOWN_VERSIONS_FIELD_NUMBER: _ClassVar[int]
+    delivery_id: str
+    known_updated_at: _timestamp_pb2.Timestamp
+    known_versions: _containers.RepeatedCompositeFieldContainer[_timestamp_pb2.Timestamp]
+    def __init__(self, delivery_id: _Optional[str] = ..., known_updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., known_versions: _Optional[_Iterable[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]]] = ...) -> None: ...
+
+class GetDeliveryResponse(_message.Message):
+    __slots__ = ("code", "message", "delivery_data", "updated_at")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    DELIVERY_DATA_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    delivery_data: DeliveryData
+    updated_at: _timestamp_pb2.Timestamp
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., delivery_data: _Optional[_Union[DeliveryData, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class GetDeliveriesRequest(_message.Message):
+    __slots__ = ("delivery_ids",)
+    DELIVERY_IDS_FIELD_NUMBER: _ClassVar[int]
+    delivery_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, delivery_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetDeliveriesResponse(_message.Message):
+    __slots__ = ("code", "message", "batch")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    batch: DeliveryBatch
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., batch: _Optional[_Union[DeliveryBatch, _Mapping]] = ...) -> None: ...
+
+class DeliveryBatch(_message.Message):
+    __slots__ = ("items", "missing_ids")
+    ITEMS_FIELD_NUMBER: _ClassVar[int]
+    MISSING_IDS_FIELD_NUMBER: _ClassVar[int]
+    items: _containers.RepeatedCompositeFieldContainer[DeliveryData]
+    missing_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, items: _Optional[_Iterable[_Union[DeliveryData, _Mapping]]] = ..., missing_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class SearchDeliveriesRequest(_message.Message):
+    __slots__ = ("page", "searching_delivery_data")
+    PAGE_FIELD_NUMBER: _ClassVar[int]
+    SEARCHING_DELIVERY_DATA_FIELD_NUMBER: _ClassVar[int]
+    page: int
+    searching_delivery_data: SearchDeliveryData
+    def __init__(self, page: _Optional[int] = ..., searching_delivery_data: _Optional[_Union[SearchDeliveryData, _Mapping]] = ...) -> None: ...
+
+class SearchDeliveriesResponse(_message.Message):
+    __slots__ = ("code", "message", "deliveries")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    DELIVERIES_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    deliveries: DeliveryDataArray
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., deliveries: _Optional[_Union[DeliveryDataArray, _Mapping]] = ...) -> None: ...
+
+class StreamDeliveriesRequest(_message.Message):
+    __slots__ = ("searching_delivery_data",)
+    SEARCHING_DELIVERY_DATA_FIELD_NUMBER: _ClassVar[int]
+    searching_delivery_data: SearchDeliveryData
+    def __init__(self, searching_delivery_data: _Optional[_Union[SearchDeliveryData, _Mapping]] = ...) -> None: ...
+
+class StreamDeliveriesResponse(_message.Message):
+    __slots__ = ("code", "message", "deliveries")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    DELIVERIES_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    deliveries: DeliveryDataArray
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., deliveries: _Optional[_Union[DeliveryDataArray, _Mapping]] = ...) -> None: ...
+
+class CreateDeliveryRequest(_message.Message):
+    __slots__ = ("creating_delivery_data",)
+    CREATING_DELIVERY_DATA_FIELD_NUMBER: _ClassVar[int]
+    creating_delivery_data: CreateDeliveryData
+    def __init__(self, creating_delivery_data: _Optional[_Union[CreateDeliveryData, _Mapping]] = ...) -> None: ...
+
+class CreateDeliveryResponse(_message.Message):
+    __slots__ = ("code", "message", "delivery_data")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    DELIVERY_DATA_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    delivery_data: DeliveryData
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., delivery_data: _Optional[_Union[DeliveryData, _Mapping]] = ...) -> None: ...
+
+class UpdateDeliveryRequest(_message.Message):
+    __slots__ = ("delivery_id", "updating_delivery_data")
+    DELIVERY_ID_FIELD_NUMBER: _ClassVar[int]
+    UPDATING_DELIVERY_DATA_FIELD_NUMBER: _ClassVar[int]
+    delivery_id: str
+    updating_delivery_data: UpdateDeliveryData
+    def __init__(self, delivery_id: _Optional[str] = ..., updating_delivery_data: _Optional[_Union[UpdateDeliveryData, _Mapping]] = ...) -> None: ...
+
+class UpdateDeliveryResponse(_message.Message):
+    __slots__ = ("code", "message", "delivery_data")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    DELIVERY_DATA_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    delivery_data: DeliveryData
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., delivery_data: _Optional[_Union[DeliveryData, _Mapping]] = ...) -> None: ...
+
+class DeliveryDataArray(_message.Message):
+    __slots__ = ("arr",)
+    ARR_FIELD_NUMBER: _ClassVar[int]
+    arr: _containers.RepeatedCompositeFieldContainer[DeliveryData]
+    def __init__(self, arr: _Optional[_Iterable[_Union[DeliveryData, _Mapping]]] = ...) -> None: ...
+
+class SearchDeliveryData(_message.Message):
+    __slots__ = ("sender_id", "receiver_id")
+    SENDER_ID_FIELD_NUMBER: _ClassVar[int]
+    RECEIVER_ID_FIELD_NUMBER: _ClassVar[int]
+    sender_id: str
+    receiver_id: str
+    def __init__(self, sender_id: _Optional[str] = ..., receiver_id: _Optional[str] = ...) -> None: ...
+
+class UpdateDeliveryData(_message.Message):
+    __slots__ = ("state", "priority", "receive_address_id")
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    RECEIVE_ADDRESS_ID_FIELD_NUMBER: _ClassVar[int]
+    state: str
+    priority: int
+    receive_address_id: str
+    def __init__(self, state: _Optional[str] = ..., priority: _Optional[int] = ..., receive_address_id: _Optional[str] = ...) -> None: ...
+
+class DeliveryData(_message.Message):
+    __slots__ = ("id", "state", "priority", "sender_id", "receiver_id", "cargo_id", "send_address_id", "receive_address_id", "updated_at", "bill_id")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    SENDER_ID_FIELD_NUMBER: _ClassVar[int]
+    RECEIVER_ID_FIELD_NUMBER: _ClassVar[int]
+    CARGO_ID_FIELD_NUMBER: _ClassVar[int]
+    SEND_ADDRESS_ID_FIELD_NUMBER: _ClassVar[int]
+    RECEIVE_ADDRESS_ID_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    BILL_ID_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    state: str
+    priority: int
+    sender_id: str
+    receiver_id: str
+    cargo_id: str
+    send_address_id: str
+    receive_address_id: str
+    updated_at: _timestamp_pb2.Timestamp
+    bill_id: str
+    def __init__(self, id: _Optional[str] = ..., state: _Optional[str] = ..., priority: _Optional[int] = ..., sender_id: _Optional[str] = ..., receiver_id: _Optional[str] = ..., cargo_id: _Optional[str] = ..., send_address_id: _Optional[str] = ..., receive_address_id: _Optional[str] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., bill_id: _Optional[str] = ...) -> None: ...
+
+class CreateDeliveryData(_message.Message):
+    __slots__ = ("priority", "sender_id", "receiver_id", "cargo_id", "send_address_id", "receive_address_id")
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    SENDER_ID_FIELD_NUMBER: _ClassVar[int]
+    RECEIVER_ID_FIELD_NUMBER: _ClassVar[int]
+    CARGO_ID_FIELD_NUMBER: _ClassVar[int]
+    SEND_ADDRESS_ID_FIELD_NUMBER: _ClassVar[int]
+    RECEIVE_ADDRESS_ID_FIELD_NUMBER: _ClassVar[int]
+    priority: int
+    sender_id: str
+    receiver_id: str
+    cargo_id: str
+    send_address_id: str
+    receive_address_id: str
+    def __init__(self, priority: _Optional[int] = ..., sender_id: _Optional[str] = ..., receiver_id: _Optional[str] = ..., cargo_id: _Optional[str] = ..., send_address_id: _Optional[str] = ..., receive_address_id: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,312 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from grpc_build import delivery_service_pb2 as grpc__build_dot_delivery__service__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in grpc_build/delivery_service_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class DeliveryServiceStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateDelivery = channel.unary_unary(
+                '/delivery.DeliveryService/CreateDelivery',
+                request_serializer=grpc__build_dot_delivery__service__pb2.CreateDeliveryRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_delivery__service__pb2.CreateDeliveryResponse.FromString,
+                _registered_method=True)
+        self.UpdateDelivery = channel.unary_unary(
+                '/delivery.DeliveryService/UpdateDelivery',
+                request_serializer=grpc__build_dot_delivery__service__pb2.UpdateDeliveryRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_delivery__service__pb2.UpdateDeliveryResponse.FromString,
+                _registered_method=True)
+        self.SearchDeliveries = channel.unary_unary(
+                '/delivery.DeliveryService/SearchDeliveries',
+                request_serializer=grpc__build_dot_delivery__service__pb2.SearchDeliveriesRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_delivery__service__pb2.SearchDeliveriesResponse.FromString,
+                _registered_method=True)
+        self.GetDelivery = channel.unary_unary(
+                '/delivery.DeliveryService/GetDelivery',
+                request_serializer=grpc__build_dot_delivery__service__pb2.GetDeliveryRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_delivery__service__pb2.GetDeliveryResponse.FromString,
+                _registered_method=True)
+        self.GetDeliveries = channel.unary_unary(
+                '/delivery.DeliveryService/GetDeliveries',
+                request_serializer=grpc__build_dot_delivery__service__pb2.GetDeliveriesRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_delivery__service__pb2.GetDeliveriesResponse.FromString,
+                _registered_method=True)
+        self.StreamDeliveries = channel.unary_stream(
+                '/delivery.DeliveryService/StreamDeliveries',
+                request_serializer=grpc__build_dot_delivery__service__pb2.StreamDeliveriesRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_delivery__service__pb2.StreamDeliveriesResponse.FromString,
+                _registered_method=True)
+
+
+class DeliveryServiceServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def CreateDelivery(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateDelivery(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchDeliveries(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetDelivery(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetDeliveries(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamDeliveries(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_DeliveryServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateDelivery': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateDelivery,
+                    request_deserializer=grpc__build_dot_delivery__service__pb2.CreateDeliveryRequest.FromString,
+                    response_serializer=grpc__build_dot_delivery__service__pb2.CreateDeliveryResponse.SerializeToString,
+            ),
+            'UpdateDelivery': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateDelivery,
+                    request_deserializer=grpc__build_dot_delivery__service__pb2.UpdateDeliveryRequest.FromString,
+                    response_serializer=grpc__build_dot_delivery__service__pb2.UpdateDeliveryResponse.SerializeToString,
+            ),
+            'SearchDeliveries': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchDeliveries,
+                    request_deserializer=grpc__build_dot_delivery__service__pb2.SearchDeliveriesRequest.FromString,
+                    response_serializer=grpc__build_dot_delivery__service__pb2.SearchDeliveriesResponse.SerializeToString,
+            ),
+            'GetDelivery': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDelivery,
+                    request_deserializer=grpc__build_dot_delivery__service__pb2.GetDeliveryRequest.FromString,
+                    response_serializer=grpc__build_dot_delivery__service__pb2.GetDeliveryResponse.SerializeToString,
+            ),
+            'GetDeliveries': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDeliveries,
+                    request_deserializer=grpc__build_dot_delivery__service__pb2.GetDeliveriesRequest.FromString,
+                    response_serializer=grpc__build_dot_delivery__service__pb2.GetDeliveriesResponse.SerializeToString,
+            ),
+            'StreamDeliveries': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamDeliveries,
+                    request_deserializer=grpc__build_dot_delivery__service__pb2.StreamDeliveriesRequest.FromString,
+                    response_serializer=grpc__build_dot_delivery__service__pb2.StreamDeliveriesResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'delivery.DeliveryService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('delivery.DeliveryService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class DeliveryService:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def CreateDelivery(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/delivery.DeliveryService/CreateDelivery',
+            grpc__build_dot_delivery__service__pb2.CreateDeliveryRequest.SerializeToString,
+            grpc__build_dot_delivery__service__pb2.CreateDeliveryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateDelivery(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/delivery.DeliveryService/UpdateDelivery',
+            grpc__build_dot_delivery__service__pb2.UpdateDeliveryRequest.SerializeToString,
+            grpc__build_dot_delivery__service__pb2.UpdateDeliveryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchDeliveries(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/delivery.DeliveryService/SearchDeliveries',
+            grpc__build_dot_delivery__service__pb2.SearchDeliveriesRequest.SerializeToString,
+            grpc__build_dot_delivery__service__pb2.SearchDeliveriesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetDelivery(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/delivery.DeliveryService/GetDelivery',
+            grpc__build_dot_delivery__service__pb2.GetDeliveryRequest.SerializeToString,
+            grpc__build_dot_delivery__service__pb2.GetDeliveryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetDeliveries(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/delivery.DeliveryService/GetDeliveries',
+            grpc__build_dot_delivery__service__pb2.GetDeliveriesRequest.SerializeToString,
+            grpc__build_dot_delivery__service__pb2.GetDeliveriesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamDeliveries(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/delivery.DeliveryService/StreamDeliveries',
+            grpc__build_dot_delivery__service__pb2.StreamDeliveriesRequest.SerializeToString,
+            grpc__build_dot_delivery__service__pb2.StreamDeliveriesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
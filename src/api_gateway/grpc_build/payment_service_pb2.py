@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: grpc_build/payment_service.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'grpc_build/payment_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n grpc_build/payment_service.proto\x12\x07payment\"f\n\x15\x41\x64\x64PaymentRuleRequest\x12\"\n\x04\x63ost\x18\x01 \x01(\x0b\x32\x14.payment.DecimalData\x12)\n\ncost_rules\x18\x02 \x03(\x0b\x32\x15.payment.CostRuleData\"H\n\x16\x41\x64\x64PaymentRuleResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x14\n\x07message\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_message\"P\n\x15SearchPaymentsRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12)\n\x0esearch_strings\x18\x02 \x03(\x0b\x32\x11.payment.ItemData\"\x82\x01\n\x16SearchPaymentsResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12(\n\x08payments\x18\x03 \x01(\x0b\x32\x14.payment.StringArrayH\x00\x42\x1d\n\x1bSearchPaymentsResponseOneOf\".\n\x14\x41\x63\x63\x65ptPaymentRequest\x12\x16\n\x0e\x62\x61nk_json_data\x18\x01 \x01(\t\"6\n\x15\x41\x63\x63\x65ptPaymentResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\")\n\x12MakePaymentRequest\x12\x13\n\x0b\x64\x65livery_id\x18\x01 \x01(\t\"\x87\x01\n\x13MakePaymentResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12\x30\n\x0cpayment_data\x18\x03 \x01(\x0b\x32\x18.payment.PaymentInfoDataH\x00\x42\x1d\n\x1bGetPaymentInfoResponseOneOf\"E\n\x0c\x43ostRuleData\x12\x14\n\x0c\x63ompare_type\x18\x01 \x01(\t\x12\x1f\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x11.payment.ItemData\"\x1a\n\x0bStringArray\x12\x0b\n\x03\x61rr\x18\x01 \x03(\t\"(\n\x08ItemData\x12\r\n\x05\x66ield\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"e\n\x0b\x44\x65\x63imalData\x12\x12\n\x05units\x18\x01 \x01(\x04H\x00\x88\x01\x01\x12\x12\n\x05nanos\x18\x02 \x01(\rH\x01\x88\x01\x01\x12\x11\n\x04sign\x18\x03 \x01(\x11H\x02\x88\x01\x01\x42\x08\n\x06_unitsB\x08\n\x06_nanosB\x07\n\x05_sign\"\x7f\n\x0fPaymentInfoData\x12\x13\n\x0b\x64\x65livery_id\x18\x01 \x01(\t\x12\"\n\x04\x63ost\x18\x02 \x01(\x0b\x32\x14.payment.DecimalData\x12\x10\n\x08\x63urrency\x18\x03 \x01(\t\x12!\n\x19\x63ompany_bank_account_hash\x18\x04 \x01(\t2\xd0\x02\n\x0ePaymentService\x12H\n\x0bMakePayment\x12\x1b.payment.MakePaymentRequest\x1a\x1c.payment.MakePaymentResponse\x12N\n\rAcceptPayment\x12\x1d.payment.AcceptPaymentRequest\x1a\x1e.payment.AcceptPaymentResponse\x12Q\n\x0eSearchPayments\x12\x1e.payment.SearchPaymentsRequest\x1a\x1f.payment.SearchPaymentsResponse\x12Q\n\x0e\x41\x64\x64PaymentRule\x12\x1e.payment.AddPaymentRuleRequest\x1a\x1f.payment.AddPaymentRuleResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_build.payment_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_ADDPAYMENTRULEREQUEST']._serialized_start=45
+  _globals['_ADDPAYMENTRULEREQUEST']._serialized_end=147
+  _globals['_ADDPAYMENTRULERESPONSE']._serialized_start=149
+  _globals['_ADDPAYMENTRULERESPONSE']._serialized_end=221
+  _globals['_SEARCHPAYMENTSREQUEST']._serialized_start=223
+  _globals['_SEARCHPAYMENTSREQUEST']._serialized_end=303
+  _globals['_SEARCHPAYMENTSRESPONSE']._serialized_start=306
+  _globals['_SEARCHPAYMENTSRESPONSE']._serialized_end=436
+  _globals['_ACCEPTPAYMENTREQUEST']._serialized_start=438
+  _globals['_ACCEPTPAYMENTREQUEST']._serialized_end=484
+  _globals['_ACCEPTPAYMENTRESPONSE']._serialized_start=486
+  _globals['_ACCEPTPAYMENTRESPONSE']._serialized_end=540
+  _globals['_MAKEPAYMENTREQUEST']._serialized_start=542
+  _globals['_MAKEPAYMENTREQUEST']._serialized_end=583
+  _globals['_MAKEPAYMENTRESPONSE']._serialized_start=586
+  _globals['_MAKEPAYMENTRESPONSE']._serialized_end=721
+  _globals['_COSTRULEDATA']._serialized_start=723
+  _globals['_COSTRULEDATA']._serialized_end=792
+  _globals['_STRINGARRAY']._serialized_start=794
+  _globals['_STRINGARRAY']._serialized_end=820
+  _globals['_ITEMDATA']._serialized_start=822
+  _globals['_ITEMDATA']._serialized_end=862
+  _globals['_DECIMALDATA']._serialized_start=864
+  _globals['_DECIMALDATA']._serialized_end=965
+  _globals['_PAYMENTINFODATA']._serialized_start=967
+  _globals['_PAYMENTINFODATA']._serialized_end=1094
+  _globals['_PAYMENTSERVICE']._serialized_start=1097
+  _globals['_PAYMENTSERVICE']._serialized_end=1433
+# @@protoc_insertion_point(module_scope)
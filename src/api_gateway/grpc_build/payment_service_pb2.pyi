@@ -0,0 +1,115 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class AddPaymentRuleRequest(_message.Message):
+    __slots__ = ("cost", "cost_rules")
+    COST_FIELD_NUMBER: _ClassVar[int]
+    COST_RULES_FIELD_NUMBER: _ClassVar[int]
+    cost: DecimalData
+    cost_rules: _containers.RepeatedCompositeFieldContainer[CostRuleData]
+    def __init__(self, cost: _Optional[_Union[DecimalData, _Mapping]] = ..., cost_rules: _Optional[_Iterable[_Union[CostRuleData, _Mapping]]] = ...) -> None: ...
+
+class AddPaymentRuleResponse(_message.Message):
+    __slots__ = ("code", "message")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ...) -> None: ...
+
+class SearchPaymentsRequest(_message.Message):
+    __slots__ = ("page", "search_strings")
+    PAGE_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_STRINGS_FIELD_NUMBER: _ClassVar[int]
+    page: int
+    search_strings: _containers.RepeatedCompositeFieldContainer[ItemData]
+    def __init__(self, page: _Optional[int] = ..., search_strings: _Optional[_Iterable[_Union[ItemData, _Mapping]]] = ...) -> None: ...
+
+class SearchPaymentsResponse(_message.Message):
+    __slots__ = ("code", "message", "payments")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    PAYMENTS_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    payments: StringArray
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., payments: _Optional[_Union[StringArray, _Mapping]] = ...) -> None: ...
+
+class AcceptPaymentRequest(_message.Message):
+    __slots__ = ("bank_json_data",)
+    BANK_JSON_DATA_FIELD_NUMBER: _ClassVar[int]
+    bank_json_data: str
+    def __init__(self, bank_json_data: _Optional[str] = ...) -> None: ...
+
+class AcceptPaymentResponse(_message.Message):
+    __slots__ = ("code", "message")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ...) -> None: ...
+
+class MakePaymentRequest(_message.Message):
+    __slots__ = ("delivery_id",)
+    DELIVERY_ID_FIELD_NUMBER: _ClassVar[int]
+    delivery_id: str
+    def __init__(self, delivery_id: _Optional[str] = ...) -> None: ...
+
+class MakePaymentResponse(_message.Message):
+    __slots__ = ("code", "message", "payment_data")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    PAYMENT_DATA_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    payment_data: PaymentInfoData
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., payment_data: _Optional[_Union[PaymentInfoData, _Mapping]] = ...) -> None: ...
+
+class CostRuleData(_message.Message):
+    __slots__ = ("compare_type", "data")
+    COMPARE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    compare_type: str
+    data: ItemData
+    def __init__(self, compare_type: _Optional[str] = ..., data: _Optional[_Union[ItemData, _Mapping]] = ...) -> None: ...
+
+class StringArray(_message.Message):
+    __slots__ = ("arr",)
+    ARR_FIELD_NUMBER: _ClassVar[int]
+    arr: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, arr: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ItemData(_message.Message):
+    __slots__ = ("field", "value")
+    FIELD_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    field: str
+    value: str
+    def __init__(self, field: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+
+class DecimalData(_message.Message):
+    __slots__ = ("units", "nanos", "sign")
+    UNITS_FIELD_NUMBER: _ClassVar[int]
+    NANOS_FIELD_NUMBER: _ClassVar[int]
+    SIGN_FIELD_NUMBER: _ClassVar[int]
+    units: int
+    nanos: int
+    sign: int
+    def __init__(self, units: _Optional[int] = ..., nanos: _Optional[int] = ..., sign: _Optional[int] = ...) -> None: ...
+
+class PaymentInfoData(_message.Message):
+    __slots__ = ("delivery_id", "cost", "currency", "company_bank_account_hash")
+    DELIVERY_ID_FIELD_NUMBER: _ClassVar[int]
+    COST_FIELD_NUMBER: _ClassVar[int]
+    CURRENCY_FIELD_NUMBER: _ClassVar[int]
+    COMPANY_BANK_ACCOUNT_HASH_FIELD_NUMBER: _ClassVar[int]
+    delivery_id: str
+    cost: DecimalData
+    currency: str
+    company_bank_account_hash: str
+    def __init__(self, delivery_id: _Optional[str] = ..., cost: _Optional[_Union[DecimalData, _Mapping]] = ..., currency: _Optional[str] = ..., company_bank_account_hash: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,226 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from grpc_build import payment_service_pb2 as grpc__build_dot_payment__service__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in grpc_build/payment_service_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class PaymentServiceStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.MakePayment = channel.unary_unary(
+                '/payment.PaymentService/MakePayment',
+                request_serializer=grpc__build_dot_payment__service__pb2.MakePaymentRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_payment__service__pb2.MakePaymentResponse.FromString,
+                _registered_method=True)
+        self.AcceptPayment = channel.unary_unary(
+                '/payment.PaymentService/AcceptPayment',
+                request_serializer=grpc__build_dot_payment__service__pb2.AcceptPaymentRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_payment__service__pb2.AcceptPaymentResponse.FromString,
+                _registered_method=True)
+        self.SearchPayments = channel.unary_unary(
+                '/payment.PaymentService/SearchPayments',
+                request_serializer=grpc__build_dot_payment__service__pb2.SearchPaymentsRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_payment__service__pb2.SearchPaymentsResponse.FromString,
+                _registered_method=True)
+        self.AddPaymentRule = channel.unary_unary(
+                '/payment.PaymentService/AddPaymentRule',
+                request_serializer=grpc__build_dot_payment__service__pb2.AddPaymentRuleRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_payment__service__pb2.AddPaymentRuleResponse.FromString,
+                _registered_method=True)
+
+
+class PaymentServiceServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def MakePayment(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AcceptPayment(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchPayments(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AddPaymentRule(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_PaymentServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'MakePayment': grpc.unary_unary_rpc_method_handler(
+                    servicer.MakePayment,
+                    request_deserializer=grpc__build_dot_payment__service__pb2.MakePaymentRequest.FromString,
+                    response_serializer=grpc__build_dot_payment__service__pb2.MakePaymentResponse.SerializeToString,
+            ),
+            'AcceptPayment': grpc.unary_unary_rpc_method_handler(
+                    servicer.AcceptPayment,
+                    request_deserializer=grpc__build_dot_payment__service__pb2.AcceptPaymentRequest.FromString,
+                    response_serializer=grpc__build_dot_payment__service__pb2.AcceptPaymentResponse.SerializeToString,
+            ),
+            'SearchPayments': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchPayments,
+                    request_deserializer=grpc__build_dot_payment__service__pb2.SearchPaymentsRequest.FromString,
+                    response_serializer=grpc__build_dot_payment__service__pb2.SearchPaymentsResponse.SerializeToString,
+            ),
+            'AddPaymentRule': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddPaymentRule,
+                    request_deserializer=grpc__build_dot_payment__service__pb2.AddPaymentRuleRequest.FromString,
+                    response_serializer=grpc__build_dot_payment__service__pb2.AddPaymentRuleResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'payment.PaymentService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('payment.PaymentService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class PaymentService:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def MakePayment(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/payment.PaymentService/MakePayment',
+            grpc__build_dot_payment__service__pb2.MakePaymentRequest.SerializeToString,
+            grpc__build_dot_payment__service__pb2.MakePaymentResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AcceptPayment(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/payment.PaymentService/AcceptPayment',
+            grpc__build_dot_payment__service__pb2.AcceptPaymentRequest.SerializeToString,
+            grpc__build_dot_payment__service__pb2.AcceptPaymentResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchPayments(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/payment.PaymentService/SearchPayments',
+            grpc__build_dot_payment__service__pb2.SearchPaymentsRequest.SerializeToString,
+            grpc__build_dot_payment__service__pb2.SearchPaymentsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AddPaymentRule(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/payment.PaymentService/AddPaymentRule',
+            grpc__build_dot_payment__service__pb2.AddPaymentRuleRequest.SerializeToString,
+            grpc__build_dot_payment__service__pb2.AddPaymentRuleResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
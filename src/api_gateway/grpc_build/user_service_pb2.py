@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: grpc_build/user_service.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'grpc_build/user_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dgrpc_build/user_service.proto\x12\x04user\x1a\x1fgoogle/protobuf/timestamp.proto\"t\n\x12SearchUsersRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12\x17\n\nfirst_name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0bsecond_name\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\r\n\x0b_first_nameB\x0e\n\x0c_second_name\"y\n\x13SearchUsersResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12%\n\x05users\x18\x03 \x01(\x0b\x32\x14.user.BriefUserArrayH\x00\x42\x1a\n\x18SearchUsersResponseOneOf\"E\n\x11\x43reateUserRequest\x12\x30\n\x12\x63reating_user_data\x18\x01 \x01(\x0b\x32\x14.user.CreateUserData\"u\n\x12\x43reateUserResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12#\n\tuser_data\x18\x03 \x01(\x0b\x32\x0e.user.UserDataH\x00\x42\x19\n\x17\x43reateUserResponseOneOf\"(\n\x15ReactivateUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"H\n\x16ReactivateUserResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x14\n\x07message\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_message\"(\n\x15\x44\x65\x61\x63tivateUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"H\n\x16\x44\x65\x61\x63tivateUserResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x14\n\x07message\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_message\"\xa9\x01\n\x12GetUserDataRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x39\n\x10known_updated_at\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12\x32\n\x0eknown_versions\x18\x03 \x03(\x0b\x32\x1a.google.protobuf.TimestampB\x13\n\x11_known_updated_at\"\xb7\x01\n\x13GetUserDataResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12#\n\tuser_data\x18\x03 \x01(\x0b\x32\x0e.user.UserDataH\x00\x12\x33\n\nupdated_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x16\n\x14GetUserResponseOneOfB\r\n\x0b_updated_at\"0\n\x1cGetUserDataByUsernameRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"\x83\x01\n\x1dGetUserDataByUsernameResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12#\n\tuser_data\x18\x03 \x01(\x0b\x32\x0e.user.UserDataH\x00\x42\x1c\n\x1aGetUserDataByUsernameOneOf\"Z\n\x15UpdateUserDataRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x30\n\x12updating_user_data\x18\x02 \x01(\x0b\x32\x14.user.UpdateUserData\"z\n\x16UpdateUserDataResponse\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x11\n\x07message\x18\x02 \x01(\tH\x00\x12#\n\tuser_data\x18\x03 \x01(\x0b\x32\x0e.user.UserDataH\x00\x42\x1a\n\x18SetUserDataResponseOneOf\"2\n\x0e\x42riefUserArray\x12 \n\x03\x61rr\x18\x01 \x03(\x0b\x32\x13.user.BriefUserData\"3\n\tGroupData\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_name\"*\n\nGroupArray\x12\x1c\n\x03\x61rr\x18\x01 \x03(\x0b\x32\x0f.user.GroupData\"\x8f\x02\n\x0e\x43reateUserData\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x12\n\nfirst_name\x18\x03 \x01(\t\x12\x13\n\x0bsecond_name\x18\x04 \x01(\t\x12\x17\n\npatronymic\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x06 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05phone\x18\x07 \x01(\tH\x02\x88\x01\x01\x12.\n\x05\x62irth\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03\x88\x01\x01\x12\x12\n\ngroups_ids\x18\t \x03(\tB\r\n\x0b_patronymicB\x08\n\x06_emailB\x08\n\x06_phoneB\x08\n\x06_birth\"\xd4\x02\n\x08UserData\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x12\n\nfirst_name\x18\x03 \x01(\t\x12\x13\n\x0bsecond_name\x18\x04 \x01(\t\x12\x17\n\npatronymic\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x06 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05phone\x18\x07 \x01(\tH\x02\x88\x01\x01\x12.\n\x05\x62irth\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03\x88\x01\x01\x12\x1f\n\x06groups\x18\t \x03(\x0b\x32\x0f.user.GroupData\x12\x33\n\nupdated_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x04\x88\x01\x01\x42\r\n\x0b_patronymicB\x08\n\x06_emailB\x08\n\x06_phoneB\x08\n\x06_birthB\r\n\x0b_updated_at\"\xd6\x02\n\x0eUpdateUserData\x12\x15\n\x08username\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x17\n\nfirst_name\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x18\n\x0bsecond_name\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x17\n\npatronymic\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x05 \x01(\tH\x04\x88\x01\x01\x12\x12\n\x05phone\x18\x06 \x01(\tH\x05\x88\x01\x01\x12.\n\x05\x62irth\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x06\x88\x01\x01\x12%\n\x06groups\x18\x08 \x01(\x0b\x32\x10.user.GroupArrayH\x07\x88\x01\x01\x42\x0b\n\t_usernameB\r\n\x0b_first_nameB\x0e\n\x0c_second_nameB\r\n\x0b_patronymicB\x08\n\x06_emailB\x08\n\x06_phoneB\x08\n\x06_birthB\t\n\x07_groups\"V\n\rBriefUserData\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x12\n\nfirst_name\x18\x03 \x01(\t\x12\x13\n\x0bsecond_name\x18\x04 \x01(\t2\x8b\x04\n\x0bUserService\x12\x42\n\x0bGetUserData\x12\x18.user.GetUserDataRequest\x1a\x19.user.GetUserDataResponse\x12\x42\n\x0bSearchUsers\x12\x18.user.SearchUsersRequest\x1a\x19.user.SearchUsersResponse\x12L\n\x15GetUserDataByUsername\x12\x18.user.GetUserDataRequest\x1a\x19.user.GetUserDataResponse\x12K\n\x0eUpdateUserData\x12\x1b.user.UpdateUserDataRequest\x1a\x1c.user.UpdateUserDataResponse\x12K\n\x0e\x44\x65\x61\x63tivateUser\x12\x1b.user.DeactivateUserRequest\x1a\x1c.user.DeactivateUserResponse\x12K\n\x0eReactivateUser\x12\x1b.user.ReactivateUserRequest\x1a\x1c.user.ReactivateUserResponse\x12?\n\nCreateUser\x12\x17.user.CreateUserRequest\x1a\x18.user.CreateUserResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_build.user_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SEARCHUSERSREQUEST']._serialized_start=72
+  _globals['_SEARCHUSERSREQUEST']._serialized_end=188
+  _globals['_SEARCHUSERSRESPONSE']._serialized_start=190
+  _globals['_SEARCHUSERSRESPONSE']._serialized_end=311
+  _globals['_CREATEUSERREQUEST']._serialized_start=313
+  _globals['_CREATEUSERREQUEST']._serialized_end=382
+  _globals['_CREATEUSERRESPONSE']._serialized_start=384
+  _globals['_CREATEUSERRESPONSE']._serialized_end=501
+  _globals['_REACTIVATEUSERREQUEST']._serialized_start=503
+  _globals['_REACTIVATEUSERREQUEST']._serialized_end=543
+  _globals['_REACTIVATEUSERRESPONSE']._serialized_start=545
+  _globals['_REACTIVATEUSERRESPONSE']._serialized_end=617
+  _globals['_DEACTIVATEUSERREQUEST']._serialized_start=619
+  _globals['_DEACTIVATEUSERREQUEST']._serialized_end=659
+  _globals['_DEACTIVATEUSERRESPONSE']._serialized_start=661
+  _globals['_DEACTIVATEUSERRESPONSE']._serialized_end=733
+  _globals['_GETUSERDATAREQUEST']._serialized_start=736
+  _globals['_GETUSERDATAREQUEST']._serialized_end=905
+  _globals['_GETUSERDATARESPONSE']._serialized_start=908
+  _globals['_GETUSERDATARESPONSE']._serialized_end=1091
+  _globals['_GETUSERDATABYUSERNAMEREQUEST']._serialized_start=1093
+  _globals['_GETUSERDATABYUSERNAMEREQUEST']._serialized_end=1141
+  _globals['_GETUSERDATABYUSERNAMERESPONSE']._serialized_start=1144
+  _globals['_GETUSERDATABYUSERNAMERESPONSE']._serialized_end=1275
+  _globals['_UPDATEUSERDATAREQUEST']._serialized_start=1277
+  _globals['_UPDATEUSERDATAREQUEST']._serialized_end=1367
+  _globals['_UPDATEUSERDATARESPONSE']._serialized_start=1369
+  _globals['_UPDATEUSERDATARESPONSE']._serialized_end=1491
+  _globals['_BRIEFUSERARRAY']._serialized_start=1493
+  _globals['_BRIEFUSERARRAY']._serialized_end=1543
+  _globals['_GROUPDATA']._serialized_start=1545
+  _globals['_GROUPDATA']._serialized_end=1596
+  _globals['_GROUPARRAY']._serialized_start=1598
+  _globals['_GROUPARRAY']._serialized_end=1640
+  _globals['_CREATEUSERDATA']._serialized_start=1643
+  _globals['_CREATEUSERDATA']._serialized_end=1914
+  _globals['_USERDATA']._serialized_start=1917
+  _globals['_USERDATA']._serialized_end=2257
+  _globals['_UPDATEUSERDATA']._serialized_start=2260
+  _globals['_UPDATEUSERDATA']._serialized_end=2602
+  _globals['_BRIEFUSERDATA']._serialized_start=2604
+  _globals['_BRIEFUSERDATA']._serialized_end=2690
+  _globals['_USERSERVICE']._serialized_start=2693
+  _globals['_USERSERVICE']._serialized_end=3216
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,228 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SearchUsersRequest(_message.Message):
+    __slots__ = ("page", "first_name", "second_name")
+    PAGE_FIELD_NUMBER: _ClassVar[int]
+    FIRST_NAME_FIELD_NUMBER: _ClassVar[int]
+    SECOND_NAME_FIELD_NUMBER: _ClassVar[int]
+    page: int
+    first_name: str
+    second_name: str
+    def __init__(self, page: _Optional[int] = ..., first_name: _Optional[str] = ..., second_name: _Optional[str] = ...) -> None: ...
+
+class SearchUsersResponse(_message.Message):
+    __slots__ = ("code", "message", "users")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    USERS_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    users: BriefUserArray
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., users: _Optional[_Union[BriefUserArray, _Mapping]] = ...) -> None: ...
+
+class CreateUserRequest(_message.Message):
+    __slots__ = ("creating_user_data",)
+    CREATING_USER_DATA_FIELD_NUMBER: _ClassVar[int]
+    creating_user_data: CreateUserData
+    def __init__(self, creating_user_data: _Optional[_Union[CreateUserData, _Mapping]] = ...) -> None: ...
+
+class CreateUserResponse(_message.Message):
+    __slots__ = ("code", "message", "user_data")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    USER_DATA_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    user_data: UserData
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., user_data: _Optional[_Union[UserData, _Mapping]] = ...) -> None: ...
+
+class ReactivateUserRequest(_message.Message):
+    __slots__ = ("user_id",)
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    def __init__(self, user_id: _Optional[str] = ...) -> None: ...
+
+class ReactivateUserResponse(_message.Message):
+    __slots__ = ("code", "message")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ...) -> None: ...
+
+class DeactivateUserRequest(_message.Message):
+    __slots__ = ("user_id",)
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    def __init__(self, user_id: _Optional[str] = ...) -> None: ...
+
+class DeactivateUserResponse(_message.Message):
+    __slots__ = ("code", "message")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ...) -> None: ...
+
+class GetUserDataRequest(_message.Message):
+    __slots__ = ("user_id", "known_updated_at", "known_versions")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    KNOWN_UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    KNOWN_VERSIONS_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    known_updated_at: _timestamp_pb2.Timestamp
+    known_versions: _containers.RepeatedCompositeFieldContainer[_timestamp_pb2.Timestamp]
+    def __init__(self, user_id: _Optional[str] = ..., known_updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., known_versions: _Optional[_Iterable[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]]] = ...) -> None: ...
+
+class GetUserDataResponse(_message.Message):
+    __slots__ = ("code", "message", "user_data", "updated_at")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    USER_DATA_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    user_data: UserData
+    updated_at: _timestamp_pb2.Timestamp
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., user_data: _Optional[_Union[UserData, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class GetUserDataByUsernameRequest(_message.Message):
+    __slots__ = ("username",)
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    username: str
+    def __init__(self, username: _Optional[str] = ...) -> None: ...
+
+class GetUserDataByUsernameResponse(_message.Message):
+    __slots__ = ("code", "message", "user_data")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    USER_DATA_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    user_data: UserData
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., user_data: _Optional[_Union[UserData, _Mapping]] = ...) -> None: ...
+
+class UpdateUserDataRequest(_message.Message):
+    __slots__ = ("user_id", "updating_user_data")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    UPDATING_USER_DATA_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    updating_user_data: UpdateUserData
+    def __init__(self, user_id: _Optional[str] = ..., updating_user_data: _Optional[_Union[UpdateUserData, _Mapping]] = ...) -> None: ...
+
+class UpdateUserDataResponse(_message.Message):
+    __slots__ = ("code", "message", "user_data")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    USER_DATA_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    user_data: UserData
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., user_data: _Optional[_Union[UserData, _Mapping]] = ...) -> None: ...
+
+class BriefUserArray(_message.Message):
+    __slots__ = ("arr",)
+    ARR_FIELD_NUMBER: _ClassVar[int]
+    arr: _containers.RepeatedCompositeFieldContainer[BriefUserData]
+    def __init__(self, arr: _Optional[_Iterable[_Union[BriefUserData, _Mapping]]] = ...) -> None: ...
+
+class GroupData(_message.Message):
+    __slots__ = ("id", "name")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    name: str
+    def __init__(self, id: _Optional[str] = ..., name: _Optional[str] = ...) -> None: ...
+
+class GroupArray(_message.Message):
+    __slots__ = ("arr",)
+    ARR_FIELD_NUMBER: _ClassVar[int]
+    arr: _containers.RepeatedCompositeFieldContainer[GroupData]
+    def __init__(self, arr: _Optional[_Iterable[_Union[GroupData, _Mapping]]] = ...) -> None: ...
+
+class CreateUserData(_message.Message):
+    __slots__ = ("username", "password", "first_name", "second_name", "patronymic", "email", "phone", "birth", "groups_ids")
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    PASSWORD_FIELD_NUMBER: _ClassVar[int]
+    FIRST_NAME_FIELD_NUMBER: _ClassVar[int]
+    SECOND_NAME_FIELD_NUMBER: _ClassVar[int]
+    PATRONYMIC_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    PHONE_FIELD_NUMBER: _ClassVar[int]
+    BIRTH_FIELD_NUMBER: _ClassVar[int]
+    GROUPS_IDS_FIELD_NUMBER: _ClassVar[int]
+    username: str
+    password: str
+    first_name: str
+    second_name: str
+    patronymic: str
+    email: str
+    phone: str
+    birth: _timestamp_pb2.Timestamp
+    groups_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, username: _Optional[str] = ..., password: _Optional[str] = ..., first_name: _Optional[str] = ..., second_name: _Optional[str] = ..., patronymic: _Optional[str] = ..., email: _Optional[str] = ..., phone: _Optional[str] = ..., birth: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., groups_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class UserData(_message.Message):
+    __slots__ = ("id", "username", "first_name", "second_name", "patronymic", "email", "phone", "birth", "groups", "updated_at")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    FIRST_NAME_FIELD_NUMBER: _ClassVar[int]
+    SECOND_NAME_FIELD_NUMBER: _ClassVar[int]
+    PATRONYMIC_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    PHONE_FIELD_NUMBER: _ClassVar[int]
+    BIRTH_FIELD_NUMBER: _ClassVar[int]
+    GROUPS_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    username: str
+    first_name: str
+    second_name: str
+    patronymic: str
+    email: str
+    phone: str
+    birth: _timestamp_pb2.Timestamp
+    groups: _containers.RepeatedCompositeFieldContainer[GroupData]
+    updated_at: _timestamp_pb2.Timestamp
+    def __init__(self, id: _Optional[str] = ..., username: _Optional[str] = ..., first_name: _Optional[str] = ..., second_name: _Optional[str] = ..., patronymic: _Optional[str] = ..., email: _Optional[str] = ..., phone: _Optional[str] = ..., birth: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., groups: _Optional[_Iterable[_Union[GroupData, _Mapping]]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class UpdateUserData(_message.Message):
+    __slots__ = ("username", "first_name", "second_name", "patronymic", "email", "phone", "birth", "groups")
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    FIRST_NAME_FIELD_NUMBER: _ClassVar[int]
+    SECOND_NAME_FIELD_NUMBER: _ClassVar[int]
+    PATRONYMIC_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    PHONE_FIELD_NUMBER: _ClassVar[int]
+    BIRTH_FIELD_NUMBER: _ClassVar[int]
+    GROUPS_FIELD_NUMBER: _ClassVar[int]
+    username: str
+    first_name: str
+    second_name: str
+    patronymic: str
+    email: str
+    phone: str
+    birth: _timestamp_pb2.Timestamp
+    groups: GroupArray
+    def __init__(self, username: _Optional[str] = ..., first_name: _Optional[str] = ..., second_name: _Optional[str] = ..., patronymic: _Optional[str] = ..., email: _Optional[str] = ..., phone: _Optional[str] = ..., birth: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., groups: _Optional[_Union[GroupArray, _Mapping]] = ...) -> None: ...
+
+class BriefUserData(_message.Message):
+    __slots__ = ("id", "username", "first_name", "second_name")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    FIRST_NAME_FIELD_NUMBER: _ClassVar[int]
+    SECOND_NAME_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    username: str
+    first_name: str
+    second_name: str
+    def __init__(self, id: _Optional[str] = ..., username: _Optional[str] = ..., first_name: _Optional[str] = ..., second_name: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,355 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from grpc_build import user_service_pb2 as grpc__build_dot_user__service__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in grpc_build/user_service_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class UserServiceStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetUserData = channel.unary_unary(
+                '/user.UserService/GetUserData',
+                request_serializer=grpc__build_dot_user__service__pb2.GetUserDataRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_user__service__pb2.GetUserDataResponse.FromString,
+                _registered_method=True)
+        self.SearchUsers = channel.unary_unary(
+                '/user.UserService/SearchUsers',
+                request_serializer=grpc__build_dot_user__service__pb2.SearchUsersRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_user__service__pb2.SearchUsersResponse.FromString,
+                _registered_method=True)
+        self.GetUserDataByUsername = channel.unary_unary(
+                '/user.UserService/GetUserDataByUsername',
+                request_serializer=grpc__build_dot_user__service__pb2.GetUserDataRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_user__service__pb2.GetUserDataResponse.FromString,
+                _registered_method=True)
+        self.UpdateUserData = channel.unary_unary(
+                '/user.UserService/UpdateUserData',
+                request_serializer=grpc__build_dot_user__service__pb2.UpdateUserDataRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_user__service__pb2.UpdateUserDataResponse.FromString,
+                _registered_method=True)
+        self.DeactivateUser = channel.unary_unary(
+                '/user.UserService/DeactivateUser',
+                request_serializer=grpc__build_dot_user__service__pb2.DeactivateUserRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_user__service__pb2.DeactivateUserResponse.FromString,
+                _registered_method=True)
+        self.ReactivateUser = channel.unary_unary(
+                '/user.UserService/ReactivateUser',
+                request_serializer=grpc__build_dot_user__service__pb2.ReactivateUserRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_user__service__pb2.ReactivateUserResponse.FromString,
+                _registered_method=True)
+        self.CreateUser = channel.unary_unary(
+                '/user.UserService/CreateUser',
+                request_serializer=grpc__build_dot_user__service__pb2.CreateUserRequest.SerializeToString,
+                response_deserializer=grpc__build_dot_user__service__pb2.CreateUserResponse.FromString,
+                _registered_method=True)
+
+
+class UserServiceServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def GetUserData(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUserDataByUsername(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateUserData(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeactivateUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReactivateUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_UserServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetUserData': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUserData,
+                    request_deserializer=grpc__build_dot_user__service__pb2.GetUserDataRequest.FromString,
+                    response_serializer=grpc__build_dot_user__service__pb2.GetUserDataResponse.SerializeToString,
+            ),
+            'SearchUsers': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchUsers,
+                    request_deserializer=grpc__build_dot_user__service__pb2.SearchUsersRequest.FromString,
+                    response_serializer=grpc__build_dot_user__service__pb2.SearchUsersResponse.SerializeToString,
+            ),
+            'GetUserDataByUsername': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUserDataByUsername,
+                    request_deserializer=grpc__build_dot_user__service__pb2.GetUserDataRequest.FromString,
+                    response_serializer=grpc__build_dot_user__service__pb2.GetUserDataResponse.SerializeToString,
+            ),
+            'UpdateUserData': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateUserData,
+                    request_deserializer=grpc__build_dot_user__service__pb2.UpdateUserDataRequest.FromString,
+                    response_serializer=grpc__build_dot_user__service__pb2.UpdateUserDataResponse.SerializeToString,
+            ),
+            'DeactivateUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeactivateUser,
+                    request_deserializer=grpc__build_dot_user__service__pb2.DeactivateUserRequest.FromString,
+                    response_serializer=grpc__build_dot_user__service__pb2.DeactivateUserResponse.SerializeToString,
+            ),
+            'ReactivateUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReactivateUser,
+                    request_deserializer=grpc__build_dot_user__service__pb2.ReactivateUserRequest.FromString,
+                    response_serializer=grpc__build_dot_user__service__pb2.ReactivateUserResponse.SerializeToString,
+            ),
+            'CreateUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateUser,
+                    request_deserializer=grpc__build_dot_user__service__pb2.CreateUserRequest.FromString,
+                    response_serializer=grpc__build_dot_user__service__pb2.CreateUserResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'user.UserService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('user.UserService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class UserService:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetUserData(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserService/GetUserData',
+            grpc__build_dot_user__service__pb2.GetUserDataRequest.SerializeToString,
+            grpc__build_dot_user__service__pb2.GetUserDataResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserService/SearchUsers',
+            grpc__build_dot_user__service__pb2.SearchUsersRequest.SerializeToString,
+            grpc__build_dot_user__service__pb2.SearchUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetUserDataByUsername(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserService/GetUserDataByUsername',
+            grpc__build_dot_user__service__pb2.GetUserDataRequest.SerializeToString,
+            grpc__build_dot_user__service__pb2.GetUserDataResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateUserData(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserService/UpdateUserData',
+            grpc__build_dot_user__service__pb2.UpdateUserDataRequest.SerializeToString,
+            grpc__build_dot_user__service__pb2.UpdateUserDataResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeactivateUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserService/DeactivateUser',
+            grpc__build_dot_user__service__pb2.DeactivateUserRequest.SerializeToString,
+            grpc__build_dot_user__service__pb2.DeactivateUserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReactivateUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserService/ReactivateUser',
+            grpc__build_dot_user__service__pb2.ReactivateUserRequest.SerializeToString,
+            grpc__build_dot_user__service__pb2.ReactivateUserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserService/CreateUser',
+            grpc__build_dot_user__service__pb2.CreateUserRequest.SerializeToString,
+            grpc__build_dot_user__service__pb2.CreateUserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
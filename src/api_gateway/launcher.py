@@ -0,0 +1,118 @@
+import argparse
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+
+from lib import shared_state
+
+
+GATEWAY_WORKERS = int(os.environ.get("GATEWAY_WORKERS", os.cpu_count() or 1))
+# Workers crashing right after start are restarted not faster than this
+WORKER_RESTART_DELAY = float(os.environ.get("WORKER_RESTART_DELAY", "1"))
+LISTEN_BACKLOG = int(os.environ.get("LISTEN_BACKLOG", "2048"))
+
+
+def make_socket(host: str, port: int) -> socket.socket:
+    # Every worker has its own listening socket on the same port, kernel spreads connections
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(LISTEN_BACKLOG)
+    return sock
+
+
+def run_worker(worker_id: int, host: str, port: int, log_level: str):
+    # Signal handlers of the supervisor are inherited, uvicorn installs its own later
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    os.environ["GATEWAY_WORKER_ID"] = str(worker_id)
+    # Application is imported after fork, so gRPC channels and event loops are never shared
+    import uvicorn
+
+    sock = make_socket(host, port)
+    config = uvicorn.Config("main:app", lifespan="on", log_level=log_level)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def spawn_worker(worker_id: int, host: str, port: int, log_level: str) -> int:
+    pid = os.fork()
+    if pid == 0:
+        try:
+            run_worker(worker_id, host, port, log_level)
+        except BaseException:
+            traceback.print_exc()
+            os._exit(1)
+        os._exit(0)
+    return pid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run api gateway in several worker processes")
+    parser.add_argument("--host", default=os.environ.get("API_HOST", "localhost"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("API_PORT", 8000)))
+    parser.add_argument("--workers", type=int, default=GATEWAY_WORKERS)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    # Metrics of all workers are written to files and merged on /metrics,
+    # files of a previous run would be counted again
+    metrics_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if metrics_dir is None:
+        metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(
+            prefix="gateway_metrics_"
+        )
+    else:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir)
+    from prometheus_client import multiprocess
+
+    shared_state.create_shared_state()
+
+    workers: dict[int, int] = {}
+    started: dict[int, float] = {}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    try:
+        for worker_id in range(args.workers):
+            workers[spawn_worker(worker_id, args.host, args.port, args.log_level)] = worker_id
+            started[worker_id] = time.monotonic()
+
+        while workers:
+            pid, status = os.wait()
+            worker_id = workers.pop(pid, None)
+            if worker_id is None:
+                continue
+            multiprocess.mark_process_dead(pid)
+            if stopping:
+                continue
+
+            print(f"Gateway worker {worker_id} exited with status {status}, restarting")
+            delay = WORKER_RESTART_DELAY - (time.monotonic() - started[worker_id])
+            if delay > 0:
+                time.sleep(delay)
+            if not stopping:
+                workers[spawn_worker(worker_id, args.host, args.port, args.log_level)] = worker_id
+                started[worker_id] = time.monotonic()
+    finally:
+        shared_state.close_shared_state()
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
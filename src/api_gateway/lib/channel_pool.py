@@ -0,0 +1,374 @@
+import asyncio
+import functools
+import os
+import socket
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import grpc
+
+
+GRPC_SUBCHANNELS = int(os.environ.get("GRPC_SUBCHANNELS", "2"))
+GRPC_LB_POLICY = os.environ.get("GRPC_LB_POLICY", "round_robin")
+GRPC_HEALTH_CHECK_INTERVAL = float(os.environ.get("GRPC_HEALTH_CHECK_INTERVAL", "5"))
+GRPC_HEALTH_CHECK_TIMEOUT = float(os.environ.get("GRPC_HEALTH_CHECK_TIMEOUT", "1"))
+GRPC_DNS_REFRESH_INTERVAL = float(os.environ.get("GRPC_DNS_REFRESH_INTERVAL", "30"))
+GRPC_CLOSE_GRACE = float(os.environ.get("GRPC_CLOSE_GRACE", "5"))
+
+LB_ROUND_ROBIN = "round_robin"
+LB_LEAST_OUTSTANDING = "least_outstanding"
+
+# Endpoints used by attempts of one hedged call, later attempts go to other endpoints
+_attempt_endpoints: ContextVar[list[str] | None] = ContextVar("attempt_endpoints", default=None)
+
+
+@contextmanager
+def distinct_endpoints():
+    # Calls started inside go to endpoints not used by the previous ones while there are any
+    token = _attempt_endpoints.set([])
+    try:
+        yield
+    finally:
+        _attempt_endpoints.reset(token)
+
+
+class SubChannel:
+    def __init__(self, address: str):
+        self.address = address
+        # Local subchannel pool gives every sub-channel its own HTTP/2 connection
+        self.channel = grpc.aio.insecure_channel(
+            address, options=[("grpc.use_local_subchannel_pool", 1)]
+        )
+        self.outstanding = 0
+
+
+class Endpoint:
+    def __init__(self, address: str, subchannels_count: int):
+        self.address = address
+        self.subchannels = [SubChannel(address) for _ in range(subchannels_count)]
+        self.healthy = True
+
+    async def check_health(self, timeout: float) -> bool:
+        try:
+            await asyncio.gather(
+                *[
+                    asyncio.wait_for(subchannel.channel.channel_ready(), timeout)
+                    for subchannel in self.subchannels
+                ]
+            )
+            return True
+        except (asyncio.TimeoutError, grpc.RpcError):
+            return False
+
+    async def close(self, grace: float | None = None):
+        await asyncio.gather(
+            *[subchannel.channel.close(grace) for subchannel in self.subchannels]
+        )
+
+
+class PooledMultiCallable:
+    def __init__(
+        self,
+        pool: "ChannelPool",
+        kind: str,
+        method: str,
+        request_serializer,
+        response_deserializer,
+    ):
+        self._pool = pool
+        self._kind = kind
+        self._method = method
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+        self._callables = weakref.WeakKeyDictionary()
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    def for_subchannel(self, subchannel: SubChannel):
+        multicallable = self._callables.get(subchannel)
+        if multicallable is None:
+            multicallable = getattr(subchannel.channel, self._kind)(
+                self._method,
+                request_serializer=self._request_serializer,
+                response_deserializer=self._response_deserializer,
+            )
+            self._callables[subchannel] = multicallable
+        return multicallable
+
+
+class PooledUnaryUnaryMultiCallable(PooledMultiCallable):
+    def __call__(self, request, **kwargs):
+        return self._pool.invoke(self, request, kwargs)
+
+
+class PooledUnaryStreamMultiCallable(PooledMultiCallable):
+    def __call__(self, request, **kwargs):
+        return self._pool.invoke_stream(self, request, kwargs)
+
+
+class PooledStreamCall:
+    # Unary-stream call telling stream policies its outcome once it ends,
+    # callers read it with async for and cancel it, like the call of grpc.aio
+    def __init__(self, call, subchannel: SubChannel, releases: list):
+        self._call = call
+        self._responses = aiter(call)
+        self._subchannel = subchannel
+        self._releases = releases
+        # Services report their failures in the code field of stream messages
+        self._failed = False
+
+    def _finish(self, code: grpc.StatusCode):
+        if self._releases is None:
+            return
+        self._subchannel.outstanding -= 1
+        for release in reversed(self._releases):
+            release(code)
+        self._releases = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            resp = await anext(self._responses)
+        except StopAsyncIteration:
+            self._finish(grpc.StatusCode.INTERNAL if self._failed else grpc.StatusCode.OK)
+            raise
+        except grpc.RpcError as ex:
+            self._finish(ex.code())
+            raise
+        except BaseException:
+            self._finish(grpc.StatusCode.CANCELLED)
+            raise
+        if getattr(resp, "code", 0) >= 500:
+            self._failed = True
+        return resp
+
+    def cancel(self) -> bool:
+        cancelled = self._call.cancel()
+        self._finish(grpc.StatusCode.INTERNAL if self._failed else grpc.StatusCode.CANCELLED)
+        return cancelled
+
+    def __del__(self):
+        # Abandoned without reading it to the end, grpc cancels such calls too
+        self._finish(grpc.StatusCode.CANCELLED)
+
+
+class ChannelPool:
+    def __init__(
+        self,
+        addresses: list[str],
+        dns_discovery: bool = False,
+        subchannels_count: int = GRPC_SUBCHANNELS,
+        lb_policy: str = GRPC_LB_POLICY,
+    ):
+        if lb_policy not in (LB_ROUND_ROBIN, LB_LEAST_OUTSTANDING):
+            raise ValueError(f"Unknown load balancing policy {lb_policy}")
+
+        self._addresses = addresses
+        self._dns_discovery = dns_discovery
+        self._subchannels_count = subchannels_count
+        self._lb_policy = lb_policy
+        self._endpoints: dict[str, Endpoint] = {}
+        self._subchannels: list[SubChannel] = []
+        self._next = 0
+        self._maintenance_task: asyncio.Task | None = None
+        self._policies = []
+        self._stream_policies = []
+        self._call = self._send
+
+    @classmethod
+    def from_env(cls, service_name: str, default_port: int):
+        hosts = os.environ.get(f"{service_name}_SERVICE_HOSTS")
+        if hosts is not None:
+            addresses = [host.strip() for host in hosts.split(",") if host.strip()]
+        else:
+            addresses = [
+                f"{os.environ.get(f"{service_name}_SERVICE_HOST", "localhost")}:{os.environ.get(f"{service_name}_SERVICE_PORT", default_port)}"
+            ]
+
+        dns_discovery = os.environ.get(f"{service_name}_SERVICE_DNS_DISCOVERY") == "1"
+
+        return cls(addresses, dns_discovery=dns_discovery)
+
+    async def _resolve(self) -> set[str]:
+        if not self._dns_discovery:
+            return set(self._addresses)
+
+        loop = asyncio.get_running_loop()
+        resolved = set()
+        for address in self._addresses:
+            host, port = address.rsplit(":", 1)
+            try:
+                infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except socket.gaierror:
+                continue
+            for family, _, _, _, sockaddr in infos:
+                if family == socket.AF_INET6:
+                    resolved.add(f"[{sockaddr[0]}]:{sockaddr[1]}")
+                else:
+                    resolved.add(f"{sockaddr[0]}:{sockaddr[1]}")
+        return resolved
+
+    async def _update_endpoints(self):
+        addresses = await self._resolve()
+        if not addresses:
+            # Keep serving the last known endpoints while DNS is unavailable
+            if self._endpoints:
+                return
+            addresses = set(self._addresses)
+
+        for address in addresses - self._endpoints.keys():
+            self._endpoints[address] = Endpoint(address, self._subchannels_count)
+
+        removed = [
+            self._endpoints.pop(address)
+            for address in self._endpoints.keys() - addresses
+        ]
+        self._rebuild()
+
+        for endpoint in removed:
+            asyncio.create_task(endpoint.close(GRPC_CLOSE_GRACE))
+
+    async def _check_health(self):
+        endpoints = list(self._endpoints.values())
+        results = await asyncio.gather(
+            *[endpoint.check_health(GRPC_HEALTH_CHECK_TIMEOUT) for endpoint in endpoints]
+        )
+        changed = False
+        for endpoint, healthy in zip(endpoints, results):
+            if endpoint.healthy != healthy:
+                endpoint.healthy = healthy
+                changed = True
+        if changed:
+            self._rebuild()
+
+    def _rebuild(self):
+        self._subchannels = [
+            subchannel
+            for endpoint in self._endpoints.values()
+            if endpoint.healthy
+            for subchannel in endpoint.subchannels
+        ]
+
+    async def _maintain(self):
+        loop = asyncio.get_running_loop()
+        next_resolve = loop.time() + GRPC_DNS_REFRESH_INTERVAL
+        while True:
+            await asyncio.sleep(GRPC_HEALTH_CHECK_INTERVAL)
+            try:
+                if self._dns_discovery and loop.time() >= next_resolve:
+                    next_resolve = loop.time() + GRPC_DNS_REFRESH_INTERVAL
+                    await self._update_endpoints()
+                await self._check_health()
+            except Exception as ex:
+                print(f"Channel pool maintenance failed : {ex}")
+
+    async def start(self):
+        await self._update_endpoints()
+        self._maintenance_task = asyncio.create_task(self._maintain())
+
+    async def close(self, grace: float | None = None):
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        await asyncio.gather(
+            *[endpoint.close(grace) for endpoint in self._endpoints.values()]
+        )
+        self._endpoints = {}
+        self._subchannels = []
+
+    def pick(self, avoid: list[str] | None = None) -> SubChannel:
+        subchannels = self._subchannels
+        if not subchannels:
+            # Every endpoint failed its health check, let gRPC report the real error
+            subchannels = [
+                subchannel
+                for endpoint in self._endpoints.values()
+                for subchannel in endpoint.subchannels
+            ]
+        if avoid:
+            # Falls back to used endpoints when there are no others
+            subchannels = [
+                subchannel for subchannel in subchannels if subchannel.address not in avoid
+            ] or subchannels
+
+        start = self._next % len(subchannels)
+        self._next += 1
+
+        if self._lb_policy == LB_ROUND_ROBIN:
+            return subchannels[start]
+
+        best = subchannels[start]
+        for subchannel in subchannels[start + 1 :] + subchannels[:start]:
+            if subchannel.outstanding < best.outstanding:
+                best = subchannel
+        return best
+
+    def add_policy(self, policy):
+        # Policies wrap every unary call: policy(multicallable, request, kwargs, call_next).
+        # Policies with start_stream(multicallable) also admit unary-stream calls, it returns
+        # release(code) called with the status the stream ended with.
+        self._policies.append(policy)
+        if hasattr(policy, "start_stream"):
+            self._stream_policies.append(policy)
+        call = self._send
+        for policy in reversed(self._policies):
+            call = functools.partial(policy, call_next=call)
+        self._call = call
+
+    def invoke(self, multicallable: PooledMultiCallable, request, kwargs: dict):
+        return self._call(multicallable, request, kwargs)
+
+    def invoke_stream(self, multicallable: PooledMultiCallable, request, kwargs: dict):
+        releases = []
+        try:
+            for policy in self._stream_policies:
+                releases.append(policy.start_stream(multicallable))
+        except BaseException:
+            # Stream was rejected, admissions taken by earlier policies are given back
+            for release in reversed(releases):
+                release(grpc.StatusCode.CANCELLED)
+            raise
+
+        subchannel = self.pick()
+        subchannel.outstanding += 1
+        return PooledStreamCall(
+            multicallable.for_subchannel(subchannel)(request, **kwargs), subchannel, releases
+        )
+
+    async def _send(self, multicallable: PooledMultiCallable, request, kwargs: dict):
+        used_endpoints = _attempt_endpoints.get()
+        subchannel = self.pick(used_endpoints)
+        if used_endpoints is not None:
+            used_endpoints.append(subchannel.address)
+        subchannel.outstanding += 1
+        try:
+            return await multicallable.for_subchannel(subchannel)(request, **kwargs)
+        finally:
+            subchannel.outstanding -= 1
+
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer=None,
+        response_deserializer=None,
+        _registered_method: bool = False,
+    ):
+        return PooledUnaryUnaryMultiCallable(
+            self, "unary_unary", method, request_serializer, response_deserializer
+        )
+
+    def unary_stream(
+        self,
+        method: str,
+        request_serializer=None,
+        response_deserializer=None,
+        _registered_method: bool = False,
+    ):
+        return PooledUnaryStreamMultiCallable(
+            self, "unary_stream", method, request_serializer, response_deserializer
+        )
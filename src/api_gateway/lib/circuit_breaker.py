@@ -0,0 +1,232 @@
+import math
+import os
+import time
+
+import grpc
+from prometheus_client import Counter, Gauge
+
+
+BREAKER_WINDOW = float(os.environ.get("BREAKER_WINDOW", "10"))
+BREAKER_WINDOW_BUCKETS = int(os.environ.get("BREAKER_WINDOW_BUCKETS", "10"))
+# Rates are not trusted until the window saw that many calls
+BREAKER_MIN_CALLS = int(os.environ.get("BREAKER_MIN_CALLS", "20"))
+BREAKER_ERROR_RATE = float(os.environ.get("BREAKER_ERROR_RATE", "0.5"))
+BREAKER_SLOW_CALL_DURATION = float(os.environ.get("BREAKER_SLOW_CALL_DURATION", "2"))
+BREAKER_SLOW_CALL_RATE = float(os.environ.get("BREAKER_SLOW_CALL_RATE", "0.8"))
+BREAKER_OPEN_DURATION = float(os.environ.get("BREAKER_OPEN_DURATION", "5"))
+# Calls let through after the open period, all of them must succeed to close the circuit
+BREAKER_HALF_OPEN_PROBES = int(os.environ.get("BREAKER_HALF_OPEN_PROBES", "5"))
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Statuses telling that the backend itself is in trouble, the rest are caller errors
+FAILURE_CODES = (
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.UNKNOWN,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+
+CIRCUIT_STATE = Gauge(
+    "gateway_circuit_state",
+    "Circuit breaker state of a backend: 0 closed, 1 half open, 2 open",
+    ["backend"],
+    multiprocess_mode="livemax",
+)
+CIRCUIT_REJECTED_CALLS = Counter(
+    "gateway_circuit_rejected_calls_total",
+    "Backend calls failed fast by an open circuit",
+    ["backend"],
+)
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SlidingWindow:
+    # Calls, failures and slow calls counted in time buckets covering the window
+    def __init__(self, window: float, buckets: int):
+        self._bucket_duration = window / buckets
+        self._counts = [[0, 0, 0] for _ in range(buckets)]
+        self._epochs = [-1] * buckets
+
+    def add(self, failed: bool, slow: bool, now: float):
+        epoch = int(now / self._bucket_duration)
+        index = epoch % len(self._counts)
+        counts = self._counts[index]
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            counts[0] = counts[1] = counts[2] = 0
+        counts[0] += 1
+        counts[1] += failed
+        counts[2] += slow
+
+    def totals(self, now: float) -> tuple[int, int, int]:
+        epoch = int(now / self._bucket_duration)
+        calls = failures = slow = 0
+        for bucket_epoch, counts in zip(self._epochs, self._counts):
+            if epoch - bucket_epoch < len(self._counts):
+                calls += counts[0]
+                failures += counts[1]
+                slow += counts[2]
+        return calls, failures, slow
+
+    def reset(self):
+        self._epochs = [-1] * len(self._epochs)
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        window: float = BREAKER_WINDOW,
+        window_buckets: int = BREAKER_WINDOW_BUCKETS,
+        min_calls: int = BREAKER_MIN_CALLS,
+        error_rate: float = BREAKER_ERROR_RATE,
+        slow_call_duration: float = BREAKER_SLOW_CALL_DURATION,
+        slow_call_rate: float = BREAKER_SLOW_CALL_RATE,
+        open_duration: float = BREAKER_OPEN_DURATION,
+        half_open_probes: int = BREAKER_HALF_OPEN_PROBES,
+        on_state_change=None,
+    ):
+        self._window = SlidingWindow(window, window_buckets)
+        self._min_calls = min_calls
+        self._error_rate = error_rate
+        self.slow_call_duration = slow_call_duration
+        self._slow_call_rate = slow_call_rate
+        self._open_duration = open_duration
+        self._half_open_probes = half_open_probes
+        self._on_state_change = on_state_change
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+
+    def _set_state(self, state: str):
+        self.state = state
+        if self._on_state_change is not None:
+            self._on_state_change(state)
+
+    def _open(self, now: float):
+        self._opened_at = now
+        self._set_state(OPEN)
+
+    def retry_after(self, now: float) -> float:
+        return max(0.0, self._opened_at + self._open_duration - now)
+
+    def try_acquire(self, now: float) -> str | None:
+        # Returns the state the call was admitted in, None when it has to fail fast
+        if self.state == OPEN:
+            if now < self._opened_at + self._open_duration:
+                return None
+            self._probes_started = 0
+            self._probes_succeeded = 0
+            self._set_state(HALF_OPEN)
+
+        if self.state == HALF_OPEN:
+            if self._probes_started >= self._half_open_probes:
+                return None
+            self._probes_started += 1
+        return self.state
+
+    def release(self, admitted_in: str, failed: bool | None, duration: float, now: float):
+        # failed is None for outcomes saying nothing about backend health
+        slow = duration >= self.slow_call_duration
+        if admitted_in == HALF_OPEN:
+            if self.state != HALF_OPEN:
+                return
+            if failed is None:
+                # Probe slot is given back for another call
+                self._probes_started -= 1
+            elif failed or slow:
+                self._open(now)
+            else:
+                self._probes_succeeded += 1
+                if self._probes_succeeded >= self._half_open_probes:
+                    self._window.reset()
+                    self._set_state(CLOSED)
+            return
+
+        # Calls started before the circuit opened say nothing about the recovery
+        if failed is None or self.state != CLOSED:
+            return
+        self._window.add(failed, slow, now)
+        calls, failures, slow_calls = self._window.totals(now)
+        if calls >= self._min_calls and (
+            failures >= calls * self._error_rate or slow_calls >= calls * self._slow_call_rate
+        ):
+            self._open(now)
+
+    def stats(self, now: float) -> dict:
+        calls, failures, slow_calls = self._window.totals(now)
+        return {
+            "state": self.state,
+            "calls": calls,
+            "failures": failures,
+            "slow_calls": slow_calls,
+        }
+
+
+class CircuitBreakerPolicy:
+    def __init__(self, backend: str, breaker: CircuitBreaker | None = None):
+        self._backend = backend
+        state = CIRCUIT_STATE.labels(backend)
+        state.set(STATE_VALUES[CLOSED])
+        self._breaker = (
+            breaker
+            if breaker is not None
+            else CircuitBreaker(on_state_change=lambda value: state.set(STATE_VALUES[value]))
+        )
+        self._rejected = CIRCUIT_REJECTED_CALLS.labels(backend)
+
+    async def __call__(self, multicallable, request, kwargs: dict, call_next):
+        start = time.monotonic()
+        admitted_in = self._breaker.try_acquire(start)
+        if admitted_in is None:
+            self._rejected.inc()
+            raise CircuitOpenError(
+                f"{self._backend} service is unavailable",
+                math.ceil(self._breaker.retry_after(start)) or 1,
+            )
+
+        # Shed or cancelled calls never reached the backend and are not counted
+        failed = None
+        try:
+            result = await call_next(multicallable, request, kwargs)
+            # Services report their failures in the code field of a successful call
+            failed = getattr(result, "code", 0) >= 500
+            return result
+        except grpc.RpcError as ex:
+            failed = ex.code() in FAILURE_CODES
+            raise
+        finally:
+            now = time.monotonic()
+            self._breaker.release(admitted_in, failed, now - start, now)
+
+    def start_stream(self, multicallable):
+        now = time.monotonic()
+        admitted_in = self._breaker.try_acquire(now)
+        if admitted_in is None:
+            self._rejected.inc()
+            raise CircuitOpenError(
+                f"{self._backend} service is unavailable",
+                math.ceil(self._breaker.retry_after(now)) or 1,
+            )
+
+        def release(code: grpc.StatusCode):
+            # Streams last as long as their caller reads, so they are never slow calls.
+            # Cancelled streams were ended by the caller and say nothing about the backend
+            failed = None if code == grpc.StatusCode.CANCELLED else code in FAILURE_CODES
+            self._breaker.release(admitted_in, failed, 0.0, time.monotonic())
+
+        return release
+
+    def stats(self) -> dict:
+        return self._breaker.stats(time.monotonic())
@@ -0,0 +1,213 @@
+import asyncio
+import os
+import zlib
+
+import brotli
+import zstandard
+from starlette.datastructures import MutableHeaders
+
+from lib.http_tools import get_header
+
+
+# Smaller responses fit a few packets anyway, compressing them only adds latency
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+# Low levels keep most of the ratio on repetitive JSON at a fraction of the cpu time
+COMPRESSION_GZIP_LEVEL = int(os.environ.get("COMPRESSION_GZIP_LEVEL", "4"))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get("COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_ZSTD_LEVEL = int(os.environ.get("COMPRESSION_ZSTD_LEVEL", "3"))
+# Larger bodies are compressed in a thread, compressors release the GIL
+COMPRESSION_THREAD_SIZE = int(os.environ.get("COMPRESSION_THREAD_SIZE", "262144"))
+# Server preference between encodings the client accepts with the same weight
+COMPRESSION_ENCODINGS = os.environ.get("COMPRESSION_ENCODINGS", "zstd,br,gzip")
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+class GzipCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(
+            level=COMPRESSION_ZSTD_LEVEL
+        ).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+COMPRESSORS = {"gzip": GzipCompressor, "br": BrotliCompressor, "zstd": ZstdCompressor}
+
+
+def parse_accept_encoding(value: str) -> dict[str, float]:
+    weights = {}
+    for item in value.split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, param_value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    weight = float(param_value)
+                except ValueError:
+                    weight = 0.0
+        if name.strip():
+            weights[name.strip().lower()] = weight
+    return weights
+
+
+class EncodingSelector:
+    # Browsers send a handful of distinct headers, so choices are cached by header value
+    MAX_CACHED = 1024
+
+    def __init__(self, encodings: str = COMPRESSION_ENCODINGS):
+        self._encodings = [
+            encoding.strip() for encoding in encodings.split(",") if encoding.strip()
+        ]
+        self._cache: dict[str, str | None] = {}
+
+    def select(self, accept_encoding: str) -> str | None:
+        if accept_encoding in self._cache:
+            return self._cache[accept_encoding]
+
+        weights = parse_accept_encoding(accept_encoding)
+        selected = None
+        selected_weight = 0.0
+        for encoding in self._encodings:
+            weight = weights.get(encoding, weights.get("*", 0.0))
+            if weight > selected_weight:
+                selected, selected_weight = encoding, weight
+
+        if len(self._cache) >= self.MAX_CACHED:
+            self._cache.clear()
+        self._cache[accept_encoding] = selected
+        return selected
+
+
+def weaken_etag(headers: MutableHeaders):
+    # A strong ETag names one exact byte sequence, encoded and identity bodies differ,
+    # so the version is sent as weak. If-None-Match compares versions ignoring W/.
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["etag"] = f"W/{etag}"
+
+
+def compress_body(encoding: str, body: bytes) -> bytes:
+    compressor = COMPRESSORS[encoding]()
+    return compressor.compress(body) + compressor.finish()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        encodings: str = COMPRESSION_ENCODINGS,
+    ):
+        self.app = app
+        self._minimum_size = minimum_size
+        self._selector = EncodingSelector(encodings)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            return await self.app(scope, receive, send)
+
+        accept_encoding = get_header(scope, b"accept-encoding")
+        encoding = self._selector.select(accept_encoding) if accept_encoding else None
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        start_message = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                # Encoding is decided by the first body chunk
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is not None:
+                data = compressor.compress(body)
+                data += compressor.flush() if more_body else compressor.finish()
+                return await send(
+                    {"type": "http.response.body", "body": data, "more_body": more_body}
+                )
+
+            headers = MutableHeaders(scope=start_message)
+            content_type = headers.get("content-type", "")
+            if (
+                start_message["status"] in (204, 304)
+                or "content-encoding" in headers
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            ):
+                if start_message["status"] == 304:
+                    # Same validator as the possibly compressed 200 would carry
+                    weaken_etag(headers)
+                passthrough = True
+                await send(start_message)
+                return await send(message)
+
+            headers.add_vary_header("Accept-Encoding")
+            weaken_etag(headers)
+            if more_body:
+                # Streamed responses are flushed chunk by chunk, so every line reaches the
+                # client as soon as the backend produced it
+                compressor = COMPRESSORS[encoding]()
+                del headers["content-length"]
+                headers["content-encoding"] = encoding
+                await send(start_message)
+                data = compressor.compress(body) + compressor.flush()
+                return await send(
+                    {"type": "http.response.body", "body": data, "more_body": True}
+                )
+
+            passthrough = True
+            if len(body) >= self._minimum_size:
+                if len(body) >= COMPRESSION_THREAD_SIZE:
+                    body = await asyncio.to_thread(compress_body, encoding, body)
+                else:
+                    body = compress_body(encoding, body)
+                headers["content-encoding"] = encoding
+                headers["content-length"] = str(len(body))
+                message = {"type": "http.response.body", "body": body}
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
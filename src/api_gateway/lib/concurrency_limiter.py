@@ -0,0 +1,198 @@
+import os
+import time
+from contextvars import ContextVar
+
+import grpc
+from fastapi import Depends
+from prometheus_client import Counter
+
+
+LIMITER_INITIAL_LIMIT = float(os.environ.get("LIMITER_INITIAL_LIMIT", "20"))
+LIMITER_MIN_LIMIT = float(os.environ.get("LIMITER_MIN_LIMIT", "2"))
+LIMITER_MAX_LIMIT = float(os.environ.get("LIMITER_MAX_LIMIT", "500"))
+# Calls slower than tolerance * minimum latency of their method mean queueing in the backend
+LIMITER_RTT_TOLERANCE = float(os.environ.get("LIMITER_RTT_TOLERANCE", "2"))
+LIMITER_BACKOFF = float(os.environ.get("LIMITER_BACKOFF", "0.9"))
+LIMITER_MIN_RTT_WINDOW = float(os.environ.get("LIMITER_MIN_RTT_WINDOW", "30"))
+LIMITER_RETRY_AFTER = os.environ.get("LIMITER_RETRY_AFTER", "1")
+
+CRITICAL = "critical"
+DEFAULT = "default"
+BULK = "bulk"
+
+# Part of the backend limit every priority class may occupy
+PRIORITY_SHARES = {CRITICAL: 1.0, DEFAULT: 0.9, BULK: 0.5}
+
+# Permission checks guard every route, so they are never shed in favour of the route itself
+METHOD_PRIORITIES = {
+    "/account.AccountService/CheckPermissions": CRITICAL,
+    "/account.AccountService/CheckPermissionsBatch": CRITICAL,
+}
+
+# Feeds kept open for the whole life of the gateway would hold their slot forever
+UNLIMITED_STREAMS = {"/account.AccountService/WatchRevokedTokens"}
+
+OVERLOAD_CODES = (
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+
+SHED_CALLS = Counter(
+    "gateway_shed_calls_total",
+    "Backend calls rejected by the concurrency limiter",
+    ["backend", "priority"],
+)
+
+_priority: ContextVar[str] = ContextVar("priority", default=DEFAULT)
+
+
+class ConcurrencyLimitExceededError(Exception):
+    pass
+
+
+def request_priority(priority: str):
+    async def set_request_priority():
+        _priority.set(priority)
+
+    return Depends(set_request_priority)
+
+
+class MinRtt:
+    def __init__(self, window: float):
+        self._window = window
+        self.value: float | None = None
+        self._window_value: float | None = None
+        self._window_end = time.monotonic() + window
+
+    def update(self, rtt: float, now: float):
+        if self._window_value is None or rtt < self._window_value:
+            self._window_value = rtt
+        if self.value is None or rtt < self.value:
+            self.value = rtt
+
+        if now >= self._window_end:
+            # Forget old minimum, so the limiter follows backends that became slower for good
+            self.value = self._window_value
+            self._window_value = None
+            self._window_end = now + self._window
+
+
+class AdaptiveLimiter:
+    # AIMD on latency: grow by one per limit of fast calls, shrink on queueing or overload.
+    # Methods of one backend differ in cost, so every call is compared with its own method.
+    def __init__(
+        self,
+        initial_limit: float = LIMITER_INITIAL_LIMIT,
+        min_limit: float = LIMITER_MIN_LIMIT,
+        max_limit: float = LIMITER_MAX_LIMIT,
+        rtt_tolerance: float = LIMITER_RTT_TOLERANCE,
+        backoff: float = LIMITER_BACKOFF,
+        min_rtt_window: float = LIMITER_MIN_RTT_WINDOW,
+    ):
+        self._limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._rtt_tolerance = rtt_tolerance
+        self._backoff = backoff
+        self._min_rtt_window = min_rtt_window
+        self._in_flight = 0
+        self._min_rtts: dict[str, MinRtt] = {}
+        self._smoothed_ratio = 1.0
+        self._last_rtt = 0.0
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    def try_acquire(self, priority: str) -> bool:
+        if self._in_flight >= max(1.0, self._limit * PRIORITY_SHARES[priority]):
+            return False
+        self._in_flight += 1
+        return True
+
+    def _decrease(self, now: float):
+        # Calls started before the previous decrease still see the old queue, skip them
+        if now - self._last_decrease < self._last_rtt:
+            return
+        self._limit = max(self._min_limit, self._limit * self._backoff)
+        self._last_decrease = now
+
+    def release(self, method: str, rtt: float | None, overloaded: bool):
+        in_flight = self._in_flight
+        self._in_flight -= 1
+        now = time.monotonic()
+
+        if overloaded:
+            self._decrease(now)
+            return
+        if rtt is None:
+            return
+
+        min_rtt = self._min_rtts.get(method)
+        if min_rtt is None:
+            min_rtt = self._min_rtts[method] = MinRtt(self._min_rtt_window)
+        min_rtt.update(rtt, now)
+
+        self._last_rtt = rtt
+        self._smoothed_ratio += (rtt / min_rtt.value - self._smoothed_ratio) * 0.1
+
+        if self._smoothed_ratio > self._rtt_tolerance:
+            self._decrease(now)
+        elif in_flight * 2 >= self._limit:
+            # Grow only while the limit is really in use
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+    def stats(self) -> dict:
+        return {
+            "limit": round(self._limit, 2),
+            "in_flight": self._in_flight,
+            "latency_ratio": round(self._smoothed_ratio, 2),
+        }
+
+
+class ConcurrencyLimitPolicy:
+    def __init__(self, backend: str, limiter: AdaptiveLimiter | None = None):
+        self._backend = backend
+        self._limiter = limiter if limiter is not None else AdaptiveLimiter()
+        self._shed_counters = {
+            priority: SHED_CALLS.labels(backend, priority) for priority in PRIORITY_SHARES
+        }
+
+    async def __call__(self, multicallable, request, kwargs: dict, call_next):
+        priority = METHOD_PRIORITIES.get(multicallable.method) or _priority.get()
+        if not self._limiter.try_acquire(priority):
+            self._shed_counters[priority].inc()
+            raise ConcurrencyLimitExceededError(f"{self._backend} service is overloaded")
+
+        rtt = None
+        overloaded = False
+        start = time.monotonic()
+        try:
+            result = await call_next(multicallable, request, kwargs)
+            rtt = time.monotonic() - start
+            return result
+        except grpc.RpcError as ex:
+            overloaded = ex.code() in OVERLOAD_CODES
+            raise
+        finally:
+            self._limiter.release(multicallable.method, rtt, overloaded)
+
+    def start_stream(self, multicallable):
+        # Streams hold their slot until they end, their duration is not a latency sample
+        if multicallable.method in UNLIMITED_STREAMS:
+            return lambda code: None
+
+        priority = METHOD_PRIORITIES.get(multicallable.method) or _priority.get()
+        if not self._limiter.try_acquire(priority):
+            self._shed_counters[priority].inc()
+            raise ConcurrencyLimitExceededError(f"{self._backend} service is overloaded")
+
+        def release(code: grpc.StatusCode):
+            self._limiter.release(multicallable.method, None, code in OVERLOAD_CODES)
+
+        return release
+
+    def stats(self) -> dict:
+        return self._limiter.stats()
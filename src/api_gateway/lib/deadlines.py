@@ -0,0 +1,92 @@
+import os
+import time
+from contextvars import ContextVar
+
+import grpc
+
+
+DEFAULT_ROUTE_BUDGET = float(os.environ.get("DEFAULT_ROUTE_BUDGET", "5"))
+# Comma separated "<METHOD> <route template>=<seconds>", for example
+# "GET /api/v1/user/{user_id}=1,POST /api/v1/account/token=2"
+ROUTE_BUDGETS = os.environ.get("ROUTE_BUDGETS", "")
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+def parse_route_budgets(value: str) -> dict[tuple[str, str], float]:
+    budgets = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        route, _, seconds = item.rpartition("=")
+        method, _, path = route.strip().partition(" ")
+        budgets[(method.upper(), path.strip())] = float(seconds)
+    return budgets
+
+
+class RequestDeadline:
+    __slots__ = ("_scope", "_start", "_budgets", "_deadline")
+
+    def __init__(self, scope, budgets: dict[tuple[str, str], float]):
+        self._scope = scope
+        self._start = time.monotonic()
+        self._budgets = budgets
+        self._deadline: float | None = None
+
+    def remaining(self) -> float:
+        if self._deadline is None:
+            # Matched route is known only after routing, so the budget is resolved on first use
+            route = self._scope.get("route")
+            budget = DEFAULT_ROUTE_BUDGET
+            if route is not None:
+                budget = self._budgets.get(
+                    (self._scope["method"], route.path), DEFAULT_ROUTE_BUDGET
+                )
+            self._deadline = self._start + budget
+        return self._deadline - time.monotonic()
+
+
+_request_deadline: ContextVar[RequestDeadline | None] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+def remaining_time() -> float | None:
+    # Time left for the current request, None outside of a request
+    deadline = _request_deadline.get()
+    return deadline.remaining() if deadline is not None else None
+
+
+class DeadlineMiddleware:
+    def __init__(self, app, route_budgets: str = ROUTE_BUDGETS):
+        self.app = app
+        self._budgets = parse_route_budgets(route_budgets)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        token = _request_deadline.set(RequestDeadline(scope, self._budgets))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_deadline.reset(token)
+
+
+class DeadlinePolicy:
+    async def __call__(self, multicallable, request, kwargs: dict, call_next):
+        deadline = _request_deadline.get()
+        if deadline is not None and kwargs.get("timeout") is None:
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                raise DeadlineExceededError(f"No time left to call {multicallable.method}")
+            kwargs = {**kwargs, "timeout": remaining}
+
+        try:
+            return await call_next(multicallable, request, kwargs)
+        except grpc.RpcError as ex:
+            if ex.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                raise DeadlineExceededError(f"{multicallable.method} timed out") from ex
+            raise
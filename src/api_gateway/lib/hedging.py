@@ -0,0 +1,164 @@
+import asyncio
+import os
+import time
+from collections import deque
+
+from prometheus_client import Counter
+
+from lib.channel_pool import distinct_endpoints
+from lib.retries import RETRY_METHODS, RetryBudget
+
+
+# Point reads with tail latency dominated by slow replicas, must be idempotent (see RETRY_METHODS)
+HEDGE_METHODS = os.environ.get(
+    "HEDGE_METHODS",
+    "/user.UserService/GetUserData,/cargo.CargoService/GetCargo,/delivery.DeliveryService/GetDelivery",
+)
+# Second copy is sent when the first did not answer within this latency percentile of the method
+HEDGE_PERCENTILE = float(os.environ.get("HEDGE_PERCENTILE", "0.95"))
+HEDGE_MIN_DELAY = float(os.environ.get("HEDGE_MIN_DELAY", "0.005"))
+# Latencies the percentile is computed over, no hedging before that many calls were seen
+HEDGE_SAMPLES = int(os.environ.get("HEDGE_SAMPLES", "1000"))
+HEDGE_MIN_SAMPLES = int(os.environ.get("HEDGE_MIN_SAMPLES", "100"))
+# Every call earns that part of a hedge, so hedges add at most 5% to the backend load
+HEDGE_BUDGET_RATIO = float(os.environ.get("HEDGE_BUDGET_RATIO", "0.05"))
+HEDGE_BUDGET_MAX = float(os.environ.get("HEDGE_BUDGET_MAX", "10"))
+
+# Percentile is recomputed after that many new samples, sorting on every call is too slow
+RECOMPUTE_INTERVAL = 50
+
+HEDGES = Counter(
+    "gateway_hedges_total",
+    "Hedged backend calls by which copy answered first, budget_exhausted counts refused hedges",
+    ["backend", "result"],
+)
+
+
+class LatencyPercentile:
+    def __init__(
+        self,
+        percentile: float = HEDGE_PERCENTILE,
+        samples: int = HEDGE_SAMPLES,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+    ):
+        self._percentile = percentile
+        self._samples: deque[float] = deque(maxlen=samples)
+        self._min_samples = min_samples
+        self._since_recompute = 0
+        self.value: float | None = None
+
+    def add(self, latency: float):
+        self._samples.append(latency)
+        self._since_recompute += 1
+        if self._since_recompute >= RECOMPUTE_INTERVAL and len(self._samples) >= self._min_samples:
+            self._since_recompute = 0
+            ordered = sorted(self._samples)
+            self.value = ordered[min(len(ordered) - 1, int(len(ordered) * self._percentile))]
+
+
+class HedgingPolicy:
+    def __init__(
+        self,
+        backend: str,
+        methods: set[str] | None = None,
+        budget: RetryBudget | None = None,
+        min_delay: float = HEDGE_MIN_DELAY,
+    ):
+        if methods is None:
+            methods = {method for method in HEDGE_METHODS.split(",") if method}
+        # Sending a write twice could apply it twice
+        self._methods = methods & {method for method in RETRY_METHODS.split(",") if method}
+        self._budget = (
+            budget if budget is not None else RetryBudget(HEDGE_BUDGET_RATIO, HEDGE_BUDGET_MAX)
+        )
+        self._min_delay = min_delay
+        self._latencies: dict[str, LatencyPercentile] = {}
+        self._calls = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._won = HEDGES.labels(backend, "hedge_won")
+        self._lost = HEDGES.labels(backend, "hedge_lost")
+        self._exhausted = HEDGES.labels(backend, "budget_exhausted")
+
+    async def __call__(self, multicallable, request, kwargs: dict, call_next):
+        method = multicallable.method
+        if method not in self._methods:
+            return await call_next(multicallable, request, kwargs)
+
+        latencies = self._latencies.get(method)
+        if latencies is None:
+            latencies = self._latencies[method] = LatencyPercentile()
+        self._calls += 1
+        self._budget.deposit()
+        start = time.monotonic()
+
+        if latencies.value is None:
+            result = await call_next(multicallable, request, kwargs)
+            latencies.add(time.monotonic() - start)
+            return result
+
+        with distinct_endpoints():
+            attempts = [asyncio.ensure_future(call_next(multicallable, request, kwargs))]
+            starts = [start]
+            try:
+                done, _ = await asyncio.wait(
+                    attempts, timeout=max(self._min_delay, latencies.value)
+                )
+                if not done:
+                    if self._budget.try_withdraw():
+                        self._hedged += 1
+                        attempts.append(
+                            asyncio.ensure_future(call_next(multicallable, request, kwargs))
+                        )
+                        starts.append(time.monotonic())
+                    else:
+                        self._exhausted.inc()
+                return await self._first_response(attempts, starts, latencies)
+            finally:
+                for attempt in attempts:
+                    if not attempt.done():
+                        attempt.cancel()
+
+    async def _first_response(self, attempts: list, starts: list, latencies: LatencyPercentile):
+        # First copy answering wins, a failed copy still waits for the other one
+        pending = set(attempts)
+        failure = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = None
+            for attempt, attempt_start in zip(attempts, starts):
+                if attempt not in done:
+                    continue
+                if attempt.exception() is not None:
+                    failure = failure or attempt
+                    continue
+                # Every answer is a latency sample, not only the winning one
+                latencies.add(time.monotonic() - attempt_start)
+                # Server error answers are failures as well, the other copy may still succeed
+                if getattr(attempt.result(), "code", 0) >= 500:
+                    failure = failure or attempt
+                    continue
+                winner = winner or attempt
+            if winner is not None:
+                if len(attempts) > 1:
+                    if winner is attempts[1]:
+                        self._hedge_wins += 1
+                        self._won.inc()
+                    else:
+                        self._lost.inc()
+                return winner.result()
+        return failure.result()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self._calls,
+            "hedged": self._hedged,
+            "hedge_rate": round(self._hedged / self._calls, 4) if self._calls else 0.0,
+            "win_rate": round(self._hedge_wins / self._hedged, 4) if self._hedged else 0.0,
+            "delays": {
+                method: round(latencies.value, 4)
+                for method, latencies in self._latencies.items()
+                if latencies.value is not None
+            },
+            "budget": round(self._budget.tokens, 2),
+        }
@@ -1,4 +1,13 @@
-from fastapi import HTTPException
+from datetime import timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import HTTPException, Request
+from google.protobuf.message import Message
+from google.protobuf.timestamp_pb2 import Timestamp
+
+
+# If-None-Match: * matches any existing version of the resource
+ANY_VERSION = Timestamp(seconds=253402300799)
 
 
 def make_http_error(resp):
@@ -7,3 +16,68 @@ def make_http_error(resp):
         detail=resp.message,
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def get_header(scope, name: bytes) -> str | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def make_etag(updated_at: Timestamp) -> str:
+    return f'"{updated_at.seconds:x}.{updated_at.nanos:x}"'
+
+
+def parse_etag(etag: str) -> Timestamp | None:
+    try:
+        seconds, nanos = etag.strip().removeprefix("W/").strip('"').split(".")
+        return Timestamp(seconds=int(seconds, 16), nanos=int(nanos, 16))
+    except ValueError:
+        return None
+
+
+def get_known_versions(request: Request) -> dict:
+    # Fields of the Get request: the service answers 304 only on an exact version match
+    # for If-None-Match and for every version not after the date of If-Modified-Since
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return {"known_updated_at": ANY_VERSION}
+
+        known_versions = [
+            version
+            for version in map(parse_etag, if_none_match.split(","))
+            if version is not None
+        ]
+        return {"known_versions": known_versions} if known_versions else {}
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return {}
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        # Last-Modified is truncated to seconds, so the whole second is not modified
+        known_updated_at = Timestamp()
+        known_updated_at.FromDatetime(
+            since + timedelta(seconds=1) - timedelta(microseconds=1)
+        )
+        return {"known_updated_at": known_updated_at}
+
+    return {}
+
+
+def make_validators(message: Message) -> dict[str, str]:
+    if not message.HasField("updated_at"):
+        return {}
+
+    return {
+        "ETag": make_etag(message.updated_at),
+        "Last-Modified": format_datetime(
+            message.updated_at.ToDatetime(tzinfo=timezone.utc), usegmt=True
+        ),
+    }
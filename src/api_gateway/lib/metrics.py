@@ -0,0 +1,158 @@
+import asyncio
+import os
+import time
+
+import grpc
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "gateway_http_request_duration_seconds",
+    "Time from receiving a request to sending the last response byte",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "gateway_http_response_size_bytes",
+    "Response body size",
+    ["method", "route", "status"],
+    buckets=SIZE_BUCKETS,
+)
+# Gauges of launcher workers are summed, dead workers are dropped
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "gateway_http_requests_in_flight",
+    "Requests currently being served",
+    multiprocess_mode="livesum",
+)
+GRPC_CALL_DURATION = Histogram(
+    "gateway_grpc_call_duration_seconds",
+    "Latency of unary calls to backend services",
+    ["method", "code"],
+    buckets=LATENCY_BUCKETS,
+)
+GRPC_CALLS_IN_FLIGHT = Gauge(
+    "gateway_grpc_calls_in_flight",
+    "Unary calls to backend services currently waiting for a response",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+
+class LabelCache:
+    # labels() builds a dict and takes a lock, so children are resolved once per label set
+    def __init__(self, *metrics):
+        self._metrics = metrics
+        self._children: dict[tuple, tuple] = {}
+
+    def get(self, key: tuple) -> tuple:
+        children = self._children.get(key)
+        if children is None:
+            children = tuple(metric.labels(*key) for metric in self._metrics)
+            self._children[key] = children
+        return children
+
+
+def short_method_name(method: str) -> str:
+    # /user.UserService/GetUserData -> UserService/GetUserData
+    service, _, name = method.lstrip("/").partition("/")
+    return f"{service.rpartition(".")[2]}/{name}"
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+        self._children = LabelCache(HTTP_REQUEST_DURATION, HTTP_RESPONSE_SIZE)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            elif message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # Router stores the matched route in the shared scope
+            route = scope.get("route")
+            duration, response_size = self._children.get(
+                (
+                    scope["method"],
+                    route.path if route is not None else UNMATCHED_ROUTE,
+                    status,
+                )
+            )
+            duration.observe(time.perf_counter() - start)
+            response_size.observe(size)
+
+
+class MetricsPolicy:
+    def __init__(self):
+        self._in_flight: dict[str, Gauge] = {}
+        self._durations: dict[tuple, Histogram] = {}
+
+    def _get_in_flight(self, method: str) -> Gauge:
+        in_flight = self._in_flight.get(method)
+        if in_flight is None:
+            in_flight = GRPC_CALLS_IN_FLIGHT.labels(short_method_name(method))
+            self._in_flight[method] = in_flight
+        return in_flight
+
+    def _get_duration(self, method: str, code: grpc.StatusCode) -> Histogram:
+        duration = self._durations.get((method, code))
+        if duration is None:
+            duration = GRPC_CALL_DURATION.labels(short_method_name(method), code.name)
+            self._durations[(method, code)] = duration
+        return duration
+
+    async def __call__(self, multicallable, request, kwargs: dict, call_next):
+        method = multicallable.method
+        in_flight = self._get_in_flight(method)
+        code = grpc.StatusCode.OK
+        start = time.perf_counter()
+        in_flight.inc()
+        try:
+            return await call_next(multicallable, request, kwargs)
+        except grpc.RpcError as ex:
+            code = ex.code()
+            raise
+        except asyncio.CancelledError:
+            code = grpc.StatusCode.CANCELLED
+            raise
+        finally:
+            in_flight.dec()
+            self._get_duration(method, code).observe(time.perf_counter() - start)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Launcher workers write metrics to files, any worker reports all of them
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,43 @@
+from fastapi.responses import StreamingResponse
+
+from lib.http_tools import make_http_error
+from lib.proto_json import encode_ndjson
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class StreamInterruptedError(Exception):
+    pass
+
+
+async def stream_ndjson(call, get_items) -> StreamingResponse:
+    # Every stream message carries code, so errors before the first row still get a status
+    responses = aiter(call)
+    try:
+        first = await anext(responses, None)
+    except BaseException:
+        call.cancel()
+        raise
+
+    if first is not None and first.code != 200:
+        call.cancel()
+        make_http_error(first)
+
+    async def body():
+        try:
+            resp = first
+            while resp is not None:
+                if resp.code != 200:
+                    # Status is already sent, dropping the connection marks the export incomplete
+                    raise StreamInterruptedError(resp.message)
+
+                # Next message is read only after the client took the previous chunk
+                chunk = encode_ndjson(get_items(resp))
+                if chunk:
+                    yield chunk
+                resp = await anext(responses, None)
+        finally:
+            call.cancel()
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,228 @@
+import base64
+import json
+import os
+import time
+from json.encoder import encode_basestring
+
+from fastapi.responses import Response
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+from google.protobuf.message import Message
+
+
+# Responses match the api models rendered with response_model_exclude_unset=True:
+# fields the models build from ListFields() are left out when unset or default
+FAST_JSON_RESPONSES = os.environ.get("FAST_JSON_RESPONSES", "1") == "1"
+
+# Proto fields whose name differs from the field of the api response model
+FIELD_RENAMES = {
+    "cargo.CargoData": {"delivery_data": "delivery"},
+}
+
+# Proto fields in the order of the api response model fields, where the two differ
+FIELD_ORDER = {
+    "user.UserData": [
+        "id", "username", "first_name", "second_name", "patronymic",
+        "birth", "email", "phone", "groups", "updated_at",
+    ],
+    "cargo.CargoData": [
+        "id", "title", "type", "description", "creator_id",
+        "weight", "delivery_data", "updated_at",
+    ],
+    "delivery.DeliveryData": [
+        "id", "state", "priority", "sender_id", "receiver_id", "cargo_id",
+        "bill_id", "send_address_id", "receive_address_id", "updated_at",
+    ],
+}
+
+# Fields the api response models always set, even when the proto holds the default
+ALWAYS_SET = {
+    "cargo.CargoBatch": {"items", "missing_ids"},
+    "delivery.DeliveryBatch": {"items", "missing_ids"},
+    "payment.PaymentInfoData": {"delivery_id", "currency", "company_bank_account_hash"},
+}
+
+_plans: dict[str, list] = {}
+
+
+def _encode_string(value, parts: list):
+    parts.append(encode_basestring(value))
+
+
+def _encode_number(value, parts: list):
+    parts.append(str(value))
+
+
+def _encode_float(value, parts: list):
+    parts.append(repr(value) if value == value else "null")
+
+
+def _encode_bool(value, parts: list):
+    parts.append("true" if value else "false")
+
+
+def _encode_bytes(value, parts: list):
+    parts.append(f'"{base64.b64encode(value).decode()}"')
+
+
+def _encode_timestamp(value, parts: list):
+    # Same text as pydantic gives for the UTC datetime of Timestamp.ToDatetime()
+    t = time.gmtime(value.seconds)
+    text = (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    )
+    micros = value.nanos // 1000
+    parts.append(f'"{text}.{micros:06d}Z"' if micros else f'"{text}Z"')
+
+
+def _scalar_encoder(field: FieldDescriptor):
+    match field.type:
+        case FieldDescriptor.TYPE_STRING:
+            return _encode_string
+        case FieldDescriptor.TYPE_BOOL:
+            return _encode_bool
+        case FieldDescriptor.TYPE_BYTES:
+            return _encode_bytes
+        case FieldDescriptor.TYPE_DOUBLE | FieldDescriptor.TYPE_FLOAT:
+            return _encode_float
+        case FieldDescriptor.TYPE_ENUM:
+            enum_names = {
+                value.number: encode_basestring(value.name)
+                for value in field.enum_type.values
+            }
+            return lambda value, parts: parts.append(enum_names[value])
+        case _:
+            return _encode_number
+
+
+def _message_encoder(descriptor: Descriptor):
+    if descriptor.full_name == "google.protobuf.Timestamp":
+        return _encode_timestamp
+
+    def encode(value, parts: list):
+        _encode_message(value, _get_plan(descriptor), parts)
+
+    return encode
+
+
+def _repeated_encoder(encode_item):
+    def encode(values, parts: list):
+        parts.append("[")
+        for ind, value in enumerate(values):
+            if ind:
+                parts.append(",")
+            encode_item(value, parts)
+        parts.append("]")
+
+    return encode
+
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    # Recent protobuf releases replaced FieldDescriptor.label with is_repeated
+    if hasattr(field, "is_repeated"):
+        return field.is_repeated
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _get_plan(descriptor: Descriptor) -> list:
+    plan = _plans.get(descriptor.full_name)
+    if plan is not None:
+        return plan
+
+    renames = FIELD_RENAMES.get(descriptor.full_name, {})
+    always_set = ALWAYS_SET.get(descriptor.full_name, ())
+    order = FIELD_ORDER.get(descriptor.full_name)
+    if order is None:
+        fields = descriptor.fields
+    else:
+        fields = [descriptor.fields_by_name[name] for name in order]
+
+    plan = []
+    for field in fields:
+        if field.message_type is not None:
+            encoder = _message_encoder(field.message_type)
+        else:
+            encoder = _scalar_encoder(field)
+
+        is_repeated = _is_repeated(field)
+        if is_repeated:
+            encoder = _repeated_encoder(encoder)
+
+        key = encode_basestring(renames.get(field.name, field.name))
+        plan.append(
+            (
+                field.name,
+                f"{key}:",
+                f",{key}:",
+                not is_repeated and field.has_presence,
+                field.name in always_set,
+                encoder,
+            )
+        )
+
+    _plans[descriptor.full_name] = plan
+    return plan
+
+
+def _encode_message(message: Message, plan: list, parts: list):
+    parts.append("{")
+    first = True
+    for name, key, next_key, has_presence, always_set, encoder in plan:
+        if has_presence:
+            if not message.HasField(name):
+                continue
+            value = getattr(message, name)
+        else:
+            value = getattr(message, name)
+            # Default scalars and empty repeated fields are not in ListFields()
+            if not value and not always_set:
+                continue
+        parts.append(key if first else next_key)
+        first = False
+        encoder(value, parts)
+    parts.append("}")
+
+
+def _encode_document(document: dict, parts: list):
+    # Composite responses: messages of several backends next to plain JSON values
+    parts.append("{")
+    first = True
+    for key, value in document.items():
+        if not first:
+            parts.append(",")
+        first = False
+        parts.append(encode_basestring(key))
+        parts.append(":")
+        if isinstance(value, Message):
+            _encode_message(value, _get_plan(value.DESCRIPTOR), parts)
+        else:
+            parts.append(json.dumps(value, separators=(",", ":"), ensure_ascii=False))
+    parts.append("}")
+
+
+def encode_messages(content) -> bytes:
+    parts = []
+    if isinstance(content, Message):
+        _encode_message(content, _get_plan(content.DESCRIPTOR), parts)
+    elif isinstance(content, dict):
+        _encode_document(content, parts)
+    elif len(content):
+        _repeated_encoder(_message_encoder(content[0].DESCRIPTOR))(content, parts)
+    else:
+        parts.append("[]")
+    return "".join(parts).encode("utf-8")
+
+
+def encode_ndjson(messages) -> bytes:
+    parts = []
+    for message in messages:
+        _encode_message(message, _get_plan(message.DESCRIPTOR), parts)
+        parts.append("\n")
+    return "".join(parts).encode("utf-8")
+
+
+class ProtoJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return encode_messages(content)
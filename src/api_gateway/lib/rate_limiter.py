@@ -0,0 +1,250 @@
+import math
+import os
+import time
+
+import redis.asyncio
+from prometheus_client import Counter
+from starlette.routing import compile_path
+
+from lib.http_tools import get_header
+from lib.shared_state import get_shared_rate_limiter
+
+
+REDIS_URL = (
+    f"redis://"
+    f"{os.environ.get("REDIS_HOST", "localhost")}"
+    f":"
+    f"{os.environ.get("REDIS_PORT", "6379")}"
+)
+
+# "memory" keeps buckets in the gateway (shared memory of all launcher workers),
+# "redis" shares them between gateway replicas
+RATE_LIMIT_STORAGE = os.environ.get("RATE_LIMIT_STORAGE", "memory")
+RATE_LIMIT_REDIS_DB = os.environ.get("RATE_LIMIT_REDIS_DB", "1")
+# Comma separated "<METHOD> <route template> <ip|user|route>=<requests>/<seconds>"
+RATE_LIMITS = os.environ.get(
+    "RATE_LIMITS",
+    "POST /api/v1/account/token ip=10/60,"
+    "POST /api/v1/account/token route=200/1,"
+    "POST /api/v1/user/search_users user=5/1,"
+    "GET /api/v1/delivery/search user=5/1,"
+    "GET /api/v1/cargo/user_cargos user=5/1,"
+    "GET /api/v1/payment/search user=5/1",
+)
+# Take client address from X-Forwarded-For, only behind a proxy that sets it
+RATE_LIMIT_TRUST_FORWARDED = os.environ.get("RATE_LIMIT_TRUST_FORWARDED", "0") == "1"
+
+KEY_IP = "ip"
+KEY_USER = "user"
+KEY_ROUTE = "route"
+
+RATE_LIMITED_REQUESTS = Counter(
+    "gateway_rate_limited_requests_total",
+    "Requests rejected by the rate limiter",
+    ["route"],
+)
+
+
+class RateLimitRule:
+    def __init__(self, method: str, path: str, key: str, requests: float, seconds: float):
+        if key not in (KEY_IP, KEY_USER, KEY_ROUTE):
+            raise ValueError(f"Unknown rate limit key {key}")
+
+        self.method = method
+        self.path = path
+        self.key = key
+        self.capacity = requests
+        self.rate = requests / seconds
+        self.path_regex = compile_path(path)[0]
+        self.rejected = RATE_LIMITED_REQUESTS.labels(path)
+
+    @classmethod
+    def parse(cls, value: str):
+        route, _, limit = value.strip().rpartition(" ")
+        method, _, path = route.strip().partition(" ")
+        key, _, rate = limit.partition("=")
+        requests, _, seconds = rate.partition("/")
+        return cls(method.upper(), path.strip(), key, float(requests), float(seconds))
+
+
+def parse_rate_limits(value: str) -> list[RateLimitRule]:
+    return [RateLimitRule.parse(item) for item in value.split(",") if item.strip()]
+
+
+class InMemoryRateLimiter:
+    def __init__(self, purge_interval: float = 60):
+        self._buckets: dict[str, list[float]] = {}
+        self._purge_interval = purge_interval
+        self._next_purge = time.monotonic() + purge_interval
+
+    def _purge(self, now: float):
+        # Bucket refilled to capacity is the same as no bucket
+        self._next_purge = now + self._purge_interval
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if bucket[0] + (now - bucket[1]) * bucket[3] < bucket[2]
+        }
+
+    async def acquire(self, limits: list[tuple[str, float, float]]) -> float:
+        # Returns 0 when allowed, otherwise seconds until a token is available
+        now = time.monotonic()
+        if now >= self._next_purge:
+            self._purge(now)
+
+        buckets = []
+        retry_after = 0.0
+        for key, capacity, rate in limits:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [capacity, now, capacity, rate]
+            else:
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+            if bucket[0] < 1:
+                retry_after = max(retry_after, (1 - bucket[0]) / rate)
+            buckets.append(bucket)
+
+        # Tokens are taken only when every limit allows the request
+        if retry_after == 0:
+            for bucket in buckets:
+                bucket[0] -= 1
+        return retry_after
+
+
+# All buckets of a request are refilled, checked and taken in one round trip.
+# Redis clock is used, so gateway replicas with skewed clocks share the same buckets.
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local tokens = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local rate = tonumber(ARGV[i * 2])
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = capacity
+    if bucket[1] then
+        available = math.min(capacity, tonumber(bucket[1]) + (now - tonumber(bucket[2])) * rate)
+    end
+    if available < 1 then
+        retry_after = math.max(retry_after, (1 - available) / rate)
+    end
+    tokens[i] = available
+end
+if retry_after > 0 then
+    return tostring(retry_after)
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local rate = tonumber(ARGV[i * 2])
+    redis.call('HSET', key, 'tokens', tokens[i] - 1, 'ts', now)
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate))
+end
+return '0'
+"""
+
+
+class RedisRateLimiter:
+    def __init__(self, redis_url: str = REDIS_URL, redis_db: str = RATE_LIMIT_REDIS_DB):
+        self._redis_client = redis.asyncio.from_url(f"{redis_url}/{redis_db}")
+        self._script = self._redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def acquire(self, limits: list[tuple[str, float, float]]) -> float:
+        args = []
+        for _, capacity, rate in limits:
+            # Script works in milliseconds
+            args.extend((capacity, rate / 1000))
+        try:
+            retry_after = await self._script(
+                keys=[f"rate_limit:{key}" for key, _, _ in limits], args=args
+            )
+        except redis.RedisError as ex:
+            # Limiter outage must not take the whole api down
+            print(f"Rate limiter storage unavailable : {ex}")
+            return 0.0
+        return float(retry_after) / 1000
+
+
+def get_client_ip(scope) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded_for = get_header(scope, b"x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def get_user_id(scope) -> str | None:
+    # Only tokens with a valid signature name the user, anyone could put any sub in a forged one.
+    # Without a local token verifier signatures can not be checked here and clients
+    # are limited by address.
+    authorization = get_header(scope, b"authorization")
+    if authorization is None or not authorization.lower().startswith("bearer "):
+        return None
+    token_verifier = getattr(scope["app"].state, "token_verifier", None)
+    if token_verifier is None:
+        return None
+    return token_verifier.get_subject(authorization[7:])
+
+
+class RateLimitMiddleware:
+    def __init__(self, app, rate_limits: str = RATE_LIMITS, storage: str = RATE_LIMIT_STORAGE):
+        self.app = app
+        self._rules = parse_rate_limits(rate_limits)
+        if storage == "redis":
+            self._limiter = RedisRateLimiter()
+        elif storage == "memory":
+            self._limiter = get_shared_rate_limiter() or InMemoryRateLimiter()
+        else:
+            raise ValueError(f"Unknown rate limit storage {storage}")
+
+    def _get_limits(self, scope) -> tuple[list, list[RateLimitRule]]:
+        limits = []
+        rules = []
+        user_id = None
+        for rule in self._rules:
+            if rule.method != scope["method"] or not rule.path_regex.match(scope["path"]):
+                continue
+
+            if rule.key == KEY_IP:
+                key = get_client_ip(scope)
+            elif rule.key == KEY_USER:
+                if user_id is None:
+                    user_id = get_user_id(scope) or f"ip:{get_client_ip(scope)}"
+                key = user_id
+            else:
+                key = ""
+
+            limits.append((f"{rule.method}:{rule.path}:{rule.key}:{key}", rule.capacity, rule.rate))
+            rules.append(rule)
+        return limits, rules
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._rules:
+            return await self.app(scope, receive, send)
+
+        limits, rules = self._get_limits(scope)
+        if limits:
+            retry_after = await self._limiter.acquire(limits)
+            if retry_after > 0:
+                rules[0].rejected.inc()
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 429,
+                        "headers": [
+                            (b"content-type", b"application/json"),
+                            (b"retry-after", str(math.ceil(retry_after)).encode()),
+                        ],
+                    }
+                )
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": b'{"detail":"Too many requests"}',
+                    }
+                )
+                return
+
+        await self.app(scope, receive, send)
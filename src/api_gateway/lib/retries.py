@@ -0,0 +1,114 @@
+import asyncio
+import os
+import random
+
+import grpc
+from prometheus_client import Counter
+
+from lib.deadlines import remaining_time
+
+
+# Only idempotent reads are retried, writes may have been applied before the failure
+RETRY_METHODS = os.environ.get(
+    "RETRY_METHODS",
+    "/account.AccountService/CheckPermissions,/account.AccountService/CheckPermissionsBatch,"
+    "/user.UserService/GetUserData,/user.UserService/GetUserDataByUsername,"
+    "/user.UserService/SearchUsers,"
+    "/cargo.CargoService/GetCargo,/cargo.CargoService/GetCargos,"
+    "/cargo.CargoService/GetUserCargos,"
+    "/delivery.DeliveryService/GetDelivery,/delivery.DeliveryService/GetDeliveries,"
+    "/delivery.DeliveryService/SearchDeliveries,"
+    "/payment.PaymentService/SearchPayments",
+)
+RETRY_MAX_ATTEMPTS = int(os.environ.get("RETRY_MAX_ATTEMPTS", "3"))
+# Every call earns that part of a retry, so retries add at most 10% to the backend load
+RETRY_BUDGET_RATIO = float(os.environ.get("RETRY_BUDGET_RATIO", "0.1"))
+# Retries allowed in a burst after a quiet period
+RETRY_BUDGET_MAX = float(os.environ.get("RETRY_BUDGET_MAX", "10"))
+RETRY_BACKOFF = float(os.environ.get("RETRY_BACKOFF", "0.025"))
+
+# Transient failures, the call most likely did not reach a healthy instance
+RETRY_STATUS_CODES = (grpc.StatusCode.UNAVAILABLE,)
+# Services answer 500 for any unhandled error, retrying a bug only repeats it, 503 is transient
+RETRY_RESPONSE_CODES = (503,)
+
+RETRIES = Counter(
+    "gateway_retries_total",
+    "Backend call retries, budget_exhausted counts the retries the budget refused",
+    ["backend", "result"],
+)
+
+
+class RetryBudget:
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, max_tokens: float = RETRY_BUDGET_MAX):
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+
+    def deposit(self):
+        self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        backend: str,
+        methods: set[str] | None = None,
+        budget: RetryBudget | None = None,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+    ):
+        if methods is None:
+            methods = {method for method in RETRY_METHODS.split(",") if method}
+        self._methods = methods
+        self._budget = budget if budget is not None else RetryBudget()
+        self._max_attempts = max_attempts
+        self._retried = RETRIES.labels(backend, "retried")
+        self._exhausted = RETRIES.labels(backend, "budget_exhausted")
+
+    def _can_retry(self, attempt: int, backoff: float) -> bool:
+        if attempt >= self._max_attempts:
+            return False
+        remaining = remaining_time()
+        if remaining is not None and remaining <= backoff:
+            return False
+        if not self._budget.try_withdraw():
+            self._exhausted.inc()
+            return False
+        self._retried.inc()
+        return True
+
+    async def __call__(self, multicallable, request, kwargs: dict, call_next):
+        if multicallable.method not in self._methods:
+            return await call_next(multicallable, request, kwargs)
+
+        self._budget.deposit()
+        attempt = 1
+        while True:
+            # Full jitter, so retries of calls failed together do not arrive together
+            backoff = random.uniform(0, RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                result = await call_next(multicallable, request, kwargs)
+            except grpc.RpcError as ex:
+                if ex.code() not in RETRY_STATUS_CODES or not self._can_retry(attempt, backoff):
+                    raise
+            else:
+                # Services report their failures in the code field of a successful call
+                if getattr(result, "code", 200) not in RETRY_RESPONSE_CODES or not self._can_retry(
+                    attempt, backoff
+                ):
+                    return result
+            attempt += 1
+            await asyncio.sleep(backoff)
+
+    def stats(self) -> dict:
+        return {"budget": round(self._budget.tokens, 2)}
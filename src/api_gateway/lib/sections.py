@@ -0,0 +1,34 @@
+import asyncio
+import os
+from typing import Awaitable, Callable
+
+import grpc
+from google.protobuf.message import Message
+
+from lib.circuit_breaker import CircuitOpenError
+from lib.concurrency_limiter import ConcurrencyLimitExceededError
+from lib.deadlines import DeadlineExceededError
+
+
+# Composite responses wait that long for every section before returning without it
+SECTION_TIMEOUT = float(os.environ.get("SECTION_TIMEOUT", "1"))
+
+ACCESS_DENIED = {"code": 403, "message": "Access denied"}
+
+
+async def fetch_section(
+    call: Awaitable, get_data: Callable, timeout: float = SECTION_TIMEOUT
+) -> tuple[Message | None, dict | None]:
+    # Returns section data or the error shown in place of it, never raises for backend failures
+    try:
+        resp = await asyncio.wait_for(call, timeout)
+    except (TimeoutError, DeadlineExceededError):
+        return None, {"code": 504, "message": "Timed out"}
+    except (ConcurrencyLimitExceededError, CircuitOpenError) as ex:
+        return None, {"code": 503, "message": str(ex)}
+    except grpc.RpcError as ex:
+        return None, {"code": 502, "message": ex.details() or ex.code().name}
+
+    if resp.code != 200:
+        return None, {"code": resp.code, "message": resp.message}
+    return get_data(resp), None
@@ -0,0 +1,224 @@
+import hashlib
+import multiprocessing
+import os
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+
+SHARED_RATE_LIMIT_SLOTS = int(os.environ.get("SHARED_RATE_LIMIT_SLOTS", "65536"))
+SHARED_REVOCATION_SLOTS = int(os.environ.get("SHARED_REVOCATION_SLOTS", "262144"))
+# Workers stop trusting the shared revocation list when its feed was silent that long
+REVOCATION_HEARTBEAT_TIMEOUT = float(os.environ.get("REVOCATION_HEARTBEAT_TIMEOUT", "5"))
+
+MAX_PROBES = 16
+EMPTY_KEY = 0
+# Optimistic reads retried that many times while a writer is busy, then the lock is taken
+MAX_READ_RETRIES = 64
+
+
+def key_hash(key: str) -> int:
+    # 64 bit keys, collisions of live keys are practically impossible
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class SharedHashTable:
+    # Open addressing table of (key, value, value) cells in one shared memory segment.
+    # Segment and lock are created before workers are forked and inherited by them.
+    HEADER_CELLS = 4
+    SLOT_CELLS = 3
+    # Header cell with the write sequence, odd while a writer changes the table
+    SEQUENCE = 3
+
+    def __init__(self, slots: int):
+        self._slots = slots
+        # Launcher unlinks the segment itself, a resource tracker process is not needed
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=(self.HEADER_CELLS + slots * self.SLOT_CELLS) * 8, track=False
+        )
+        # Same bytes seen as keys and as values, new segments are zero filled
+        self._keys = self._memory.buf.cast("Q")
+        self._values = self._memory.buf.cast("d")
+        self.lock = multiprocessing.Lock()
+
+    def close(self, unlink: bool = False):
+        self._keys.release()
+        self._values.release()
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+
+    def get_header(self, index: int) -> float:
+        return self._values[index]
+
+    def set_header(self, index: int, value: float):
+        self._values[index] = value
+
+    @contextmanager
+    def writing(self):
+        # Writers exclude each other with the lock, readers only watch the sequence
+        with self.lock:
+            self._keys[self.SEQUENCE] += 1
+            try:
+                yield
+            finally:
+                self._keys[self.SEQUENCE] += 1
+
+    def read(self, fn, *args):
+        # Seqlock read: the result counts only when no write started or ended meanwhile.
+        # Python has no memory fences, it relies on stores becoming visible in order, as on x86
+        for _ in range(MAX_READ_RETRIES):
+            sequence = self._keys[self.SEQUENCE]
+            if not sequence & 1:
+                result = fn(*args)
+                if self._keys[self.SEQUENCE] == sequence:
+                    return result
+        with self.lock:
+            return fn(*args)
+
+    def _probe(self, key: int):
+        start = key % self._slots
+        for i in range(MAX_PROBES):
+            yield self.HEADER_CELLS + (start + i) % self._slots * self.SLOT_CELLS
+
+    def get(self, key: int) -> tuple[float, float] | None:
+        for cell in self._probe(key):
+            found = self._keys[cell]
+            if found == key:
+                return self._values[cell + 1], self._values[cell + 2]
+            if found == EMPTY_KEY:
+                return None
+        return None
+
+    def put(self, key: int, first: float, second: float, evict: bool = False) -> bool:
+        # With evict the slot with the smallest second value gives way when all probes are taken
+        victim = None
+        for cell in self._probe(key):
+            found = self._keys[cell]
+            if found == key or found == EMPTY_KEY:
+                victim = cell
+                break
+            if evict and (victim is None or self._values[cell + 2] < self._values[victim + 2]):
+                victim = cell
+        if victim is None:
+            return False
+        self._keys[victim] = key
+        self._values[victim + 1] = first
+        self._values[victim + 2] = second
+        return True
+
+    def items(self) -> list[tuple[int, float, float]]:
+        items = []
+        for slot in range(self._slots):
+            cell = self.HEADER_CELLS + slot * self.SLOT_CELLS
+            if self._keys[cell] != EMPTY_KEY:
+                items.append((self._keys[cell], self._values[cell + 1], self._values[cell + 2]))
+        return items
+
+    def clear(self):
+        start = self.HEADER_CELLS * 8
+        self._memory.buf[start:] = bytes(len(self._memory.buf) - start)
+
+
+class SharedRateLimiter:
+    # Same buckets as InMemoryRateLimiter, kept in shared memory so all workers take from them
+    def __init__(self, table: SharedHashTable):
+        self._table = table
+
+    async def acquire(self, limits: list[tuple[str, float, float]]) -> float:
+        keys = [key_hash(key) for key, _, _ in limits]
+        # Monotonic clock is system wide, so timestamps of all workers are comparable
+        now = time.monotonic()
+        tokens = []
+        retry_after = 0.0
+        with self._table.lock:
+            for key, (_, capacity, rate) in zip(keys, limits):
+                bucket = self._table.get(key)
+                available = capacity
+                if bucket is not None:
+                    available = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+                if available < 1:
+                    retry_after = max(retry_after, (1 - available) / rate)
+                tokens.append(available)
+
+            if retry_after == 0:
+                # Least recently used bucket is dropped when the table is crowded
+                for key, available in zip(keys, tokens):
+                    self._table.put(key, available - 1, now, evict=True)
+        return retry_after
+
+
+class SharedRevocationList:
+    # Header cells: synced flag, last heartbeat of the feeding worker
+    SYNCED = 0
+    HEARTBEAT = 1
+
+    def __init__(self, table: SharedHashTable):
+        self._table = table
+
+    @property
+    def synced(self) -> bool:
+        return (
+            self._table.get_header(self.SYNCED) == 1
+            and time.monotonic() - self._table.get_header(self.HEARTBEAT)
+            < REVOCATION_HEARTBEAT_TIMEOUT
+        )
+
+    def set_synced(self, synced: bool):
+        self._table.set_header(self.SYNCED, 1 if synced else 0)
+        self.touch()
+
+    def touch(self):
+        self._table.set_header(self.HEARTBEAT, time.monotonic())
+
+    def reset(self):
+        with self._table.writing():
+            self._table.clear()
+
+    def add(self, jti: str, exp: int) -> bool:
+        with self._table.writing():
+            return self._table.put(key_hash(jti), exp, 0)
+
+    def __contains__(self, jti: str) -> bool:
+        # Checked on every request by all workers, so readers never take the lock
+        return self._table.read(self._table.get, key_hash(jti)) is not None
+
+    def purge_expired(self, now: int):
+        # Only the feeding worker writes, so the scan does not block readers
+        alive = [(key, exp) for key, exp, _ in self._table.items() if exp > now]
+        with self._table.writing():
+            self._table.clear()
+            for key, exp in alive:
+                self._table.put(key, exp, 0)
+
+
+rate_limit_table: SharedHashTable | None = None
+revocation_table: SharedHashTable | None = None
+
+
+def create_shared_state():
+    # Called by the launcher before forking workers
+    global rate_limit_table, revocation_table
+    rate_limit_table = SharedHashTable(SHARED_RATE_LIMIT_SLOTS)
+    revocation_table = SharedHashTable(SHARED_REVOCATION_SLOTS)
+
+
+def close_shared_state():
+    for table in (rate_limit_table, revocation_table):
+        if table is not None:
+            table.close(unlink=True)
+
+
+def get_shared_rate_limiter() -> SharedRateLimiter | None:
+    return SharedRateLimiter(rate_limit_table) if rate_limit_table is not None else None
+
+
+def get_shared_revocation_list() -> SharedRevocationList | None:
+    return SharedRevocationList(revocation_table) if revocation_table is not None else None
+
+
+def is_feeding_worker() -> bool:
+    # Launcher sets GATEWAY_WORKER_ID in every worker, worker "0" feeds data shared by all.
+    # Without the launcher every process keeps its own data.
+    return revocation_table is None or os.environ.get("GATEWAY_WORKER_ID", "0") == "0"
@@ -0,0 +1,90 @@
+import asyncio
+import os
+
+from lib.deadlines import DeadlineExceededError
+
+
+COALESCED_METHODS = os.environ.get(
+    "COALESCED_METHODS",
+    "/user.UserService/GetUserData,/cargo.CargoService/GetCargo,/delivery.DeliveryService/GetDelivery",
+)
+
+
+class SingleFlight:
+    def __init__(self):
+        self._in_flight: dict[object, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+        self.executed = 0
+        self.collapsed = 0
+
+    def _forget(self, key, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key, fn, timeout: float | None = None):
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executed += 1
+            # Separate task, so a disconnected first caller does not cancel the others
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            self._waiters[task] = 0
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.collapsed += 1
+
+        # Every caller waits no longer than its own timeout, the shared call goes on for the others
+        self._waiters[task] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                # Nobody waits for the answer any more, so the shared call is not needed
+                if not task.done():
+                    if self._in_flight.get(key) is task:
+                        del self._in_flight[key]
+                    task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._in_flight),
+            "executed": self.executed,
+            "collapsed": self.collapsed,
+        }
+
+
+class CoalescingPolicy:
+    def __init__(self, methods: set[str] | None = None):
+        if methods is None:
+            methods = {method for method in COALESCED_METHODS.split(",") if method}
+        self._methods = methods
+        self._single_flight = SingleFlight()
+
+    async def __call__(self, multicallable, request, kwargs: dict, call_next):
+        if multicallable.method not in self._methods:
+            return await call_next(multicallable, request, kwargs)
+
+        # Metadata, credentials and other call options may change the answer, such calls run alone.
+        # Timeouts differ between callers, so they are not a part of the key.
+        if any(value is not None for name, value in kwargs.items() if name != "timeout"):
+            return await call_next(multicallable, request, kwargs)
+
+        # The shared call runs without the timeout of the first caller, or a short deadline
+        # there would fail the callers ready to wait longer. It is cancelled when all leave.
+        shared_kwargs = {name: value for name, value in kwargs.items() if name != "timeout"}
+        key = (multicallable.method, request.SerializeToString(deterministic=True))
+        try:
+            return await self._single_flight.do(
+                key,
+                lambda: call_next(multicallable, request, shared_kwargs),
+                kwargs.get("timeout"),
+            )
+        except TimeoutError as ex:
+            raise DeadlineExceededError(f"{multicallable.method} timed out") from ex
+
+    def stats(self) -> dict:
+        return self._single_flight.stats()
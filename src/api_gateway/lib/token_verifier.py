@@ -0,0 +1,182 @@
+import asyncio
+import os
+import time
+
+from jose import JWTError, jwt
+
+from grpc_build.account_service_pb2 import (
+    CheckPermissionsResponse,
+    RevokedTokensArray,
+    WatchRevokedTokensRequest,
+)
+from grpc_build.account_service_pb2_grpc import AccountServiceStub
+from lib.permission_catalog import decode_permissions
+from lib.shared_state import SharedRevocationList
+
+
+JWT_PUBLIC_KEY_PATH = os.environ.get("JWT_PUBLIC_KEY_PATH")
+JWT_ALGORITHM = os.environ.get("JWT_ALGORITHM", "RS256")
+
+REVOCATION_RECONNECT_DELAY = float(os.environ.get("REVOCATION_RECONNECT_DELAY", "1"))
+REVOCATION_PURGE_INTERVAL = float(os.environ.get("REVOCATION_PURGE_INTERVAL", "60"))
+REVOCATION_HEARTBEAT_INTERVAL = float(os.environ.get("REVOCATION_HEARTBEAT_INTERVAL", "1"))
+
+
+class LocalRevocationList:
+    def __init__(self):
+        self._revoked: dict[str, int] = {}
+        self._synced = False
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    def set_synced(self, synced: bool):
+        self._synced = synced
+
+    def touch(self):
+        pass
+
+    def reset(self):
+        self._revoked = {}
+
+    def add(self, jti: str, exp: int) -> bool:
+        self._revoked[jti] = exp
+        return True
+
+    def __contains__(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def purge_expired(self, now: int):
+        self._revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+
+
+class TokenVerifier:
+    def __init__(
+        self,
+        public_key: str,
+        algorithm: str = JWT_ALGORITHM,
+        revoked: LocalRevocationList | SharedRevocationList | None = None,
+    ):
+        self._public_key = public_key
+        self._algorithm = algorithm
+        # Workers of one launcher share a list fed by one of them
+        self._revoked = revoked if revoked is not None else LocalRevocationList()
+        self._overflow = False
+        self._next_purge = time.monotonic() + REVOCATION_PURGE_INTERVAL
+
+    @classmethod
+    def from_env(cls, revoked: SharedRevocationList | None = None):
+        if JWT_PUBLIC_KEY_PATH is None:
+            return None
+        with open(JWT_PUBLIC_KEY_PATH) as key_file:
+            return cls(key_file.read(), revoked=revoked)
+
+    @property
+    def synced(self) -> bool:
+        return self._revoked.synced
+
+    def _apply_revoked(self, revoked: RevokedTokensArray):
+        for revoked_token in revoked.arr:
+            if not self._revoked.add(revoked_token.jti, revoked_token.exp) and not self._overflow:
+                # Shared list is full, revocations can be missed until the next snapshot
+                print("Revoked tokens list is full, falling back to remote checks")
+                self._overflow = True
+
+        if time.monotonic() >= self._next_purge:
+            self._purge_expired()
+
+    def _purge_expired(self):
+        self._next_purge = time.monotonic() + REVOCATION_PURGE_INTERVAL
+        self._revoked.purge_expired(int(time.time()))
+
+    async def _heartbeat(self):
+        # Feed is silent between revocations, other workers still have to see it alive
+        while True:
+            await asyncio.sleep(REVOCATION_HEARTBEAT_INTERVAL)
+            self._revoked.touch()
+
+    async def watch_revoked_tokens(self, account_stub: AccountServiceStub):
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            await self._watch_revoked_tokens(account_stub)
+        finally:
+            heartbeat.cancel()
+
+    async def _watch_revoked_tokens(self, account_stub: AccountServiceStub):
+        while True:
+            try:
+                first = True
+                async for revoked in account_stub.WatchRevokedTokens(
+                    WatchRevokedTokensRequest()
+                ):
+                    if first:
+                        # First message is a full snapshot of the revocation list
+                        self._revoked.set_synced(False)
+                        self._revoked.reset()
+                        self._overflow = False
+                        first = False
+                    self._apply_revoked(revoked)
+                    self._revoked.set_synced(not self._overflow)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                print(f"Revoked tokens feed interrupted : {ex}")
+
+            # Without a live feed revocations can be missed, so fall back to remote checks
+            self._revoked.set_synced(False)
+            self._purge_expired()
+            await asyncio.sleep(REVOCATION_RECONNECT_DELAY)
+
+    def get_subject(self, access_token: str) -> str | None:
+        # User of a token with a valid signature, None for forged or expired ones
+        try:
+            payload = jwt.decode(
+                access_token, self._public_key, algorithms=[self._algorithm]
+            )
+        except JWTError:
+            return None
+        return payload.get("sub")
+
+    def check_permissions(
+        self, access_token: str, permissions: list[str]
+    ) -> list[CheckPermissionsResponse] | None:
+        # Token is decoded once for all requested permissions.
+        # None when the token has to be checked by the account service.
+        try:
+            payload = jwt.decode(
+                access_token, self._public_key, algorithms=[self._algorithm]
+            )
+        except jwt.ExpiredSignatureError:
+            error = CheckPermissionsResponse(code=401, message="Access token expired")
+            return [error] * len(permissions)
+        except JWTError:
+            error = CheckPermissionsResponse(code=401, message="Invalid access token")
+            return [error] * len(permissions)
+
+        jti = payload.get("jti")
+        if jti is None:
+            error = CheckPermissionsResponse(code=401, message="Invalid access token")
+            return [error] * len(permissions)
+
+        if jti in self._revoked:
+            error = CheckPermissionsResponse(code=403, message="Access token in blacklist")
+            return [error] * len(permissions)
+
+        granted = decode_permissions(payload)
+        if granted is None:
+            # Permission catalog of the token is newer than the one of the gateway
+            return None
+        user_id = payload.get("sub")
+        return [
+            CheckPermissionsResponse(code=200, user_id=user_id)
+            if permission in granted
+            else CheckPermissionsResponse(code=403, message="Access denied")
+            for permission in permissions
+        ]
+
+    def check_permission(
+        self, access_token: str, permission: str
+    ) -> CheckPermissionsResponse | None:
+        responses = self.check_permissions(access_token, [permission])
+        return responses[0] if responses is not None else None
@@ -1,7 +1,15 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 import os
+import secrets
 from context import app
+from lib.circuit_breaker import CircuitOpenError
+from lib.compression import CompressionMiddleware
+from lib.concurrency_limiter import LIMITER_RETRY_AFTER, ConcurrencyLimitExceededError
+from lib.deadlines import DeadlineExceededError, DeadlineMiddleware
+from lib.metrics import MetricsMiddleware, render_metrics
+from lib.rate_limiter import RateLimitMiddleware
 
 from api.v1.routes.account_route import router as account_router_v1
 from api.v1.routes.user_route import router as user_router_v1
@@ -14,6 +22,80 @@ app.include_router(user_router_v1)
 app.include_router(cargo_router_v1)
 app.include_router(delivery_router_v1)
 
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(DeadlineMiddleware)
+app.add_middleware(RateLimitMiddleware)
+app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(DeadlineExceededError)
+async def deadline_exceeded_handler(request: Request, ex: DeadlineExceededError):
+    return JSONResponse(status_code=504, content={"detail": "Request timed out"})
+
+
+@app.exception_handler(ConcurrencyLimitExceededError)
+async def concurrency_limit_exceeded_handler(
+    request: Request, ex: ConcurrencyLimitExceededError
+):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(ex)},
+        headers={"Retry-After": LIMITER_RETRY_AFTER},
+    )
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, ex: CircuitOpenError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(ex)},
+        headers={"Retry-After": str(ex.retry_after)},
+    )
+
+
+# Stats show backend health and limits, they are served only with this bearer token
+INTERNAL_STATS_TOKEN = os.environ.get("INTERNAL_STATS_TOKEN")
+
+
+async def check_internal_access(request: Request):
+    authorization = request.headers.get("authorization", "")
+    if not INTERNAL_STATS_TOKEN or not secrets.compare_digest(
+        authorization.encode(), f"Bearer {INTERNAL_STATS_TOKEN}".encode()
+    ):
+        raise HTTPException(status_code=404)
+
+
+@app.get(
+    "/internal/stats",
+    include_in_schema=False,
+    dependencies=[Depends(check_internal_access)],
+)
+async def internal_stats():
+    return {
+        "coalescing": app.state.coalescing.stats(),
+        "concurrency_limits": {
+            backend: limit.stats()
+            for backend, limit in app.state.concurrency_limits.items()
+        },
+        "circuit_breakers": {
+            backend: breaker.stats()
+            for backend, breaker in app.state.circuit_breakers.items()
+        },
+        "hedging": {
+            backend: hedging.stats() for backend, hedging in app.state.hedging.items()
+        },
+        "retries": {
+            backend: retries.stats() for backend, retries in app.state.retries.items()
+        },
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    content, media_type = render_metrics()
+    return Response(content, media_type=media_type)
+
+
 # Запуск сервера
 # http://localhost:8000/openapi.json swagger
 # http://localhost:8000/docs портал документации
@@ -0,0 +1,79 @@
+# Run from the api_gateway folder after generating grpc_build (see Dockerfile):
+# python -m pytest tests
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.routes.account_route import check_permissions, check_section_permissions
+from context import app as gateway_app
+from grpc_build.account_service_pb2 import (
+    CheckPermissionsBatchResponse,
+    CheckPermissionsResponse,
+)
+
+
+GRANTED = {"READ_CARGO", "READ_DELIVERY"}
+
+
+class FakeAccountStub:
+    def __init__(self):
+        self.batch_calls = 0
+
+    async def CheckPermissionsBatch(self, request):
+        self.batch_calls += 1
+        return CheckPermissionsBatchResponse(
+            results=[
+                CheckPermissionsResponse(code=200, user_id="user")
+                if permission in GRANTED
+                else CheckPermissionsResponse(code=403, message="Access denied")
+                for permission in request.permissions
+            ]
+        )
+
+
+def make_client(*permissions: str) -> tuple[TestClient, FakeAccountStub]:
+    account_stub = FakeAccountStub()
+    gateway_app.state.token_verifier = None
+    gateway_app.state.account_stub = account_stub
+
+    app = FastAPI()
+
+    @app.get("/all", dependencies=[check_permissions(*permissions)])
+    async def all_permissions():
+        return {}
+
+    @app.get("/sections")
+    async def sections(granted: set[str] = check_section_permissions(*permissions)):
+        return sorted(granted)
+
+    return TestClient(app), account_stub
+
+
+def test_granted_when_every_permission_is_granted():
+    client, account_stub = make_client("READ_CARGO", "READ_DELIVERY")
+    resp = client.get("/all", headers={"Authorization": "Bearer token"})
+    assert resp.status_code == 200
+    assert account_stub.batch_calls == 1
+
+
+def test_denied_when_any_permission_is_missing():
+    for permissions in (
+        ("READ_CARGO", "UPDATE_CARGO"),
+        ("UPDATE_CARGO", "READ_CARGO"),
+        ("UPDATE_CARGO", "DELETE_USER"),
+    ):
+        client, account_stub = make_client(*permissions)
+        resp = client.get("/all", headers={"Authorization": "Bearer token"})
+        assert resp.status_code == 403
+        assert account_stub.batch_calls == 1
+
+
+def test_sections_need_only_the_route_permission():
+    client, account_stub = make_client("READ_CARGO", "UPDATE_CARGO", "READ_DELIVERY")
+    resp = client.get("/sections", headers={"Authorization": "Bearer token"})
+    assert resp.status_code == 200
+    assert resp.json() == ["READ_DELIVERY"]
+    assert account_stub.batch_calls == 1
+
+    client, _ = make_client("UPDATE_CARGO", "READ_CARGO")
+    resp = client.get("/sections", headers={"Authorization": "Bearer token"})
+    assert resp.status_code == 403
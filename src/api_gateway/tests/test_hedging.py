@@ -0,0 +1,61 @@
+# Run from the api_gateway folder after generating grpc_build (see Dockerfile):
+# python -m pytest tests
+import asyncio
+
+from grpc_build.user_service_pb2 import GetUserDataRequest, GetUserDataResponse
+from lib.hedging import HEDGE_MIN_SAMPLES, HedgingPolicy
+
+
+METHOD = "/user.UserService/GetUserData"
+
+
+class FakeMultiCallable:
+    method = METHOD
+
+
+async def warm_up(policy: HedgingPolicy, request, latency: float):
+    async def call_next(multicallable, request, kwargs):
+        await asyncio.sleep(latency)
+        return GetUserDataResponse(code=200)
+
+    for _ in range(HEDGE_MIN_SAMPLES):
+        await policy(FakeMultiCallable(), request, {}, call_next)
+
+
+def test_server_error_waits_for_the_hedge():
+    async def main():
+        policy = HedgingPolicy("test", methods={METHOD}, min_delay=0.001)
+        request = GetUserDataRequest(user_id="user")
+        await warm_up(policy, request, 0)
+        samples = len(policy._latencies[METHOD]._samples)
+
+        answers = [(0.05, 500), (0.05, 200)]
+
+        async def call_next(multicallable, request, kwargs):
+            latency, code = answers.pop(0)
+            await asyncio.sleep(latency)
+            return GetUserDataResponse(code=code)
+
+        resp = await policy(FakeMultiCallable(), request, {}, call_next)
+        assert resp.code == 200
+        assert policy.stats()["hedged"] == 1
+        # Both copies answered, both latencies are recorded
+        assert len(policy._latencies[METHOD]._samples) == samples + 2
+
+    asyncio.run(main())
+
+
+def test_server_error_is_returned_when_every_copy_failed():
+    async def main():
+        policy = HedgingPolicy("test", methods={METHOD}, min_delay=0.001)
+        request = GetUserDataRequest(user_id="user")
+        await warm_up(policy, request, 0)
+
+        async def call_next(multicallable, request, kwargs):
+            await asyncio.sleep(0.01)
+            return GetUserDataResponse(code=503, message="Service unavailable")
+
+        resp = await policy(FakeMultiCallable(), request, {}, call_next)
+        assert resp.code == 503
+
+    asyncio.run(main())
@@ -0,0 +1,191 @@
+# Run from the api_gateway folder after generating grpc_build (see Dockerfile):
+# python -m pytest tests
+import uuid
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from api.v1.models.cargo_models import CargoBatchModel, CargoModel
+from api.v1.models.delivery_details_models import DeliveryDetailsModel
+from api.v1.models.delivery_models import DeliveryBatchModel, DeliveryModel
+from api.v1.models.user_models import BriefUserModel, UserModel
+from grpc_build.cargo_service_pb2 import BriefDeliveryData, CargoBatch, CargoData
+from grpc_build.delivery_service_pb2 import DeliveryBatch, DeliveryData
+from grpc_build.payment_service_pb2 import DecimalData, PaymentInfoData
+from grpc_build.user_service_pb2 import BriefUserData, GroupData, UserData
+from lib.proto_json import ProtoJSONResponse
+from lib.sections import ACCESS_DENIED
+
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def timestamp(seconds: int, nanos: int = 0) -> Timestamp:
+    return Timestamp(seconds=seconds, nanos=nanos)
+
+
+def full_user() -> UserData:
+    return UserData(
+        id=new_id(),
+        username="ivan",
+        first_name="Иван",
+        second_name="Petrov \"quoted\"",
+        patronymic="Ivanovich",
+        email="ivan@example.com",
+        phone="+70000000000",
+        birth=timestamp(631152000),
+        groups=[GroupData(id=new_id(), name="admins"), GroupData(id=new_id())],
+        updated_at=timestamp(1735787045, 123000000),
+    )
+
+
+def sparse_user() -> UserData:
+    return UserData(
+        id=new_id(),
+        username="anna",
+        first_name="Anna",
+        second_name="Smirnova",
+        groups=[GroupData(id=new_id())],
+        updated_at=timestamp(1735787045, 123456789),
+    )
+
+
+def full_delivery() -> DeliveryData:
+    return DeliveryData(
+        id=new_id(),
+        state="CREATED",
+        priority=2,
+        sender_id=new_id(),
+        receiver_id=new_id(),
+        cargo_id=new_id(),
+        bill_id=new_id(),
+        send_address_id=new_id(),
+        receive_address_id=new_id(),
+        updated_at=timestamp(1735787045, 100000),
+    )
+
+
+def sparse_delivery() -> DeliveryData:
+    return DeliveryData(
+        id=new_id(),
+        state="CREATED",
+        priority=1,
+        sender_id=new_id(),
+        receiver_id=new_id(),
+        cargo_id=new_id(),
+        send_address_id=new_id(),
+        receive_address_id=new_id(),
+    )
+
+
+def full_cargo() -> CargoData:
+    return CargoData(
+        id=new_id(),
+        title="Piano",
+        type="FRAGILE",
+        description="Grand piano",
+        creator_id=new_id(),
+        delivery_data=BriefDeliveryData(id=new_id(), state="IN_TRANSIT"),
+        weight=300,
+        updated_at=timestamp(1735787045),
+    )
+
+
+def sparse_cargo() -> CargoData:
+    return CargoData(
+        id=new_id(),
+        title="Box",
+        type="PLAIN",
+        description="Books",
+        creator_id=new_id(),
+        weight=5,
+    )
+
+
+def payment() -> PaymentInfoData:
+    return PaymentInfoData(
+        delivery_id=new_id(),
+        cost=DecimalData(units=12, nanos=500000000, sign=0),
+        currency="RUB",
+        company_bank_account_hash="hash",
+    )
+
+
+def render_both(response_model, model, content) -> tuple[bytes, bytes]:
+    # The pydantic path is rendered by FastAPI exactly like in the routes
+    app = FastAPI()
+
+    @app.get("/model", response_model=response_model, response_model_exclude_unset=True)
+    async def with_model():
+        return model
+
+    @app.get("/proto")
+    async def with_proto():
+        return ProtoJSONResponse(content)
+
+    client = TestClient(app)
+    return client.get("/model").content, client.get("/proto").content
+
+
+def assert_same(response_model, model, content):
+    expected, actual = render_both(response_model, model, content)
+    assert actual == expected
+
+
+def test_single_messages():
+    for message in (full_user(), sparse_user()):
+        assert_same(UserModel, UserModel.from_grpc_message(message), message)
+
+    for message in (full_delivery(), sparse_delivery()):
+        assert_same(DeliveryModel, DeliveryModel.from_grpc_message(message), message)
+
+    for message in (full_cargo(), sparse_cargo()):
+        assert_same(CargoModel, CargoModel.from_grpc_message(message), message)
+
+
+def test_lists():
+    users = [
+        BriefUserData(id=new_id(), username="ivan", first_name="Ivan", second_name="Petrov")
+        for _ in range(3)
+    ]
+    assert_same(
+        list[BriefUserModel],
+        [BriefUserModel.from_grpc_message(user) for user in users],
+        users,
+    )
+
+    deliveries = [full_delivery(), sparse_delivery()]
+    assert_same(
+        list[DeliveryModel],
+        [DeliveryModel.from_grpc_message(delivery) for delivery in deliveries],
+        deliveries,
+    )
+    assert_same(list[DeliveryModel], [], [])
+
+
+def test_batches():
+    batch = CargoBatch(items=[full_cargo(), sparse_cargo()])
+    assert_same(CargoBatchModel, CargoBatchModel.from_grpc_message(batch), batch)
+
+    batch = DeliveryBatch(missing_ids=[new_id()])
+    assert_same(DeliveryBatchModel, DeliveryBatchModel.from_grpc_message(batch), batch)
+
+
+def test_delivery_details():
+    sections = {"delivery": full_delivery(), "payment": payment(), "cargo": full_cargo()}
+    errors = {
+        "sender": ACCESS_DENIED,
+        "receiver": {"code": 503, "message": "Сервис недоступен"},
+    }
+    document = {
+        name: sections[name]
+        for name in DeliveryDetailsModel.model_fields
+        if name in sections
+    }
+    assert_same(
+        DeliveryDetailsModel,
+        DeliveryDetailsModel.from_sections(sections, errors),
+        {**document, "errors": errors},
+    )
@@ -0,0 +1,76 @@
+# Run from the api_gateway folder after generating grpc_build (see Dockerfile):
+# python -m pytest tests
+import asyncio
+
+import pytest
+
+from grpc_build.user_service_pb2 import GetUserDataRequest
+from lib.deadlines import DeadlineExceededError
+from lib.singleflight import CoalescingPolicy
+
+
+METHOD = "/user.UserService/GetUserData"
+
+
+class FakeMultiCallable:
+    method = METHOD
+
+
+def make_backend(latency: float):
+    calls = []
+
+    async def call_next(multicallable, request, kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(latency)
+        # Like grpc, the call fails once its own timeout is over
+        if kwargs.get("timeout") is not None and kwargs["timeout"] < latency:
+            raise DeadlineExceededError(f"{multicallable.method} timed out")
+        return "user"
+
+    return call_next, calls
+
+
+def test_short_deadline_leader_does_not_fail_the_others():
+    async def main():
+        policy = CoalescingPolicy({METHOD})
+        call_next, calls = make_backend(0.05)
+        request = GetUserDataRequest(user_id="user")
+
+        async def call(timeout: float):
+            return await policy(FakeMultiCallable(), request, {"timeout": timeout}, call_next)
+
+        short = asyncio.create_task(call(0.01))
+        await asyncio.sleep(0)
+        long = asyncio.create_task(call(1))
+
+        with pytest.raises(DeadlineExceededError):
+            await short
+        assert await long == "user"
+        assert len(calls) == 1
+        assert policy.stats()["collapsed"] == 1
+
+    asyncio.run(main())
+
+
+def test_shared_call_is_cancelled_when_every_caller_gave_up():
+    async def main():
+        policy = CoalescingPolicy({METHOD})
+        call_next, calls = make_backend(1)
+        request = GetUserDataRequest(user_id="user")
+
+        results = await asyncio.gather(
+            *(
+                policy(FakeMultiCallable(), request, {"timeout": 0.01}, call_next)
+                for _ in range(3)
+            ),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, DeadlineExceededError) for result in results)
+        assert len(calls) == 1
+        assert policy.stats()["in_flight"] == 0
+
+        # The next caller starts a new call instead of joining the cancelled one
+        call_next, calls = make_backend(0)
+        assert await policy(FakeMultiCallable(), request, {"timeout": 1}, call_next) == "user"
+
+    asyncio.run(main())
@@ -28,12 +28,23 @@ returns trigger as $$
 begin
     perform update_related_timestamps('permission', 'id', OLD.permission_id, NEW.permission_id);
     perform update_related_timestamps('group', 'id', OLD.group_id, NEW.group_id);
-    
+
+    -- Delivered on commit, account service reloads permissions of the changed groups
+    IF OLD.group_id IS NOT NULL THEN
+        perform pg_notify('group_permissions_changed', OLD.group_id::text);
+    END IF;
+    IF NEW.group_id IS NOT NULL AND NEW.group_id IS DISTINCT FROM OLD.group_id THEN
+        perform pg_notify('group_permissions_changed', NEW.group_id::text);
+    END IF;
+
     IF TG_OP = 'INSERT' THEN
         NEW.created_at := NOW();
         NEW.updated_at := NOW();
     ELSIF TG_OP = 'UPDATE' THEN
         NEW.updated_at := NOW();
+    ELSIF TG_OP = 'DELETE' THEN
+        -- NEW is null on delete and returning it would skip the row
+        return old;
     END IF;
     return new;
 end;
@@ -45,12 +56,40 @@ begin
     perform update_related_timestamps('account', 'id', OLD.account_id, NEW.account_id);
     perform update_related_timestamps('group', 'id', OLD.group_id, NEW.group_id);
 
+    -- Delivered on commit, account service updates groups of the user sessions
+    IF OLD.account_id IS NOT NULL THEN
+        perform pg_notify('account_sessions_changed', OLD.account_id::text);
+    END IF;
+    IF NEW.account_id IS NOT NULL AND NEW.account_id IS DISTINCT FROM OLD.account_id THEN
+        perform pg_notify('account_sessions_changed', NEW.account_id::text);
+    END IF;
+
     IF TG_OP = 'INSERT' THEN
         NEW.created_at := NOW();
         NEW.updated_at := NOW();
     ELSIF TG_OP = 'UPDATE' THEN
         NEW.updated_at := NOW();
+    ELSIF TG_OP = 'DELETE' THEN
+        return old;
     END IF;
     return new;
 end;
+$$ language plpgsql;
+
+create or replace function account_trigger_notify_deactivated()
+returns trigger as $$
+begin
+    -- Sessions of a deactivated user are ended by the account service
+    perform pg_notify('account_sessions_changed', NEW.id::text);
+    return null;
+end;
+$$ language plpgsql;
+
+create or replace function permission_trigger_notify_renamed()
+returns trigger as $$
+begin
+    -- Permission names are cached per group, a rename may touch any of them
+    perform pg_notify('group_permissions_changed', '*');
+    return null;
+end;
 $$ language plpgsql;
\ No newline at end of file
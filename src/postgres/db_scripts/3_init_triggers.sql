@@ -3,11 +3,23 @@ BEFORE INSERT OR UPDATE ON company.public.account
 FOR EACH ROW
 EXECUTE FUNCTION set_timestamps();
 
+CREATE TRIGGER trigger_notify_account_deactivated
+AFTER UPDATE OF is_active ON company.public.account
+FOR EACH ROW
+WHEN (OLD.is_active AND NOT NEW.is_active)
+EXECUTE FUNCTION account_trigger_notify_deactivated();
+
 CREATE TRIGGER trigger_set_timestamps_permission
 BEFORE INSERT OR UPDATE ON company.public.permission
 FOR EACH ROW
 EXECUTE FUNCTION set_timestamps();
 
+CREATE TRIGGER trigger_notify_permission_renamed
+AFTER UPDATE OF name ON company.public.permission
+FOR EACH ROW
+WHEN (OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE FUNCTION permission_trigger_notify_renamed();
+
 CREATE TRIGGER trigger_set_timestamps_group
 BEFORE INSERT OR UPDATE ON company.public.group
 FOR EACH ROW
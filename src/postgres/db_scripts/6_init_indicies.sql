@@ -1,7 +1,15 @@
 CREATE INDEX idx_account_first_name_last_name ON company.public.account(first_name, second_name);
 
-CREATE INDEX idx_cargo_creator_id ON company.public.cargo(creator_id);
+-- Id is a part of the key, so streamed exports page through one creator in id order
+CREATE INDEX idx_cargo_creator_id ON company.public.cargo(creator_id, id);
 
 CREATE INDEX idx_delivery_sender_id ON company.public.delivery(sender_id);
 CREATE INDEX idx_delivery_receiver_id ON company.public.delivery(receiver_id);
 CREATE INDEX idx_delivery_cargo_id ON company.public.delivery(cargo_id);
+
+-- Covering indexes for "not modified" probes, answered by index-only scans
+CREATE INDEX idx_account_id_updated_at ON company.public.account(id) INCLUDE (updated_at);
+CREATE INDEX idx_cargo_id_updated_at ON company.public.cargo(id) INCLUDE (updated_at);
+CREATE INDEX idx_delivery_id_updated_at ON company.public.delivery(id) INCLUDE (updated_at);
+CREATE INDEX idx_delivery_cargo_id_updated_at ON company.public.delivery(cargo_id) INCLUDE (updated_at);
+CREATE INDEX idx_account_group_account_id ON company.public.account_group(account_id);
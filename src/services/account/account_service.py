@@ -1,4 +1,5 @@
 import os
+import uuid
 from datetime import datetime, timedelta, timezone
 import grpc
 from grpc_build.account_service_pb2 import (
@@ -9,8 +10,13 @@ from grpc_build.account_service_pb2 import (
     RefreshResponse,
     CheckPermissionsRequest,
     CheckPermissionsResponse,
+    CheckPermissionsBatchRequest,
+    CheckPermissionsBatchResponse,
     LogoutRequest,
     LogoutResponse,
+    WatchRevokedTokensRequest,
+    RevokedTokenData,
+    RevokedTokensArray,
 )
 from grpc_build.account_service_pb2_grpc import (
     add_AccountServiceServicer_to_server,
@@ -18,11 +24,18 @@ from grpc_build.account_service_pb2_grpc import (
 )
 from grpc import ServicerContext
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 import asyncio
+from prometheus_client import start_http_server
+from lib.deadlines import DeadlineExceededError, DeadlineInterceptor
+from lib.password_hasher import HashingOverloadedError, PasswordHasher
+from lib.permission_catalog import NAMES_CLAIM, decode_permissions, encode_permissions
+from lib.revocation_filter import RevocationFilter
+from lib.session_sync import SessionSync
+from lib.token_cache import DecodedToken, TokenCache
 from repositories.user_repository import UserRepository
 
-from clients.redis.tokens_client import TokensClient
+from clients.redis.permission_cache import PermissionCache
+from clients.redis.tokens_client import FEED_LOST, TokensClient, get_token_hash
 
 
 SECRET_KEY = os.environ.get(
@@ -30,57 +43,120 @@ SECRET_KEY = os.environ.get(
     "0797ea423ef4f93f83f556b7414055a58a0ea1e979828c9e7d77dbcb24b50b622b8b33c0735bc939a6cbe87961a7d1a21aae7add625e72e2506f05c18159cbdf029a27a4f9c930ffd773d1f531cdfa331ea7bc89212b17f2202e385527f465f2d636196c5ee386a17399ec17fc36a15675cc4ec2e649a4d72ff3cecb90771af47efb9dc047f00532917ecdd4cba73f6a6173a90516361610e7da11a70e28ef959d4883f8f2c306dca59cecc5d2e19a0112f8513fdb52f62d8ae9245f7ae991e7b7af6a9847d86c2f3624c3d6a3248b460637f32edae8abb6b3019e70e399e9ac64e7d7713876fdf6f282d10ca35079343bd298654d2d661a686c5dfb349d2fe7",
 )
 
-ALGORITHM = "HS256"
+JWT_PRIVATE_KEY_PATH = os.environ.get("JWT_PRIVATE_KEY_PATH")
+JWT_PUBLIC_KEY_PATH = os.environ.get("JWT_PUBLIC_KEY_PATH")
+
+# With a key pair configured tokens are signed asymmetrically, so the api gateway
+# can verify them with the public key without holding the signing secret
+if JWT_PRIVATE_KEY_PATH is not None and JWT_PUBLIC_KEY_PATH is not None:
+    ALGORITHM = os.environ.get("JWT_ALGORITHM", "RS256")
+    with open(JWT_PRIVATE_KEY_PATH) as key_file:
+        SIGNING_KEY = key_file.read()
+    with open(JWT_PUBLIC_KEY_PATH) as key_file:
+        VERIFYING_KEY = key_file.read()
+else:
+    ALGORITHM = "HS256"
+    SIGNING_KEY = SECRET_KEY
+    VERIFYING_KEY = SECRET_KEY
+
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Permission names are issued until every token verifier reads the compact "bitmask" claims
+TOKEN_PERMISSIONS_FORMAT = os.environ.get("TOKEN_PERMISSIONS_FORMAT", "list")
 
 
 def create_jwt_token(data: dict, expires_delta: timedelta):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + expires_delta
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
+    return jwt.encode(to_encode, SIGNING_KEY, algorithm=ALGORITHM)
+
 
+def permission_claims(permissions: set[str]) -> dict:
+    if TOKEN_PERMISSIONS_FORMAT == "list":
+        return {NAMES_CLAIM: [*permissions]}
+    return encode_permissions(permissions)
 
-def create_token(user_id: str, permissions: set[str], refresh_token: bool = False):
+
+def create_token(
+    user_id: str,
+    permissions: set[str],
+    refresh_token: bool = False,
+    session_id: str | None = None,
+):
+    claims = {"sub": user_id, **permission_claims(permissions)}
+    if session_id is not None:
+        claims["sid"] = session_id
     if refresh_token:
-        return create_jwt_token(
-            {"sub": user_id, "permissions": [*permissions]},
-            timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
-        )
+        return create_jwt_token(claims, timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS))
     else:
-        return create_jwt_token(
-            {"sub": user_id, "permissions": [*permissions]},
-            timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
-        )
+        return create_jwt_token(claims, timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+
+
+def decode_access_token(access_token: str) -> DecodedToken:
+    payload = jwt.decode(access_token, VERIFYING_KEY, algorithms=[ALGORITHM])
+    return DecodedToken(
+        payload.get("sub"),
+        payload.get("jti", access_token),
+        int(payload.get("exp", 0)),
+        decode_permissions(payload),
+    )
 
 
 class AccountService(AccountServiceServicer):
-    def __init__(self, user_rep: UserRepository, tokens_clt: TokensClient):
+    def __init__(
+        self,
+        user_rep: UserRepository,
+        tokens_clt: TokensClient,
+        password_hasher: PasswordHasher,
+        revocation_filter: RevocationFilter,
+        permission_cache: PermissionCache,
+        token_cache: TokenCache | None = None,
+    ):
         super().__init__()
         self._user_rep = user_rep
         self._tokens_clt = tokens_clt
+        self._permission_cache = permission_cache
+        self._password_hasher = password_hasher
+        self._revocation_filter = revocation_filter
+        self._token_cache = token_cache if token_cache is not None else TokenCache()
+
+    async def _is_revoked(self, jti: str) -> bool:
+        if not self._revocation_filter.might_be_revoked(jti):
+            return False
+        revoked = await self._tokens_clt.is_token_id_revoked(jti)
+        self._revocation_filter.record_store_check(revoked)
+        return revoked
+
+    async def _resolve_permissions(self, user_id: str) -> set[str]:
+        user = await self._user_rep.get_user_by_id(user_id)
+        if user is None:
+            return set()
+        return await self._permission_cache.get_permissions(user.group_ids)
 
     async def Auth(
         self, request: AuthRequest, context: ServicerContext
     ) -> AuthResponse:
         try:
-            user = await self._user_rep.get_user_by_username(request.username)
+            user = await self._user_rep.get_login_user(request.username)
             if user is not None:
-                if pwd_context.verify(request.password, user.password):
-                    permissions = await self._user_rep.get_permissions(user.username)
-
-                    access_token = create_token(str(user.id), permissions)
-                    refresh_token = create_token(str(user.id), permissions, True)
-
-                    await self._tokens_clt.update_tokens_pair(
-                        access_token, refresh_token
+                if await self._password_hasher.verify(request.password, user.password):
+                    permissions = await self._permission_cache.get_permissions(
+                        user.group_ids
                     )
-
-                    await self._user_rep.update_refresh_token(
-                        str(user.id), refresh_token
+                    user_id = str(user.id)
+                    # Every login opens its own session, so users can be logged in on several devices
+                    session_id = uuid.uuid4().hex
+                    access_token = create_token(user_id, permissions, session_id=session_id)
+                    refresh_token = create_token(user_id, permissions, True, session_id)
+
+                    await self._tokens_clt.create_session(
+                        user_id,
+                        session_id,
+                        access_token,
+                        refresh_token,
+                        [str(group_id) for group_id in user.group_ids],
                     )
 
                     return AuthResponse(
@@ -93,6 +169,11 @@ class AccountService(AccountServiceServicer):
                     return AuthResponse(code=401, message="Incorrect login or password")
             else:
                 return AuthResponse(code=404, message="User with this login not found")
+        except HashingOverloadedError as ex:
+            # Not a backend failure, so circuit breakers of the gateway keep other calls flowing
+            return AuthResponse(code=429, message=str(ex))
+        except (DeadlineExceededError, TimeoutError):
+            return AuthResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return AuthResponse(code=500, message=f"Error : {ex}, args : {ex.args}")
 
@@ -101,77 +182,116 @@ class AccountService(AccountServiceServicer):
     ) -> RefreshResponse:
         old_refresh_token = request.refresh_token
         try:
-            payload = jwt.decode(old_refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = jwt.decode(
+                old_refresh_token, VERIFYING_KEY, algorithms=[ALGORITHM]
+            )
 
             user_id: str = payload.get("sub")
-            permissions: list[str] = payload.get("permissions")
+            session_id: str | None = payload.get("sid")
 
-            user = await self._user_rep.get_user_by_id(user_id)
-
-            if (
-                user is None
-                or user.refresh_token is None
-                or user.refresh_token != old_refresh_token
-            ):
+            # Tokens issued before sessions moved to Redis have no session id
+            session = (
+                await self._tokens_clt.get_session(user_id, session_id)
+                if session_id is not None
+                else None
+            )
+            if session is None or session.refresh_hash != get_token_hash(old_refresh_token):
                 return RefreshResponse(code=401, message="Incorrect refresh token")
-            else:
-
-                await self._tokens_clt.block_old_tokens_pair(old_refresh_token)
 
-                access_token = create_token(user_id, permissions)
-                refresh_token = create_token(user_id, permissions, True)
+            # Resolved again, so group and permission changes reach the user on refresh
+            permissions = await self._permission_cache.get_permissions(session.group_ids)
 
-                await self._tokens_clt.update_tokens_pair(access_token, refresh_token)
+            access_token = create_token(user_id, permissions, session_id=session_id)
+            refresh_token = create_token(user_id, permissions, True, session_id)
 
-                await self._user_rep.update_refresh_token(user_id, refresh_token)
+            # Hash is compared again in the rotation, one of concurrent refreshes wins
+            if not await self._tokens_clt.rotate_session(
+                user_id, session_id, old_refresh_token, access_token, refresh_token
+            ):
+                return RefreshResponse(code=401, message="Incorrect refresh token")
 
-                return AuthResponse(
-                    code=200,
-                    tokens=TokenPair(
-                        access_token=access_token, refresh_token=refresh_token
-                    ),
-                )
+            return AuthResponse(
+                code=200,
+                tokens=TokenPair(access_token=access_token, refresh_token=refresh_token),
+            )
         except jwt.ExpiredSignatureError:
             return RefreshResponse(code=401, message="Refresh token expired")
         except JWTError:
             return RefreshResponse(code=401, message="Invalid refresh token")
+        except (DeadlineExceededError, TimeoutError):
+            return RefreshResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return RefreshResponse(code=500, message=f"Error : {ex}, args : {ex.args}")
 
-    async def CheckPermissions(
-        self, request: CheckPermissionsRequest, context: ServicerContext
-    ):
-        access_token = request.access_token
+    async def _check_token(
+        self, access_token: str, permissions: list[str]
+    ) -> list[CheckPermissionsResponse]:
+        # Token is decoded and looked up in the revocation list once for all permissions
         try:
-            if await self._tokens_clt.is_access_token_in_black_list(access_token):
-                return CheckPermissionsResponse(
-                    code=403, message="Access token in blacklist"
-                )
-            else:
-                try:
-                    payload = jwt.decode(
-                        access_token, SECRET_KEY, algorithms=[ALGORITHM]
-                    )
-
-                    permissions: list[str] = payload.get("permissions")
-                    user_id = payload.get("sub")
-
-                    if request.permission in permissions:
-                        return CheckPermissionsResponse(code=200, user_id=user_id)
-                    else:
-                        return CheckPermissionsResponse(
-                            code=403, message="Access denied"
-                        )
-                except jwt.ExpiredSignatureError:
-                    return RefreshResponse(code=401, message="Access token expired")
-                except JWTError:
-                    return RefreshResponse(code=401, message="Invalid refresh token")
-                except Exception as ex:
-                    return RefreshResponse(
-                        code=500, message=f"Error : {ex}, args : {ex.args}"
-                    )
+            # Verified tokens are cached until their exp, revocation is checked on every call
+            decoded = self._token_cache.get(access_token)
+            if decoded is None:
+                decoded = decode_access_token(access_token)
+                if decoded.permissions is not None:
+                    self._token_cache.put(access_token, decoded)
+
+            if await self._is_revoked(decoded.jti):
+                error = CheckPermissionsResponse(code=403, message="Access token in blacklist")
+                return [error] * len(permissions)
+
+            user_id = decoded.user_id
+            granted = decoded.permissions
+            if granted is None:
+                # Issued by a replica with a newer catalog, resolved from the groups
+                granted = await self._resolve_permissions(user_id)
+
+            return [
+                CheckPermissionsResponse(code=200, user_id=user_id)
+                if permission in granted
+                else CheckPermissionsResponse(code=403, message="Access denied")
+                for permission in permissions
+            ]
+        except jwt.ExpiredSignatureError:
+            error = CheckPermissionsResponse(code=401, message="Access token expired")
+        except JWTError:
+            error = CheckPermissionsResponse(code=401, message="Invalid access token")
+        except (DeadlineExceededError, TimeoutError):
+            error = CheckPermissionsResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
-            return RefreshResponse(code=500, message=f"Error : {ex}, args : {ex.args}")
+            error = CheckPermissionsResponse(
+                code=500, message=f"Error : {ex}, args : {ex.args}"
+            )
+        return [error] * len(permissions)
+
+    async def CheckPermissions(
+        self, request: CheckPermissionsRequest, context: ServicerContext
+    ) -> CheckPermissionsResponse:
+        responses = await self._check_token(request.access_token, [request.permission])
+        return responses[0]
+
+    async def CheckPermissionsBatch(
+        self, request: CheckPermissionsBatchRequest, context: ServicerContext
+    ) -> CheckPermissionsBatchResponse:
+        # Positions of the results grouped by token, every token is checked once
+        tokens: dict[str, tuple[list[int], list[str]]] = {}
+        checks = [(request.access_token, permission) for permission in request.permissions]
+        checks.extend((check.access_token, check.permission) for check in request.checks)
+        for position, (access_token, permission) in enumerate(checks):
+            positions, permissions = tokens.setdefault(access_token, ([], []))
+            positions.append(position)
+            permissions.append(permission)
+
+        token_results = await asyncio.gather(
+            *(
+                self._check_token(access_token, permissions)
+                for access_token, (_, permissions) in tokens.items()
+            )
+        )
+        results = [None] * len(checks)
+        for (positions, _), responses in zip(tokens.values(), token_results):
+            for position, response in zip(positions, responses):
+                results[position] = response
+        return CheckPermissionsBatchResponse(results=results)
 
     async def Logout(
         self, request: LogoutRequest, context: ServicerContext
@@ -180,38 +300,78 @@ class AccountService(AccountServiceServicer):
         try:
             payload = jwt.decode(
                 access_token,
-                SECRET_KEY,
+                VERIFYING_KEY,
                 algorithms=[ALGORITHM],
                 options={"verify_exp": False},
             )
 
             user_id: str = payload.get("sub")
+            session_id: str | None = payload.get("sid")
 
-            user = await self._user_rep.get_user_by_id(user_id)
-            if not user:
-                return LogoutResponse(code=404, message="User not found")
-
-            refresh_token = user.refresh_token
-
-            await self._tokens_clt.block_old_tokens_pair(refresh_token)
-
-            await self._user_rep.remove_user_refresh_token(user_id)
+            if session_id is None or not await self._tokens_clt.end_session(
+                user_id, session_id
+            ):
+                return LogoutResponse(code=404, message="Session not found")
 
             return LogoutResponse(code=200)
         except JWTError:
             return LogoutResponse(code=401, message="Invalid refresh token")
+        except (DeadlineExceededError, TimeoutError):
+            return LogoutResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return LogoutResponse(code=500, message=f"Error : {ex}, args : {ex.args}")
 
+    async def WatchRevokedTokens(
+        self, request: WatchRevokedTokensRequest, context: ServicerContext
+    ):
+        queue = self._tokens_clt.subscribe()
+        try:
+            # Snapshot is taken only once revocations are followed, so none falls in between
+            await asyncio.wait_for(self._tokens_clt.wait_listening(), 5)
+            yield RevokedTokensArray(
+                arr=[
+                    RevokedTokenData(jti=jti, exp=exp)
+                    for jti, exp in await self._tokens_clt.get_revoked_tokens()
+                ]
+            )
+            while True:
+                revoked = [await queue.get()]
+                while not queue.empty():
+                    revoked.append(queue.get_nowait())
+
+                feed_lost = FEED_LOST in revoked
+                revoked = [entry for entry in revoked if entry is not FEED_LOST]
+                if revoked:
+                    yield RevokedTokensArray(
+                        arr=[RevokedTokenData(jti=jti, exp=exp) for jti, exp in revoked]
+                    )
+                if feed_lost:
+                    # Ending the stream makes the watcher reconnect and take a new snapshot
+                    return
+        finally:
+            self._tokens_clt.unsubscribe(queue)
+
 
 async def serve():
 
-    server = grpc.aio.server()
+    server = grpc.aio.server(interceptors=[DeadlineInterceptor()])
+
+    start_http_server(int(os.environ.get("ACCOUNT_METRICS_PORT", 9051)))
 
-    async with UserRepository() as user_rep, TokensClient() as tokens_clt:
+    async with (
+        UserRepository() as user_rep,
+        TokensClient() as tokens_clt,
+        PasswordHasher() as password_hasher,
+        RevocationFilter(tokens_clt) as revocation_filter,
+        PermissionCache(user_rep) as permission_cache,
+        SessionSync(user_rep, tokens_clt),
+    ):
 
         add_AccountServiceServicer_to_server(
-            AccountService(user_rep, tokens_clt), server
+            AccountService(
+                user_rep, tokens_clt, password_hasher, revocation_filter, permission_cache
+            ),
+            server,
         )
         server.add_insecure_port(
             f"[::]:{os.environ.get("ACCOUNT_SERVICE_PORT", 50051)}"
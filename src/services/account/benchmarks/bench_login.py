@@ -0,0 +1,99 @@
+# Measures logins per second of the database part of Auth: the previous path with separate
+# user, permissions and refresh token transactions against the single query path
+# with permissions resolved from the group permission cache and the session kept in Redis.
+# bcrypt is left out, it runs in the hashing pool and would hide the database work.
+# Needs the database of docker-compose (POSTGRES_* variables) with the admin user of db_scripts
+# and Redis (REDIS_HOST, REDIS_PORT) for the permission cache and sessions.
+# Run from the account folder: python -m benchmarks.bench_login
+import asyncio
+import functools
+import os
+import time
+import uuid
+
+from account_service import create_token
+from clients.redis.permission_cache import PermissionCache
+from clients.redis.tokens_client import TokensClient
+from repositories.user_repository import UserRepository
+
+
+DURATION = float(os.environ.get("BENCH_DURATION", "10"))
+CONNECTIONS = int(os.environ.get("BENCH_CONNECTIONS", "32"))
+USERNAME = os.environ.get("BENCH_USERNAME", "admin")
+
+
+async def previous_login(user_rep: UserRepository):
+    # Queries of Auth before the single query path, every one in its own transaction
+    async with user_rep._db_pool.acquire() as conn:
+        async with conn.transaction():
+            user = await conn.fetchrow(
+                "SELECT account.id, account.username, account.password FROM account WHERE username = $1 and is_active = TRUE",
+                USERNAME,
+            )
+    async with user_rep._db_pool.acquire() as conn:
+        async with conn.transaction():
+            rows = await conn.fetch(
+                'SELECT permission.name AS permission_name FROM permission JOIN group_permission ON permission.id = group_permission.permission_id JOIN "group" ON group_permission.group_id = "group".id JOIN account_group ON account_group.group_id = "group".id JOIN account ON account_group.account_id = account.id WHERE account.username = $1 and account.is_active = TRUE',
+                USERNAME,
+            )
+    permissions = {row["permission_name"] for row in rows}
+    create_token(str(user["id"]), permissions, True)
+    # Refresh token column is gone, a row update of the same cost stands for its write
+    async with user_rep._db_pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                "UPDATE company.public.account SET updated_at = NOW() WHERE id = $1 and is_active = TRUE",
+                user["id"],
+            )
+
+
+async def single_query_login(
+    permission_cache: PermissionCache, tokens_clt: TokensClient, user_rep: UserRepository
+):
+    user = await user_rep.get_login_user(USERNAME)
+    permissions = await permission_cache.get_permissions(user.group_ids)
+    session_id = uuid.uuid4().hex
+    access_token = create_token(str(user.id), permissions, session_id=session_id)
+    refresh_token = create_token(str(user.id), permissions, True, session_id)
+    await tokens_clt.create_session(
+        str(user.id),
+        session_id,
+        access_token,
+        refresh_token,
+        [str(group_id) for group_id in user.group_ids],
+    )
+
+
+async def measure(user_rep: UserRepository, login) -> float:
+    deadline = time.monotonic() + DURATION
+
+    async def run_connection() -> int:
+        logins = 0
+        while time.monotonic() < deadline:
+            await login(user_rep)
+            logins += 1
+        return logins
+
+    logins = await asyncio.gather(*(run_connection() for _ in range(CONNECTIONS)))
+    return sum(logins) / DURATION
+
+
+async def main():
+    async with (
+        UserRepository() as user_rep,
+        PermissionCache(user_rep) as permission_cache,
+        TokensClient() as tokens_clt,
+    ):
+        if await user_rep.get_login_user(USERNAME) is None:
+            raise SystemExit(f"User {USERNAME} not found")
+        previous = await measure(user_rep, previous_login)
+        print(f"previous path: {previous:.0f} logins/s")
+        # The cache loads while the previous path runs
+        single = await measure(
+            user_rep, functools.partial(single_query_login, permission_cache, tokens_clt)
+        )
+        print(f"single query path: {single:.0f} logins/s, x{single / previous:.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
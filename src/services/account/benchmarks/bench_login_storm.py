@@ -0,0 +1,126 @@
+# Measures latency of a cheap RPC (CheckPermissions) while a login storm runs against Auth,
+# with bcrypt on the event loop and in the hashing process pool.
+# Users live in memory, so only the service itself is measured and no database has to run,
+# tokens are kept in Redis (REDIS_HOST, REDIS_PORT).
+# Run from the account folder after generating grpc_build (see Dockerfile):
+# python -m benchmarks.bench_login_storm
+import asyncio
+import os
+import statistics
+import time
+from types import SimpleNamespace
+
+import grpc
+
+from account_service import AccountService, create_token
+from clients.redis.tokens_client import TokensClient
+from grpc_build.account_service_pb2 import AuthRequest, CheckPermissionsRequest
+from grpc_build.account_service_pb2_grpc import (
+    AccountServiceStub,
+    add_AccountServiceServicer_to_server,
+)
+from lib.password_hasher import PasswordHasher, pwd_context
+from lib.revocation_filter import RevocationFilter
+
+
+ADDRESS = f"127.0.0.1:{os.environ.get("BENCH_PORT", "50951")}"
+DURATION = float(os.environ.get("BENCH_DURATION", "10"))
+STORM_CONNECTIONS = int(os.environ.get("BENCH_STORM_CONNECTIONS", "32"))
+PROBE_INTERVAL = float(os.environ.get("BENCH_PROBE_INTERVAL", "0.02"))
+
+USERNAME = "storm"
+PASSWORD = "storm-password"
+PERMISSION = "get_user"
+GROUP_ID = "9b2d4a5e-3c1f-4e8a-a6d7-0f1e2c3b4a59"
+
+
+class InMemoryUsers:
+    def __init__(self):
+        self._user = SimpleNamespace(
+            id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+            username=USERNAME,
+            password=pwd_context.hash(PASSWORD),
+            group_ids=[GROUP_ID],
+        )
+
+    async def get_login_user(self, username: str):
+        return self._user if username == USERNAME else None
+
+
+class StaticPermissions:
+    async def get_permissions(self, group_ids) -> set[str]:
+        return {PERMISSION}
+
+
+class InlineHasher:
+    # Previous behaviour, bcrypt runs on the event loop
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return pwd_context.verify(password, hashed_password)
+
+
+async def run_storm(stub: AccountServiceStub, deadline: float) -> int:
+    logins = 0
+    while time.monotonic() < deadline:
+        resp = await stub.Auth(AuthRequest(username=USERNAME, password=PASSWORD))
+        logins += resp.code == 200
+    return logins
+
+
+async def run_probes(stub: AccountServiceStub, deadline: float) -> list[float]:
+    request = CheckPermissionsRequest(
+        access_token=create_token("3fa85f64-5717-4562-b3fc-2c963f66afa6", {PERMISSION}),
+        permission=PERMISSION,
+    )
+    latencies = []
+    while time.monotonic() < deadline:
+        start = time.monotonic()
+        await stub.CheckPermissions(request)
+        latencies.append(time.monotonic() - start)
+        await asyncio.sleep(PROBE_INTERVAL)
+    return latencies
+
+
+async def measure(hasher, storm_connections: int) -> tuple[list[float], int]:
+    server = grpc.aio.server()
+    async with TokensClient() as tokens_clt, RevocationFilter(tokens_clt) as revocation_filter:
+        add_AccountServiceServicer_to_server(
+            AccountService(
+                InMemoryUsers(), tokens_clt, hasher, revocation_filter, StaticPermissions()
+            ),
+            server,
+        )
+        server.add_insecure_port(ADDRESS)
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(ADDRESS) as channel:
+                stub = AccountServiceStub(channel)
+                deadline = time.monotonic() + DURATION
+                latencies, *logins = await asyncio.gather(
+                    run_probes(stub, deadline),
+                    *(run_storm(stub, deadline) for _ in range(storm_connections)),
+                )
+        finally:
+            await server.stop(None)
+    return latencies, sum(logins)
+
+
+def report(name: str, latencies: list[float], logins: int):
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(
+        f"{name}: CheckPermissions p50 {p50:.1f} ms, p99 {p99:.1f} ms, "
+        f"{logins / DURATION:.0f} logins/s"
+    )
+
+
+async def main():
+    print(f"{os.cpu_count()} cpus, {STORM_CONNECTIONS} login connections")
+    report("idle", *await measure(InlineHasher(), 0))
+    report("bcrypt on the event loop", *await measure(InlineHasher(), STORM_CONNECTIONS))
+    async with PasswordHasher() as hasher:
+        report("bcrypt in the process pool", *await measure(hasher, STORM_CONNECTIONS))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+# Measures CPU time of the token part of CheckPermissions: verifying and decoding the access token
+# on every call against the decoded token cache. Users present their tokens in random order,
+# like the gateway does while the tokens live. Nothing but the service code has to run.
+# Run from the account folder after generating grpc_build (see Dockerfile):
+# python -m benchmarks.bench_token_cache
+import os
+import random
+import time
+import uuid
+
+from account_service import create_token, decode_access_token
+from lib.permission_catalog import PERMISSION_CATALOGS, PERMISSION_CATALOG_VERSION
+from lib.token_cache import TokenCache
+
+
+CALLS = int(os.environ.get("BENCH_CALLS", "200000"))
+USERS = int(os.environ.get("BENCH_USERS", "1000"))
+
+PERMISSION = "READ_CARGO"
+
+
+def check_uncached(tokens: list[str]) -> float:
+    start = time.process_time()
+    for token in tokens:
+        PERMISSION in decode_access_token(token).permissions
+    return time.process_time() - start
+
+
+def check_cached(tokens: list[str], cache: TokenCache) -> float:
+    start = time.process_time()
+    for token in tokens:
+        decoded = cache.get(token)
+        if decoded is None:
+            decoded = decode_access_token(token)
+            cache.put(token, decoded)
+        PERMISSION in decoded.permissions
+    return time.process_time() - start
+
+
+def main():
+    permissions = set(PERMISSION_CATALOGS[PERMISSION_CATALOG_VERSION])
+    users = [create_token(str(uuid.uuid4()), permissions) for _ in range(USERS)]
+    tokens = random.choices(users, k=CALLS)
+
+    uncached = check_uncached(tokens) / CALLS * 1e6
+    print(f"jwt.decode on every call: {uncached:.1f} us/call")
+
+    cache = TokenCache()
+    cached = check_cached(tokens, cache) / CALLS * 1e6
+    stats = cache.stats()
+    print(
+        f"decoded token cache: {cached:.1f} us/call, x{uncached / cached:.1f}, "
+        f"hit rate {stats["hit_rate"]:.3f}, "
+        f"{stats["entries"]} entries, {stats["bytes"] / stats["entries"]:.0f} bytes/entry"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+
+import redis.asyncio
+
+from repositories.user_repository import UserRepository
+
+
+REDIS_URL = (
+    f"redis://"
+    f"{os.environ.get("REDIS_HOST", "localhost")}"
+    f":"
+    f"{os.environ.get("REDIS_PORT", "6379")}"
+)
+PERMISSIONS_REDIS_DB = os.environ.get("PERMISSIONS_REDIS_DB", "2")
+
+# Hash of group id -> json list of permission names, the map published for other services
+GROUP_PERMISSIONS_KEY = "group_permissions"
+# Sent by triggers of group_permission and permission with a group id, "*" for all groups
+GROUP_PERMISSIONS_CHANNEL = "group_permissions_changed"
+RECONNECT_DELAY = 1
+
+# Queued when the listening connection is lost
+_TERMINATED = ""
+
+
+class PermissionCache:
+    # Group -> permissions map held in memory, user permissions become a union of a few sets.
+    # Group membership is read with the user row, so only this map has to be invalidated.
+    def __init__(
+        self,
+        user_rep: UserRepository,
+        redis_url: str = REDIS_URL,
+        redis_db: str = PERMISSIONS_REDIS_DB,
+    ):
+        self._user_rep = user_rep
+        self._redis_url = f"{redis_url}/{redis_db}"
+        self._redis_client: redis.asyncio.Redis | None = None
+        self._group_permissions: dict[str, frozenset[str]] | None = None
+        self._task: asyncio.Task | None = None
+
+    async def connect(self):
+        self._redis_client = redis.asyncio.from_url(self._redis_url)
+        self._task = asyncio.create_task(self._follow())
+
+    async def disconnect(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        await self._redis_client.aclose()
+        self._redis_client = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.disconnect()
+
+    async def get_permissions(self, group_ids) -> set[str]:
+        group_permissions = self._group_permissions
+        if group_permissions is None:
+            # Not loaded or changes may be missed, ask Postgres directly
+            group_permissions = await self._user_rep.get_group_permissions(
+                [str(group_id) for group_id in group_ids]
+            )
+        permissions = set()
+        for group_id in group_ids:
+            permissions.update(group_permissions.get(str(group_id), ()))
+        return permissions
+
+    async def _store(
+        self,
+        group_permissions: dict[str, set[str]],
+        removed: list[str] = (),
+        replace: bool = False,
+    ):
+        try:
+            async with self._redis_client.pipeline(transaction=True) as pipe:
+                if replace:
+                    pipe.delete(GROUP_PERMISSIONS_KEY)
+                if removed:
+                    pipe.hdel(GROUP_PERMISSIONS_KEY, *removed)
+                if group_permissions:
+                    pipe.hset(
+                        GROUP_PERMISSIONS_KEY,
+                        mapping={
+                            group_id: json.dumps(sorted(permissions))
+                            for group_id, permissions in group_permissions.items()
+                        },
+                    )
+                await pipe.execute()
+        except redis.RedisError as ex:
+            print(f"Permission cache copy not updated : {ex}")
+
+    async def _load_all(self):
+        group_permissions = await self._user_rep.get_group_permissions()
+        self._group_permissions = {
+            group_id: frozenset(permissions)
+            for group_id, permissions in group_permissions.items()
+        }
+        await self._store(group_permissions, replace=True)
+
+    async def _load_groups(self, group_ids: set[str]):
+        group_permissions = await self._user_rep.get_group_permissions(list(group_ids))
+        updated = dict(self._group_permissions)
+        removed = []
+        for group_id in group_ids:
+            if group_id in group_permissions:
+                updated[group_id] = frozenset(group_permissions[group_id])
+            elif updated.pop(group_id, None) is not None:
+                removed.append(group_id)
+        # Replaced at once, so concurrent lookups never see a half updated map
+        self._group_permissions = updated
+        await self._store(group_permissions, removed)
+
+    async def _follow(self):
+        while True:
+            conn = None
+            # New queue for every connection: asyncpg calls termination listeners soon after close,
+            # a shared queue would get the end of the old connection and drop the new one
+            changes: asyncio.Queue[str] = asyncio.Queue()
+            try:
+                # Listening before the full load, so changes committed meanwhile are not missed
+                conn = await self._user_rep.listen(
+                    GROUP_PERMISSIONS_CHANNEL,
+                    changes.put_nowait,
+                    lambda: changes.put_nowait(_TERMINATED),
+                )
+                await self._load_all()
+                while True:
+                    group_ids = {await changes.get()}
+                    while not changes.empty():
+                        group_ids.add(changes.get_nowait())
+                    if _TERMINATED in group_ids:
+                        break
+                    if "*" in group_ids:
+                        await self._load_all()
+                    else:
+                        await self._load_groups(group_ids)
+            except Exception as ex:
+                print(f"Permission cache listener failed : {ex}")
+            finally:
+                # Changes may be missed until the map is reloaded after reconnecting
+                self._group_permissions = None
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(RECONNECT_DELAY)
@@ -1,41 +1,297 @@
+import asyncio
+import hashlib
+import os
+import time
+
+import redis.asyncio
+from jose import jwt
+
+
+REDIS_URL = (
+    f"redis://"
+    f"{os.environ.get("REDIS_HOST", "localhost")}"
+    f":"
+    f"{os.environ.get("REDIS_PORT", "6379")}"
+)
+TOKENS_REDIS_DB = os.environ.get("TOKENS_REDIS_DB", "2")
+
+# Only token ids and hashes are stored, every key expires together with its token:
+# "session:<user id>:<session id>" hash of the refresh token hash, "<access jti>:<access exp>"
+# and group ids, "user_sessions:<user id>" set of session ids of a user,
+# "revoked:<jti>" -> exp, "revoked_tokens" sorted set of revoked ids by exp feeds new watchers
+SESSION_PREFIX = "session:"
+USER_SESSIONS_PREFIX = "user_sessions:"
+REVOKED_PREFIX = "revoked:"
+REVOKED_SET = "revoked_tokens"
+REVOKED_CHANNEL = "revoked_tokens"
+# Put on every subscriber queue when the revocation feed is lost, revocations published
+# afterwards are missed until the subscriber takes a new snapshot
+FEED_LOST = None
+
+# Revokes an access token "jti:exp" still in use, Redis clock is used,
+# so replicas with skewed clocks expire the same tokens
+REVOKE_ACCESS_LUA = """
+local now = tonumber(redis.call('TIME')[1])
+local function revoke(access)
+    if not access then
+        return
+    end
+    local separator = string.find(access, ':', 1, true)
+    local jti = string.sub(access, 1, separator - 1)
+    local exp = tonumber(string.sub(access, separator + 1))
+    if exp > now then
+        redis.call('SET', 'revoked:' .. jti, exp, 'EXAT', exp)
+        redis.call('ZADD', 'revoked_tokens', exp, jti)
+        redis.call('PUBLISH', 'revoked_tokens', access)
+    end
+end
+"""
+
+# Rotates or ends one session, so a refresh takes one round trip and is atomic.
+# KEYS: session, user sessions; ARGV: session id, expected refresh hash or "" to skip the check,
+# new refresh hash or "" to end the session, new access "jti:exp", new refresh exp.
+ROTATE_SESSION_SCRIPT = REVOKE_ACCESS_LUA + """
+local session = redis.call('HMGET', KEYS[1], 'refresh', 'access')
+if not session[1] or (ARGV[2] ~= '' and session[1] ~= ARGV[2]) then
+    return 0
+end
+revoke(session[2])
+redis.call('ZREMRANGEBYSCORE', 'revoked_tokens', '-inf', now)
+if ARGV[3] ~= '' then
+    redis.call('HSET', KEYS[1], 'refresh', ARGV[3], 'access', ARGV[4])
+    redis.call('EXPIREAT', KEYS[1], ARGV[5])
+    redis.call('EXPIREAT', KEYS[2], ARGV[5])
+else
+    redis.call('DEL', KEYS[1])
+    redis.call('SREM', KEYS[2], ARGV[1])
+end
+return 1
+"""
+
+# Ends every session of a user. KEYS: user sessions; ARGV: user id.
+END_USER_SESSIONS_SCRIPT = REVOKE_ACCESS_LUA + """
+for _, session_id in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+    local session = 'session:' .. ARGV[1] .. ':' .. session_id
+    revoke(redis.call('HGET', session, 'access'))
+    redis.call('DEL', session)
+end
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+# Replaces group ids of live sessions of a user. KEYS: user sessions; ARGV: user id, group ids.
+SET_SESSIONS_GROUPS_SCRIPT = """
+for _, session_id in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+    local session = 'session:' .. ARGV[1] .. ':' .. session_id
+    if redis.call('EXISTS', session) == 1 then
+        redis.call('HSET', session, 'groups', ARGV[2])
+    else
+        redis.call('SREM', KEYS[1], session_id)
+    end
+end
+return 1
+"""
+
+
+def get_token_id(token: str) -> tuple[str, int]:
+    claims = jwt.get_unverified_claims(token)
+    return claims.get("jti", token), int(claims.get("exp", 0))
+
+
+def get_token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class Session:
+    __slots__ = ("refresh_hash", "group_ids")
+
+    def __init__(self, refresh_hash: str, group_ids: list[str]):
+        self.refresh_hash = refresh_hash
+        self.group_ids = group_ids
+
+
 class TokensClient:
-    def __init__(self):
-        self._tokens_blacklist = set()
-        self._tokes_pairs = {}
+    def __init__(self, redis_url: str = REDIS_URL, redis_db: str = TOKENS_REDIS_DB):
+        self._redis_url = f"{redis_url}/{redis_db}"
+        self._redis_client: redis.asyncio.Redis | None = None
+        self._rotate_session = None
+        self._end_user_sessions = None
+        self._set_sessions_groups = None
+        self._subscribers: set[asyncio.Queue] = set()
+        self._listen_task: asyncio.Task | None = None
+        self._listening = asyncio.Event()
 
     async def connect(self):
-        pass
+        self._redis_client = redis.asyncio.from_url(self._redis_url)
+        self._rotate_session = self._redis_client.register_script(ROTATE_SESSION_SCRIPT)
+        self._end_user_sessions = self._redis_client.register_script(
+            END_USER_SESSIONS_SCRIPT
+        )
+        self._set_sessions_groups = self._redis_client.register_script(
+            SET_SESSIONS_GROUPS_SCRIPT
+        )
 
     async def disconnect(self):
-        pass
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        await self._redis_client.aclose()
+        self._redis_client = None
 
-    def __del__(self):
-        pass
-    
     async def __aenter__(self):
         await self.connect()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_value, traceback):
         await self.disconnect()
 
-    async def update_tokens_pair(self, access_token: str, refresh_token: str):
-        self._tokes_pairs.update({refresh_token: access_token})
+    async def create_session(
+        self,
+        user_id: str,
+        session_id: str,
+        access_token: str,
+        refresh_token: str,
+        group_ids: list[str],
+    ):
+        access_jti, access_exp = get_token_id(access_token)
+        _, refresh_exp = get_token_id(refresh_token)
+        session_key = f"{SESSION_PREFIX}{user_id}:{session_id}"
+        user_sessions_key = f"{USER_SESSIONS_PREFIX}{user_id}"
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                session_key,
+                mapping={
+                    "refresh": get_token_hash(refresh_token),
+                    "access": f"{access_jti}:{access_exp}",
+                    "groups": ",".join(group_ids),
+                },
+            )
+            pipe.expireat(session_key, refresh_exp)
+            pipe.sadd(user_sessions_key, session_id)
+            # Sessions live equally long, so the newest one expires last
+            pipe.expireat(user_sessions_key, refresh_exp)
+            await pipe.execute()
+
+    async def get_session(self, user_id: str, session_id: str) -> Session | None:
+        refresh_hash, groups = await self._redis_client.hmget(
+            f"{SESSION_PREFIX}{user_id}:{session_id}", "refresh", "groups"
+        )
+        if refresh_hash is None:
+            return None
+        group_ids = (groups or b"").decode().split(",")
+        return Session(refresh_hash.decode(), [group_id for group_id in group_ids if group_id])
+
+    async def rotate_session(
+        self,
+        user_id: str,
+        session_id: str,
+        old_refresh_token: str,
+        access_token: str,
+        refresh_token: str,
+    ) -> bool:
+        # False when the old refresh token was already used, the session is kept as it is
+        access_jti, access_exp = get_token_id(access_token)
+        _, refresh_exp = get_token_id(refresh_token)
+        return bool(
+            await self._rotate_session(
+                keys=[
+                    f"{SESSION_PREFIX}{user_id}:{session_id}",
+                    f"{USER_SESSIONS_PREFIX}{user_id}",
+                ],
+                args=[
+                    session_id,
+                    get_token_hash(old_refresh_token),
+                    get_token_hash(refresh_token),
+                    f"{access_jti}:{access_exp}",
+                    refresh_exp,
+                ],
+            )
+        )
 
-    async def _add_access_token_to_blacklist(self, access_token: str):
-        self._tokens_blacklist.add(access_token)
+    async def end_session(self, user_id: str, session_id: str) -> bool:
+        return bool(
+            await self._rotate_session(
+                keys=[
+                    f"{SESSION_PREFIX}{user_id}:{session_id}",
+                    f"{USER_SESSIONS_PREFIX}{user_id}",
+                ],
+                args=[session_id, "", "", "", 0],
+            )
+        )
 
-    async def _get_access_token(self, refresh_token: str):
-        return self._tokes_pairs.get(refresh_token, None)
+    async def end_user_sessions(self, user_id: str):
+        await self._end_user_sessions(
+            keys=[f"{USER_SESSIONS_PREFIX}{user_id}"], args=[user_id]
+        )
 
-    async def _remove_tokens_pair(self, refresh_token: str):
-        self._tokes_pairs.pop(refresh_token, None)
+    async def get_session_user_ids(self, count: int = 1000):
+        # Users holding sessions, yielded in batches
+        user_ids = []
+        async for key in self._redis_client.scan_iter(
+            match=f"{USER_SESSIONS_PREFIX}*", count=count
+        ):
+            user_ids.append(key.decode().removeprefix(USER_SESSIONS_PREFIX))
+            if len(user_ids) >= count:
+                yield user_ids
+                user_ids = []
+        if user_ids:
+            yield user_ids
+
+    async def set_sessions_groups(self, user_id: str, group_ids: list[str]):
+        await self._set_sessions_groups(
+            keys=[f"{USER_SESSIONS_PREFIX}{user_id}"], args=[user_id, ",".join(group_ids)]
+        )
 
     async def is_access_token_in_black_list(self, access_token: str):
-        return access_token in self._tokens_blacklist
+        jti, _ = get_token_id(access_token)
+        return await self.is_token_id_revoked(jti)
+
+    async def is_token_id_revoked(self, jti: str) -> bool:
+        return await self._redis_client.exists(f"{REVOKED_PREFIX}{jti}") > 0
+
+    async def get_revoked_tokens(self) -> list[tuple[str, int]]:
+        revoked = await self._redis_client.zrangebyscore(
+            REVOKED_SET, int(time.time()), "+inf", withscores=True
+        )
+        return [(jti.decode(), int(exp)) for jti, exp in revoked]
+
+    async def _listen(self):
+        # One subscription per service instance fans revocations of all replicas out to watchers
+        try:
+            async with self._redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(REVOKED_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        # redis-py reconnects and subscribes again on its own, so a repeated
+                        # confirmation means revocations published in between were missed
+                        if self._listening.is_set():
+                            for queue in self._subscribers:
+                                queue.put_nowait(FEED_LOST)
+                        self._listening.set()
+                        continue
+                    if message["type"] != "message":
+                        continue
+                    jti, _, exp = message["data"].decode().partition(":")
+                    for queue in self._subscribers:
+                        queue.put_nowait((jti, int(exp)))
+        finally:
+            self._listening.clear()
+            for queue in self._subscribers:
+                queue.put_nowait(FEED_LOST)
+
+    @property
+    def listening(self) -> bool:
+        return self._listening.is_set()
+
+    async def wait_listening(self):
+        await self._listening.wait()
 
-    async def block_old_tokens_pair(self, refresh_token: str):
-        old_access_token = await self._get_access_token(refresh_token)
-        await self._add_access_token_to_blacklist(old_access_token)
-        await self._remove_tokens_pair(refresh_token)
+    def subscribe(self) -> asyncio.Queue:
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.create_task(self._listen())
+        queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        return queue
 
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
@@ -0,0 +1,91 @@
+import base64
+
+
+# Bit positions of permissions in access tokens, in the order of db_scripts/9_create_roles.sql.
+# Any change goes to a new version, tokens name the version their mask was built with,
+# so services knowing older versions only can tell a mask they can not read.
+PERMISSION_CATALOGS: dict[int, tuple[str, ...]] = {
+    1: (
+        "CREATE_USER",
+        "UPDATE_USER",
+        "READ_USER",
+        "DELETE_USER",
+        "REACTIVATE_USER",
+        "READ_ACCOUNT",
+        "UPDATE_ACCOUNT",
+        "READ_GROUP",
+        "CREATE_GROUP",
+        "UPDATE_GROUP",
+        "READ_CARGO",
+        "CREATE_CARGO",
+        "UPDATE_CARGO",
+    ),
+}
+PERMISSION_CATALOG_VERSION = max(PERMISSION_CATALOGS)
+
+# Claims of the compact format, permissions missing from the catalog stay in "permissions"
+VERSION_CLAIM = "pv"
+MASK_CLAIM = "pm"
+NAMES_CLAIM = "permissions"
+
+_BITS = {
+    version: {name: 1 << position for position, name in enumerate(names)}
+    for version, names in PERMISSION_CATALOGS.items()
+}
+
+
+class GrantedPermissions:
+    __slots__ = ("_mask", "_bits", "_names")
+
+    def __init__(self, mask: int, bits: dict[str, int], names: frozenset[str]):
+        self._mask = mask
+        self._bits = bits
+        self._names = names
+
+    def __contains__(self, permission: str) -> bool:
+        bit = self._bits.get(permission)
+        if bit is not None and self._mask & bit:
+            return True
+        return permission in self._names
+
+
+def encode_permissions(permissions) -> dict:
+    bits = _BITS[PERMISSION_CATALOG_VERSION]
+    mask = 0
+    names = []
+    for permission in permissions:
+        bit = bits.get(permission)
+        if bit is None:
+            names.append(permission)
+        else:
+            mask |= bit
+
+    claims = {
+        VERSION_CLAIM: PERMISSION_CATALOG_VERSION,
+        MASK_CLAIM: base64.urlsafe_b64encode(
+            mask.to_bytes((mask.bit_length() + 7) // 8 or 1, "little")
+        )
+        .rstrip(b"=")
+        .decode(),
+    }
+    if names:
+        claims[NAMES_CLAIM] = sorted(names)
+    return claims
+
+
+def decode_permissions(payload: dict) -> GrantedPermissions | None:
+    # None when the token was built with a catalog version unknown here
+    names = frozenset(payload.get(NAMES_CLAIM) or ())
+    version = payload.get(VERSION_CLAIM)
+    if version is None:
+        # Token issued before the compact format, only names are there
+        return GrantedPermissions(0, {}, names)
+
+    bits = _BITS.get(version)
+    if bits is None:
+        return None
+    encoded = payload.get(MASK_CLAIM, "")
+    mask = int.from_bytes(
+        base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)), "little"
+    )
+    return GrantedPermissions(mask, bits, names)
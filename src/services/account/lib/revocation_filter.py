@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import math
+import os
+import time
+
+from prometheus_client import Counter, Gauge
+
+from clients.redis.tokens_client import FEED_LOST, TokensClient
+
+
+REVOCATION_FILTER_CAPACITY = int(os.environ.get("REVOCATION_FILTER_CAPACITY", "100000"))
+REVOCATION_FILTER_FP_RATE = float(os.environ.get("REVOCATION_FILTER_FP_RATE", "0.001"))
+# Bloom filters can not forget, so they are rebuilt from the store without expired tokens
+REVOCATION_FILTER_REBUILD_INTERVAL = float(
+    os.environ.get("REVOCATION_FILTER_REBUILD_INTERVAL", "300")
+)
+
+FILTER_CHECKS = Counter(
+    "revocation_filter_checks_total",
+    "Revocation checks by filter outcome: negative skips the store, "
+    "revoked and false_positive were filter hits checked in the store",
+    ["result"],
+)
+FILTER_ENTRIES = Gauge(
+    "revocation_filter_entries",
+    "Revoked token ids added to the current filter",
+)
+FILTER_SYNCED = Gauge(
+    "revocation_filter_synced",
+    "1 while the filter follows the revocation feed, every check goes to the store otherwise",
+)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, fp_rate: float):
+        bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self._bits = bytearray((bits + 7) // 8)
+        self._size = len(self._bits) * 8
+        self._hashes = max(1, round(bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Double hashing, k positions from two 64 bit halves of one digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self._size for i in range(self._hashes))
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class RevocationFilter:
+    # Most checked tokens are not revoked, the filter answers them without a store round trip
+    def __init__(
+        self,
+        tokens_clt: TokensClient,
+        capacity: int = REVOCATION_FILTER_CAPACITY,
+        fp_rate: float = REVOCATION_FILTER_FP_RATE,
+        rebuild_interval: float = REVOCATION_FILTER_REBUILD_INTERVAL,
+    ):
+        self._tokens_clt = tokens_clt
+        self._capacity = capacity
+        self._fp_rate = fp_rate
+        self._rebuild_interval = rebuild_interval
+        self._filter: BloomFilter | None = None
+        self._task: asyncio.Task | None = None
+
+    def might_be_revoked(self, jti: str) -> bool:
+        if self._filter is None:
+            return True
+        if jti in self._filter:
+            return True
+        FILTER_CHECKS.labels("negative").inc()
+        return False
+
+    def record_store_check(self, revoked: bool):
+        if self._filter is not None:
+            FILTER_CHECKS.labels("revoked" if revoked else "false_positive").inc()
+
+    def _add(self, jti: str):
+        self._filter.add(jti)
+        FILTER_ENTRIES.set(self._filter.count)
+
+    async def _rebuild(self):
+        revoked = await self._tokens_clt.get_revoked_tokens()
+        bloom_filter = BloomFilter(max(self._capacity, len(revoked) * 2), self._fp_rate)
+        for jti, _ in revoked:
+            bloom_filter.add(jti)
+        self._filter = bloom_filter
+        FILTER_ENTRIES.set(bloom_filter.count)
+        FILTER_SYNCED.set(1)
+
+    def _unsynced(self):
+        self._filter = None
+        FILTER_SYNCED.set(0)
+
+    async def _follow(self):
+        while True:
+            # Subscribed before the snapshot, so revocations made meanwhile are not missed
+            queue = self._tokens_clt.subscribe()
+            try:
+                await asyncio.wait_for(self._tokens_clt.wait_listening(), 5)
+                await self._rebuild()
+                rebuild_at = time.monotonic() + self._rebuild_interval
+                while True:
+                    try:
+                        revoked = await asyncio.wait_for(queue.get(), 1)
+                        if revoked is FEED_LOST:
+                            break
+                        self._add(revoked[0])
+                    except TimeoutError:
+                        pass
+                    if (
+                        time.monotonic() >= rebuild_at
+                        or self._filter.count > self._filter.capacity
+                    ):
+                        await self._rebuild()
+                        rebuild_at = time.monotonic() + self._rebuild_interval
+                # Revocation feed was lost, some revocations may be missing from the filter
+                self._unsynced()
+            except Exception as ex:
+                print(f"Revocation filter sync failed : {ex}")
+                self._unsynced()
+                await asyncio.sleep(1)
+            finally:
+                self._tokens_clt.unsubscribe(queue)
+
+    async def start(self):
+        self._unsynced()
+        self._task = asyncio.create_task(self._follow())
+
+    async def close(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,84 @@
+import asyncio
+
+from clients.redis.tokens_client import TokensClient
+from repositories.user_repository import UserRepository
+
+
+# Sent by triggers of account_group and account deactivation with the account id
+ACCOUNT_SESSIONS_CHANNEL = "account_sessions_changed"
+RECONNECT_DELAY = 1
+
+# Queued when the listening connection is lost
+_TERMINATED = ""
+
+
+class SessionSync:
+    # Refresh reads group ids from the session only, membership changes and deactivations
+    # made in Postgres are applied to the live sessions of the user here
+    def __init__(self, user_rep: UserRepository, tokens_clt: TokensClient):
+        self._user_rep = user_rep
+        self._tokens_clt = tokens_clt
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        self._task = asyncio.create_task(self._follow())
+
+    async def close(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _sync_users(self, user_ids: list[str]):
+        group_ids = await self._user_rep.get_users_group_ids(user_ids)
+        await asyncio.gather(
+            *(
+                # Deactivated, refresh must not outlive the account
+                self._tokens_clt.end_user_sessions(user_id)
+                if user_id not in group_ids
+                else self._tokens_clt.set_sessions_groups(user_id, group_ids[user_id])
+                for user_id in user_ids
+            )
+        )
+
+    async def _sync_all(self):
+        # Notifications sent while not listening are lost, every user with sessions is checked
+        async for user_ids in self._tokens_clt.get_session_user_ids():
+            await self._sync_users(user_ids)
+
+    async def _follow(self):
+        while True:
+            conn = None
+            # New queue for every connection: asyncpg calls termination listeners soon after close,
+            # a shared queue would get the end of the old connection and drop the new one
+            changes: asyncio.Queue[str] = asyncio.Queue()
+            try:
+                # Listening before the full sync, so changes committed meanwhile are not missed
+                conn = await self._user_rep.listen(
+                    ACCOUNT_SESSIONS_CHANNEL,
+                    changes.put_nowait,
+                    lambda: changes.put_nowait(_TERMINATED),
+                )
+                await self._sync_all()
+                while True:
+                    user_ids = {await changes.get()}
+                    while not changes.empty():
+                        user_ids.add(changes.get_nowait())
+                    if _TERMINATED in user_ids:
+                        break
+                    await self._sync_users(list(user_ids))
+            except Exception as ex:
+                # All sessions are synced again after reconnecting
+                print(f"Session sync listener failed : {ex}")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(RECONNECT_DELAY)
@@ -0,0 +1,113 @@
+import hashlib
+import os
+import sys
+import time
+from collections import OrderedDict
+
+from prometheus_client import Counter, Gauge
+
+from lib.permission_catalog import GrantedPermissions
+
+
+TOKEN_CACHE_SIZE = int(os.environ.get("TOKEN_CACHE_SIZE", "10000"))
+# Entries live no longer than that even for tokens with a later exp
+TOKEN_CACHE_TTL = float(os.environ.get("TOKEN_CACHE_TTL", "300"))
+
+# OrderedDict node and hash table slot of an entry, not seen by sys.getsizeof
+ENTRY_OVERHEAD = 100
+
+TOKEN_CACHE_REQUESTS = Counter(
+    "token_cache_requests_total",
+    "Decoded token lookups by result, hits skip signature verification",
+    ["result"],
+)
+TOKEN_CACHE_ENTRIES = Gauge("token_cache_entries", "Decoded tokens held in the cache")
+TOKEN_CACHE_BYTES = Gauge(
+    "token_cache_bytes", "Approximate memory held by the decoded token cache"
+)
+
+
+class DecodedToken:
+    __slots__ = ("user_id", "jti", "exp", "permissions")
+
+    def __init__(
+        self, user_id: str, jti: str, exp: int, permissions: GrantedPermissions | None
+    ):
+        self.user_id = user_id
+        self.jti = jti
+        self.exp = exp
+        self.permissions = permissions
+
+
+def _token_key(token: str) -> bytes:
+    # Signature is a part of the hashed token, so a forged token never matches a verified one
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _entry_size(key: bytes, decoded: DecodedToken) -> int:
+    return (
+        ENTRY_OVERHEAD
+        + sys.getsizeof(key)
+        + sys.getsizeof(decoded)
+        + sys.getsizeof(decoded.user_id)
+        + sys.getsizeof(decoded.jti)
+        + sys.getsizeof(decoded.permissions)
+    )
+
+
+class TokenCache:
+    # Verified access tokens by hash, tokens are immutable so only expiry invalidates them
+    def __init__(self, size: int = TOKEN_CACHE_SIZE, ttl: float = TOKEN_CACHE_TTL):
+        self._size = size
+        self._ttl = ttl
+        # key -> (decoded token, wall clock expiry, entry size)
+        self._entries: OrderedDict[bytes, tuple[DecodedToken, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._hit_counter = TOKEN_CACHE_REQUESTS.labels("hit")
+        self._miss_counter = TOKEN_CACHE_REQUESTS.labels("miss")
+
+    def get(self, token: str) -> DecodedToken | None:
+        key = _token_key(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            decoded, expires_at, _ = entry
+            # Wall clock, as exp of the token is
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                self._hit_counter.inc()
+                return decoded
+            self._remove(key)
+        self._misses += 1
+        self._miss_counter.inc()
+        return None
+
+    def put(self, token: str, decoded: DecodedToken):
+        key = _token_key(token)
+        if key in self._entries:
+            self._remove(key)
+        size = _entry_size(key, decoded)
+        self._entries[key] = (decoded, min(decoded.exp, time.time() + self._ttl), size)
+        self._bytes += size
+        while len(self._entries) > self._size:
+            self._remove(next(iter(self._entries)))
+        self._report()
+
+    def _remove(self, key: bytes):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+        self._report()
+
+    def _report(self):
+        TOKEN_CACHE_ENTRIES.set(len(self._entries))
+        TOKEN_CACHE_BYTES.set(self._bytes)
+
+    def stats(self) -> dict:
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
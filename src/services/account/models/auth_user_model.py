@@ -1,4 +1,3 @@
-from typing import Optional
 from pydantic import UUID4, BaseModel, ValidationError
 from asyncpg import Record
 
@@ -7,7 +6,8 @@ class AuthUserModel(BaseModel):
     id: UUID4
     username: str
     password: str
-    refresh_token: Optional[str]
+    # Groups of the user, permissions are resolved from them through the permission cache
+    group_ids: list[UUID4] = []
 
     @classmethod
     def from_record(cls, data):
@@ -1,6 +1,8 @@
 import os
 import asyncpg
 
+from lib.deadlines import DeadlineConnection, db_timeout
+
 from models.auth_user_model import AuthUserModel
 
 DATABASE_URL = (
@@ -22,7 +24,9 @@ class UserRepository:
         self._db_pool: asyncpg.Pool | None = None
 
     async def connect(self):
-        self._db_pool = await asyncpg.create_pool(self._connection_string)
+        self._db_pool = await asyncpg.create_pool(
+            self._connection_string, connection_class=DeadlineConnection
+        )
 
     async def disconnect(self):
         await self._db_pool.close()
@@ -39,56 +43,61 @@ class UserRepository:
     async def __aexit__(self, exc_type, exc_value, traceback):
         await self.disconnect()
 
-    async def get_user_by_username(self, username: str):
-        async with self._db_pool.acquire() as conn:
+    async def _get_user(self, condition: str, value: str):
+        # User row with ids of its groups in one round trip, a single statement needs no transaction
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
-            async with conn.transaction():
-                return AuthUserModel.from_record(
-                    await conn.fetchrow(
-                        "SELECT account.id, account.username, account.password, account.refresh_token FROM account WHERE username = $1 and is_active = TRUE",
-                        username,
-                    )
-                )
+            record = await conn.fetchrow(
+                "SELECT account.id, account.username, account.password, "
+                "array_remove(array_agg(account_group.group_id), NULL) AS group_ids "
+                "FROM account "
+                "LEFT JOIN account_group ON account_group.account_id = account.id "
+                f"WHERE {condition} and account.is_active = TRUE "
+                "GROUP BY account.id",
+                value,
+            )
+            return AuthUserModel.from_record(record) if record is not None else None
 
-    async def get_user_by_id(self, user_id: str):
-        async with self._db_pool.acquire() as conn:
-            conn: asyncpg.Connection
-            async with conn.transaction():
-                return AuthUserModel.from_record(
-                    await conn.fetchrow(
-                        "SELECT account.id, account.username, account.password, account.refresh_token FROM account WHERE id = $1 and is_active = TRUE",
-                        user_id,
-                    )
-                )
+    async def get_login_user(self, username: str):
+        return await self._get_user("account.username = $1", username)
 
-    async def remove_user_refresh_token(self, user_id: str):
-        async with self._db_pool.acquire() as conn:
-            conn: asyncpg.Connection
-            async with conn.transaction():
-                affected_columns = await conn.execute(
-                    "UPDATE company.public.account SET refresh_token = NULL WHERE id = $1 and is_active = TRUE",
-                    user_id,
-                )
-                return bool(affected_columns.split(" ")[:-1])
+    async def get_user_by_id(self, user_id: str):
+        return await self._get_user("account.id = $1", user_id)
 
-    async def update_refresh_token(self, user_id: str, refresh_token: str):
-        async with self._db_pool.acquire() as conn:
+    async def get_users_group_ids(self, user_ids: list[str]) -> dict[str, list[str]]:
+        # Group ids of the active users among the given ones
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
-            async with conn.transaction():
-                affected_columns = await conn.execute(
-                    "UPDATE company.public.account SET refresh_token = $2 WHERE id = $1 and is_active = TRUE",
-                    user_id,
-                    refresh_token,
-                )
-                return bool(affected_columns.split(" ")[:-1])
+            rows = await conn.fetch(
+                "SELECT account.id, array_remove(array_agg(account_group.group_id), NULL) AS group_ids "
+                "FROM account "
+                "LEFT JOIN account_group ON account_group.account_id = account.id "
+                "WHERE account.id = ANY($1::uuid[]) and account.is_active = TRUE "
+                "GROUP BY account.id",
+                user_ids,
+            )
+            return {
+                str(row["id"]): [str(group_id) for group_id in row["group_ids"]]
+                for row in rows
+            }
 
-    async def get_permissions(self, username: str):
-        async with self._db_pool.acquire() as conn:
+    async def get_group_permissions(self, group_ids: list[str] | None = None) -> dict[str, set[str]]:
+        # Permission sets of the given groups, of all groups without them
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
-            async with conn.transaction():
-                rows = await conn.fetch(
-                    'SELECT permission.name AS permission_name FROM permission JOIN group_permission ON permission.id = group_permission.permission_id JOIN "group" ON group_permission.group_id = "group".id JOIN account_group ON account_group.group_id = "group".id JOIN account ON account_group.account_id = account.id WHERE account.username = $1 and account.is_active = TRUE',
-                    username,
-                )
+            rows = await conn.fetch(
+                "SELECT group_permission.group_id, array_agg(permission.name) AS permissions "
+                "FROM group_permission "
+                "JOIN permission ON permission.id = group_permission.permission_id "
+                "WHERE $1::uuid[] IS NULL OR group_permission.group_id = ANY($1::uuid[]) "
+                "GROUP BY group_permission.group_id",
+                group_ids,
+            )
+            return {str(row["group_id"]): set(row["permissions"]) for row in rows}
 
-                return {row["permission_name"] for row in rows}
+    async def listen(self, channel: str, callback, on_termination) -> asyncpg.Connection:
+        # LISTEN needs its own connection, pooled ones are reset when released
+        conn = await asyncpg.connect(self._connection_string)
+        conn.add_termination_listener(lambda _: on_termination())
+        await conn.add_listener(channel, lambda _, __, ___, payload: callback(payload))
+        return conn
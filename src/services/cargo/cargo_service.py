@@ -1,5 +1,6 @@
 import asyncio
 import os
+import uuid
 import grpc
 from grpc import ServicerContext
 
@@ -7,21 +8,42 @@ from grpc_build.cargo_service_pb2_grpc import (
     CargoServiceServicer,
     add_CargoServiceServicer_to_server,
 )
+from lib.compression import CompressionInterceptor, get_server_compression
+from lib.conditional import has_conditions, is_not_modified
+from lib.deadlines import DeadlineExceededError, DeadlineInterceptor
 from repositories.cargo_repository import CargoRepository
 from grpc_build.cargo_service_pb2 import (
+    CargoBatch,
     CargoDataArray,
     CreateCargoRequest,
     CreateCargoResponse,
     GetCargoRequest,
     GetCargoResponse,
+    GetCargosRequest,
+    GetCargosResponse,
     GetUserCargosRequest,
     GetUserCargosResponse,
+    StreamUserCargosRequest,
+    StreamUserCargosResponse,
     UpdateCargoRequest,
     UpdateCargoResponse,
 )
 from models.cargo_models import CreateCargoModel, UpdateCargoModel
 
 
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "100"))
+# Methods returning lists, their large responses are compressed
+COMPRESSED_METHODS = ("GetCargos", "GetUserCargos", "StreamUserCargos")
+
+
+def is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+        return True
+    except ValueError:
+        return False
+
+
 class CargoService(CargoServiceServicer):
     def __init__(self, cargo_rep: CargoRepository):
         self._cargo_rep = cargo_rep
@@ -45,6 +67,8 @@ class CargoService(CargoServiceServicer):
             else:
                 return CreateCargoResponse(code=400, message="Can not create cargo")
 
+        except (DeadlineExceededError, TimeoutError):
+            return CreateCargoResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return CreateCargoResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -81,6 +105,8 @@ class CargoService(CargoServiceServicer):
                     )
                 else:
                     return UpdateCargoResponse(code=404, message="Cargo not found")
+        except (DeadlineExceededError, TimeoutError):
+            return UpdateCargoResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return UpdateCargoResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -92,6 +118,11 @@ class CargoService(CargoServiceServicer):
         try:
             cargo_id = request.cargo_id
 
+            if has_conditions(request):
+                updated_at = await self._cargo_rep.get_cargo_updated_at(cargo_id)
+                if updated_at is not None and is_not_modified(request, updated_at):
+                    return GetCargoResponse(code=304, updated_at=updated_at)
+
             cargo_model = await self._cargo_rep.get_cargo_by_id(cargo_id)
 
             if cargo_model is not None:
@@ -99,9 +130,46 @@ class CargoService(CargoServiceServicer):
             else:
                 return GetCargoResponse(code=404, message="Cargo not found")
 
+        except (DeadlineExceededError, TimeoutError):
+            return GetCargoResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return GetCargoResponse(code=500, message=f"Error : {ex}, args : {ex.args}")
 
+    async def GetCargos(
+        self, request: GetCargosRequest, context: ServicerContext
+    ) -> GetCargosResponse:
+        try:
+            if len(request.cargo_ids) > MAX_BATCH_SIZE:
+                return GetCargosResponse(
+                    code=400, message=f"Batch size exceeds {MAX_BATCH_SIZE}"
+                )
+
+            cargo_ids = list(dict.fromkeys(request.cargo_ids))
+            valid_ids = [cargo_id for cargo_id in cargo_ids if is_uuid(cargo_id)]
+
+            cargo_models = await self._cargo_rep.get_cargos_by_ids(valid_ids)
+
+            return GetCargosResponse(
+                code=200,
+                batch=CargoBatch(
+                    items=[
+                        cargo_models[cargo_id].to_CargoData()
+                        for cargo_id in cargo_ids
+                        if cargo_id in cargo_models
+                    ],
+                    missing_ids=[
+                        cargo_id for cargo_id in cargo_ids if cargo_id not in cargo_models
+                    ],
+                ),
+            )
+
+        except (DeadlineExceededError, TimeoutError):
+            return GetCargosResponse(code=504, message="Deadline exceeded")
+        except Exception as ex:
+            return GetCargosResponse(
+                code=500, message=f"Error : {ex}, args : {ex.args}"
+            )
+
     async def GetUserCargos(
         self, request: GetUserCargosRequest, context: ServicerContext
     ) -> GetUserCargosResponse:
@@ -120,15 +188,46 @@ class CargoService(CargoServiceServicer):
                 ),
             )
 
+        except (DeadlineExceededError, TimeoutError):
+            return GetUserCargosResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return GetUserCargosResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
             )
 
+    async def StreamUserCargos(
+        self, request: StreamUserCargosRequest, context: ServicerContext
+    ):
+        try:
+            sent = False
+            async for cargo_models in self._cargo_rep.iter_user_cargos(request.user_id):
+                yield StreamUserCargosResponse(
+                    code=200,
+                    arr=CargoDataArray(
+                        cargo_data=[
+                            cargo_model.to_CargoData() for cargo_model in cargo_models
+                        ]
+                    ),
+                )
+                sent = True
+
+            if not sent:
+                yield StreamUserCargosResponse(code=200, arr=CargoDataArray())
+
+        except (DeadlineExceededError, TimeoutError):
+            yield StreamUserCargosResponse(code=504, message="Deadline exceeded")
+        except Exception as ex:
+            yield StreamUserCargosResponse(
+                code=500, message=f"Error : {ex}, args : {ex.args}"
+            )
+
 
 async def serve():
 
-    server = grpc.aio.server()
+    server = grpc.aio.server(
+        interceptors=[DeadlineInterceptor(), CompressionInterceptor(COMPRESSED_METHODS)],
+        compression=get_server_compression(),
+    )
 
     async with CargoRepository() as cargo_rep:
         add_CargoServiceServicer_to_server(CargoService(cargo_rep), server)
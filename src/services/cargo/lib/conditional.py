@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+
+from google.protobuf.timestamp_pb2 import Timestamp
+
+
+def has_conditions(request) -> bool:
+    return bool(request.known_versions) or request.HasField("known_updated_at")
+
+
+def is_not_modified(request, updated_at: datetime) -> bool:
+    # Versions of If-None-Match match exactly, an older or newer version is a different one
+    version = Timestamp()
+    version.FromDatetime(updated_at)
+    if request.known_versions:
+        return version in request.known_versions
+
+    # If-Modified-Since has one second precision, it holds for every version not after it
+    return updated_at <= request.known_updated_at.ToDatetime(tzinfo=timezone.utc)
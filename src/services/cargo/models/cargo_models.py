@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from pydantic import UUID4, BaseModel, ValidationError
 
@@ -49,7 +50,8 @@ class CargoModel(BaseModel):
     weight: int
     creator_id: UUID4
     delivery: Optional[BriefDeliveryModel] = None
-    
+    updated_at: Optional[datetime] = None
+
     
     @classmethod
     def from_record(cls, data):
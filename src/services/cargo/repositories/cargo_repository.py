@@ -1,6 +1,8 @@
 import os
 
 import asyncpg
+
+from lib.deadlines import DeadlineConnection, db_timeout
 from pydantic import UUID4
 
 from models.cargo_models import CargoModel, CreateCargoModel, UpdateCargoModel
@@ -20,18 +22,30 @@ DATABASE_URL = (
 )
 
 DB_PAGE_SIZE = int(os.environ.get("DB_PAGE_SIZE", "1000"))
+DB_STREAM_CHUNK_SIZE = int(os.environ.get("DB_STREAM_CHUNK_SIZE", "100"))
+# Keyset start of streamed exports, lower than any id
+MIN_UUID = "00000000-0000-0000-0000-000000000000"
+
+# Cargo representation includes its delivery state, so both rows define its version
+CARGO_UPDATED_AT = "GREATEST(c.updated_at, d.updated_at) AS updated_at"
 
 
 class CargoRepository:
     def __init__(
-        self, connection_string: str = DATABASE_URL, db_page_size: int = DB_PAGE_SIZE
+        self,
+        connection_string: str = DATABASE_URL,
+        db_page_size: int = DB_PAGE_SIZE,
+        db_stream_chunk_size: int = DB_STREAM_CHUNK_SIZE,
     ):
         self._connection_string = connection_string
         self._db_pool: asyncpg.Pool | None = None
         self._db_page_size = db_page_size
+        self._db_stream_chunk_size = db_stream_chunk_size
 
     async def connect(self):
-        self._db_pool = await asyncpg.create_pool(self._connection_string)
+        self._db_pool = await asyncpg.create_pool(
+            self._connection_string, connection_class=DeadlineConnection
+        )
 
     async def disconnect(self):
         await self._db_pool.close()
@@ -49,7 +63,7 @@ class CargoRepository:
         await self.disconnect()
 
     async def create_cargo(self, create_cargo_model: CreateCargoModel) -> CargoModel:
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 cargo_dmp = create_cargo_model.model_dump(exclude_none=True)
@@ -61,11 +75,11 @@ class CargoRepository:
                 return CargoModel.from_record(created_cargo)
 
     async def get_cargo_by_id(self, cargo_id: str) -> CargoModel:
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
-                cargo_record = conn.fetchrow(
-                    """
+                cargo_record = await conn.fetchrow(
+                    f"""
                     SELECT
                         c.id,
                         c.title,
@@ -74,7 +88,8 @@ class CargoRepository:
                         c.creator_id,
                         c.weight,
                         d.id AS delivery_id,
-                        d.state AS delivery_state
+                        d.state AS delivery_state,
+                        {CARGO_UPDATED_AT}
                     FROM company.public.cargo c 
                     LEFT JOIN 
                     company.public.delivery d ON c.id = d.cargo_id
@@ -86,12 +101,13 @@ class CargoRepository:
                 if cargo_record is None:
                     return cargo_record
                 
+                cargo_record = dict(cargo_record)
                 delivery_id = cargo_record.pop("delivery_id")
                 delivery_state = cargo_record.pop("delivery_state")
                 if delivery_id is not None and delivery_state is not None:
                     return    CargoModel.from_record(
                             {
-                                **row,
+                                **cargo_record,
                                 "delivery": {
                                     "id": delivery_id,
                                     "state": delivery_state,
@@ -102,12 +118,56 @@ class CargoRepository:
                 else:
                     return CargoModel.from_record(cargo_record)
 
+    async def get_cargo_updated_at(self, cargo_id: str):
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
+            conn: asyncpg.Connection
+            return await conn.fetchval(
+                f"SELECT {CARGO_UPDATED_AT} FROM company.public.cargo c LEFT JOIN company.public.delivery d ON c.id = d.cargo_id WHERE c.id = $1",
+                cargo_id,
+            )
+
+    async def get_cargos_by_ids(self, cargo_ids: list[str]) -> dict[str, CargoModel]:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
+            conn: asyncpg.Connection
+            rows = await conn.fetch(
+                f"""
+                SELECT
+                    c.id,
+                    c.title,
+                    c.\"type\",
+                    c.\"description\",
+                    c.creator_id,
+                    c.weight,
+                    d.id AS delivery_id,
+                    d.state AS delivery_state,
+                    {CARGO_UPDATED_AT}
+                FROM company.public.cargo c
+                LEFT JOIN
+                company.public.delivery d ON c.id = d.cargo_id
+                WHERE c.id = ANY($1::uuid[])
+                """,
+                cargo_ids,
+            )
+
+            cargos = {}
+            for row in rows:
+                row = dict(row)
+                delivery_id = row.pop("delivery_id")
+                delivery_state = row.pop("delivery_state")
+                if delivery_id is not None and delivery_state is not None:
+                    row["delivery"] = {"id": delivery_id, "state": delivery_state}
+                cargo_model = CargoModel.from_record(row)
+                if cargo_model is not None:
+                    cargos[str(cargo_model.id)] = cargo_model
+
+            return cargos
+
     async def get_user_cargos(self, user_id: str, page: int) -> list[CargoModel]:
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 rows = await conn.fetch(
-                    """
+                    f"""
                     SELECT 
                         c.id,
                         c.title,
@@ -116,7 +176,8 @@ class CargoRepository:
                         c.creator_id,
                         c.weight,
                         d.id AS delivery_id,
-                        d.state AS delivery_state
+                        d.state AS delivery_state,
+                        {CARGO_UPDATED_AT}
                     FROM 
                         company.public.cargo c
                     LEFT JOIN 
@@ -154,8 +215,61 @@ class CargoRepository:
 
                 return cargos_arr
 
+    async def iter_user_cargos(self, user_id: str):
+        # Keyset pages by cargo id, a connection is held only while one chunk is read,
+        # so slow clients of long exports never pin pooled connections or transactions
+        last_id = MIN_UUID
+        while True:
+            async with self._db_pool.acquire(timeout=db_timeout()) as conn:
+                conn: asyncpg.Connection
+                rows = await conn.fetch(
+                    f"""
+                    SELECT
+                        c.id,
+                        c.title,
+                        c.\"type\",
+                        c.\"description\",
+                        c.creator_id,
+                        c.weight,
+                        d.id AS delivery_id,
+                        d.state AS delivery_state,
+                        {CARGO_UPDATED_AT}
+                    FROM
+                        (
+                            SELECT *
+                            FROM company.public.cargo
+                            WHERE creator_id = $1 AND id > $2
+                            ORDER BY id
+                            LIMIT $3
+                        ) c
+                    LEFT JOIN
+                        company.public.delivery d ON c.id = d.cargo_id
+                    ORDER BY
+                        c.id
+                    """,
+                    user_id,
+                    last_id,
+                    self._db_stream_chunk_size,
+                )
+            if not rows:
+                return
+
+            cargos_arr = []
+            for row in rows:
+                row = dict(row)
+                delivery_id = row.pop("delivery_id")
+                delivery_state = row.pop("delivery_state")
+                if delivery_id is not None and delivery_state is not None:
+                    row["delivery"] = {"id": delivery_id, "state": delivery_state}
+                cargo_model = CargoModel.from_record(row)
+                if cargo_model is not None:
+                    cargos_arr.append(cargo_model)
+
+            yield cargos_arr
+            last_id = rows[-1]["id"]
+
     async def update_cargo(self, cargo_id: str, cargo: UpdateCargoModel) -> CargoModel:
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 if cargo is not None:
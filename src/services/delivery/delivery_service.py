@@ -1,8 +1,12 @@
 import asyncio
 import os
+import uuid
 import grpc
 from grpc import ServicerContext
 
+from lib.compression import CompressionInterceptor, get_server_compression
+from lib.conditional import has_conditions, is_not_modified
+from lib.deadlines import DeadlineExceededError, DeadlineInterceptor
 from repositories.delivery_repository import DeliveryRepository
 
 from grpc_build.delivery_service_pb2_grpc import (
@@ -12,11 +16,16 @@ from grpc_build.delivery_service_pb2_grpc import (
 from grpc_build.delivery_service_pb2 import (
     CreateDeliveryRequest,
     CreateDeliveryResponse,
+    DeliveryBatch,
     DeliveryDataArray,
+    GetDeliveriesRequest,
+    GetDeliveriesResponse,
     GetDeliveryRequest,
     GetDeliveryResponse,
     SearchDeliveriesRequest,
     SearchDeliveriesResponse,
+    StreamDeliveriesRequest,
+    StreamDeliveriesResponse,
     UpdateDeliveryRequest,
     UpdateDeliveryResponse,
 )
@@ -27,6 +36,19 @@ from models.delivery_models import (
 )
 
 
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "100"))
+# Methods returning lists, their large responses are compressed
+COMPRESSED_METHODS = ("SearchDeliveries", "GetDeliveries", "StreamDeliveries")
+
+
+def is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+        return True
+    except ValueError:
+        return False
+
+
 class DeliveryService(DeliveryServiceServicer):
     def __init__(self, delivery_rep: DeliveryRepository):
         self._delivery_rep = delivery_rep
@@ -46,6 +68,8 @@ class DeliveryService(DeliveryServiceServicer):
             else:
                 return CreateDeliveryResponse(code=400, message="Can't create delivery")
 
+        except (DeadlineExceededError, TimeoutError):
+            return CreateDeliveryResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return CreateDeliveryResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -72,6 +96,8 @@ class DeliveryService(DeliveryServiceServicer):
             else:
                 return UpdateDeliveryResponse(code=404, message="Delivery not found")
 
+        except (DeadlineExceededError, TimeoutError):
+            return UpdateDeliveryResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return UpdateDeliveryResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -98,6 +124,8 @@ class DeliveryService(DeliveryServiceServicer):
                 ),
             )
 
+        except (DeadlineExceededError, TimeoutError):
+            return SearchDeliveriesResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return SearchDeliveriesResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -109,6 +137,11 @@ class DeliveryService(DeliveryServiceServicer):
         try:
             delivery_id = request.delivery_id
 
+            if has_conditions(request):
+                updated_at = await self._delivery_rep.get_delivery_updated_at(delivery_id)
+                if updated_at is not None and is_not_modified(request, updated_at):
+                    return GetDeliveryResponse(code=304, updated_at=updated_at)
+
             delivery_model = await self._delivery_rep.get_delivery_by_id(delivery_id)
 
             if delivery_model is not None:
@@ -118,15 +151,87 @@ class DeliveryService(DeliveryServiceServicer):
             else:
                 return GetDeliveryResponse(code=404, message="Delivery not found")
 
+        except (DeadlineExceededError, TimeoutError):
+            return GetDeliveryResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return GetDeliveryResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
             )
 
+    async def GetDeliveries(
+        self, request: GetDeliveriesRequest, context: ServicerContext
+    ) -> GetDeliveriesResponse:
+        try:
+            if len(request.delivery_ids) > MAX_BATCH_SIZE:
+                return GetDeliveriesResponse(
+                    code=400, message=f"Batch size exceeds {MAX_BATCH_SIZE}"
+                )
+
+            delivery_ids = list(dict.fromkeys(request.delivery_ids))
+            valid_ids = [
+                delivery_id for delivery_id in delivery_ids if is_uuid(delivery_id)
+            ]
+
+            delivery_models = await self._delivery_rep.get_deliveries_by_ids(valid_ids)
+
+            return GetDeliveriesResponse(
+                code=200,
+                batch=DeliveryBatch(
+                    items=[
+                        delivery_models[delivery_id].to_DeliveryData()
+                        for delivery_id in delivery_ids
+                        if delivery_id in delivery_models
+                    ],
+                    missing_ids=[
+                        delivery_id
+                        for delivery_id in delivery_ids
+                        if delivery_id not in delivery_models
+                    ],
+                ),
+            )
+
+        except (DeadlineExceededError, TimeoutError):
+            return GetDeliveriesResponse(code=504, message="Deadline exceeded")
+        except Exception as ex:
+            return GetDeliveriesResponse(
+                code=500, message=f"Error : {ex}, args : {ex.args}"
+            )
+
+    async def StreamDeliveries(
+        self, request: StreamDeliveriesRequest, context: ServicerContext
+    ):
+        try:
+            search_model = SearchDeliveryModel.from_grpc_message(
+                request.searching_delivery_data
+            )
+
+            sent = False
+            async for deliveries in self._delivery_rep.iter_deliveries(search_model):
+                yield StreamDeliveriesResponse(
+                    code=200,
+                    deliveries=DeliveryDataArray(
+                        arr=[delivery.to_DeliveryData() for delivery in deliveries]
+                    ),
+                )
+                sent = True
+
+            if not sent:
+                yield StreamDeliveriesResponse(code=200, deliveries=DeliveryDataArray())
+
+        except (DeadlineExceededError, TimeoutError):
+            yield StreamDeliveriesResponse(code=504, message="Deadline exceeded")
+        except Exception as ex:
+            yield StreamDeliveriesResponse(
+                code=500, message=f"Error : {ex}, args : {ex.args}"
+            )
+
 
 async def serve():
 
-    server = grpc.aio.server()
+    server = grpc.aio.server(
+        interceptors=[DeadlineInterceptor(), CompressionInterceptor(COMPRESSED_METHODS)],
+        compression=get_server_compression(),
+    )
 
     async with DeliveryRepository() as delivery_rep:
         add_DeliveryServiceServicer_to_server(DeliveryService(delivery_rep), server)
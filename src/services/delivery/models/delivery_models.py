@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from pydantic import UUID4, BaseModel, ValidationError
 
@@ -69,6 +70,7 @@ class DeliveryModel(BaseModel):
     bill_id: Optional[UUID4]
     send_address_id: UUID4
     receive_address_id: UUID4
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_record(cls, data):
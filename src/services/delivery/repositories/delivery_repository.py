@@ -1,6 +1,8 @@
 import os
 import asyncpg
 
+from lib.deadlines import DeadlineConnection, db_timeout
+
 from models.delivery_models import (
     CreateDeliveryModel,
     DeliveryModel,
@@ -23,18 +25,27 @@ DATABASE_URL = (
 )
 
 DB_PAGE_SIZE = int(os.environ.get("DB_PAGE_SIZE", "1000"))
+DB_STREAM_CHUNK_SIZE = int(os.environ.get("DB_STREAM_CHUNK_SIZE", "100"))
+# Keyset start of streamed exports, lower than any id
+MIN_UUID = "00000000-0000-0000-0000-000000000000"
 
 
 class DeliveryRepository:
     def __init__(
-        self, connection_string: str = DATABASE_URL, db_page_size: int = DB_PAGE_SIZE
+        self,
+        connection_string: str = DATABASE_URL,
+        db_page_size: int = DB_PAGE_SIZE,
+        db_stream_chunk_size: int = DB_STREAM_CHUNK_SIZE,
     ):
         self._connection_string = connection_string
         self._db_pool: asyncpg.Pool | None = None
         self._db_page_size = db_page_size
+        self._db_stream_chunk_size = db_stream_chunk_size
 
     async def connect(self):
-        self._db_pool = await asyncpg.create_pool(self._connection_string)
+        self._db_pool = await asyncpg.create_pool(
+            self._connection_string, connection_class=DeadlineConnection
+        )
 
     async def disconnect(self):
         await self._db_pool.close()
@@ -52,17 +63,41 @@ class DeliveryRepository:
         await self.disconnect()
 
     async def get_delivery_by_id(self, delivery_id: str):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 delivery_record = await conn.fetchrow(
-                    "SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id from company.public.delivery WHERE id = $1",
+                    "SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id, updated_at from company.public.delivery WHERE id = $1",
                     delivery_id,
                 )
                 return DeliveryModel.from_record(delivery_record)
 
+    async def get_deliveries_by_ids(self, delivery_ids: list[str]) -> dict[str, DeliveryModel]:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
+            conn: asyncpg.Connection
+            rows = await conn.fetch(
+                "SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id, updated_at from company.public.delivery WHERE id = ANY($1::uuid[])",
+                delivery_ids,
+            )
+
+            deliveries = {}
+            for row in rows:
+                delivery_model = DeliveryModel.from_record(row)
+                if delivery_model is not None:
+                    deliveries[str(delivery_model.id)] = delivery_model
+
+            return deliveries
+
+    async def get_delivery_updated_at(self, delivery_id: str):
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
+            conn: asyncpg.Connection
+            return await conn.fetchval(
+                "SELECT updated_at from company.public.delivery WHERE id = $1",
+                delivery_id,
+            )
+
     async def create_delivery(self, delivery: CreateDeliveryModel):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 crated_delivery = conn.fetchrow(
@@ -75,7 +110,7 @@ class DeliveryRepository:
                 return DeliveryModel.from_record(crated_delivery)
 
     async def search_deliveries(self, page: int, delivery: SearchDeliveryModel | None):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 if delivery is not None:
@@ -88,30 +123,61 @@ class DeliveryRepository:
                     )
                     if len(search_str):
                         rows = await conn.fetch(
-                            f"SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id from company.public.delivery WHERE {search_str} LIMIT $1 OFFSET $2",
+                            f"SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id, updated_at from company.public.delivery WHERE {search_str} LIMIT $1 OFFSET $2",
                             self._db_page_size,
                             page * self._db_page_size,
                             *delivery_dmp.values(),
                         )
                     else:
                         rows = await conn.fetch(
-                            f"SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id from company.public.delivery LIMIT $1 OFFSET $2",
+                            f"SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id, updated_at from company.public.delivery LIMIT $1 OFFSET $2",
                             self._db_page_size,
                             page * self._db_page_size,
                         )
                     return [DeliveryModel.from_record(row) for row in rows]
                 else:
                     rows = await conn.fetch(
-                        f"SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id from company.public.delivery LIMIT $1 OFFSET $2",
+                        f"SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id, updated_at from company.public.delivery LIMIT $1 OFFSET $2",
                         self._db_page_size,
                         page * self._db_page_size,
                     )
                     return [DeliveryModel.from_record(row) for row in rows]
 
+    async def iter_deliveries(self, delivery: SearchDeliveryModel | None):
+        delivery_dmp = delivery.model_dump(exclude_none=True) if delivery is not None else {}
+        search_str = " and ".join(
+            [f"{key} = ${ind + 1}" for ind, key in enumerate(delivery_dmp.keys())]
+            + [f"id > ${len(delivery_dmp) + 1}"]
+        )
+
+        # Keyset pages by id, a connection is held only while one chunk is read,
+        # so slow clients of long exports never pin pooled connections or transactions
+        last_id = MIN_UUID
+        while True:
+            async with self._db_pool.acquire(timeout=db_timeout()) as conn:
+                conn: asyncpg.Connection
+                rows = await conn.fetch(
+                    f"SELECT id, state, priority, sender_id, receiver_id, cargo_id, bill_id, send_address_id, receive_address_id, updated_at from company.public.delivery WHERE {search_str} ORDER BY id LIMIT ${len(delivery_dmp) + 2}",
+                    *delivery_dmp.values(),
+                    last_id,
+                    self._db_stream_chunk_size,
+                )
+            if not rows:
+                return
+
+            deliveries_arr = []
+            for row in rows:
+                delivery_model = DeliveryModel.from_record(row)
+                if delivery_model is not None:
+                    deliveries_arr.append(delivery_model)
+
+            yield deliveries_arr
+            last_id = rows[-1]["id"]
+
     async def update_delivery(
         self, delivery_id: str, delivery: UpdateDeliveryModel | None
     ):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 if delivery is not None:
@@ -0,0 +1,78 @@
+import os
+
+import grpc
+
+
+# Responses of list methods at least that large are gzip compressed, 0 disables compression
+GRPC_COMPRESSION_MIN_SIZE = int(os.environ.get("GRPC_COMPRESSION_MIN_SIZE", "4096"))
+
+
+def get_server_compression() -> grpc.Compression:
+    # Per call compression is ignored for unary responses of grpc.aio, so the server
+    # compresses by default and the interceptor opts out message by message
+    if GRPC_COMPRESSION_MIN_SIZE:
+        return grpc.Compression.Gzip
+    return grpc.Compression.NoCompression
+
+
+def _compress_if_large(context: grpc.aio.ServicerContext, response):
+    if response.ByteSize() < GRPC_COMPRESSION_MIN_SIZE:
+        context.disable_next_message_compression()
+
+
+def _wrap_unary_unary(behavior, compressed: bool):
+    async def wrapper(request, context):
+        response = await behavior(request, context)
+        if compressed:
+            _compress_if_large(context, response)
+        else:
+            context.disable_next_message_compression()
+        return response
+
+    return wrapper
+
+
+def _wrap_unary_stream(behavior, compressed: bool):
+    async def wrapper(request, context):
+        async for response in behavior(request, context):
+            if compressed:
+                _compress_if_large(context, response)
+            else:
+                context.disable_next_message_compression()
+            yield response
+
+    return wrapper
+
+
+class CompressionInterceptor(grpc.aio.ServerInterceptor):
+    # Only methods returning repeated fields are compressed, other responses are too small
+    def __init__(self, compressed_methods: tuple[str, ...]):
+        self._compressed_methods = compressed_methods
+        self._handlers = {}
+
+    async def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method
+        handler = self._handlers.get(method)
+        if handler is not None:
+            return handler
+
+        handler = await continuation(handler_call_details)
+        if handler is None or not GRPC_COMPRESSION_MIN_SIZE:
+            return handler
+
+        compressed = method.rpartition("/")[2] in self._compressed_methods
+        if handler.unary_unary is not None:
+            handler = grpc.unary_unary_rpc_method_handler(
+                _wrap_unary_unary(handler.unary_unary, compressed),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        elif handler.unary_stream is not None:
+            handler = grpc.unary_stream_rpc_method_handler(
+                _wrap_unary_stream(handler.unary_stream, compressed),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        self._handlers[method] = handler
+        return handler
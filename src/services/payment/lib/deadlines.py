@@ -0,0 +1,110 @@
+import time
+from contextvars import ContextVar
+
+import asyncpg
+import grpc
+
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+def db_timeout() -> float | None:
+    # Remaining time of the current call, None when the caller set no deadline
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError("Call deadline exceeded")
+    return remaining
+
+
+def _start_call(context: grpc.aio.ServicerContext) -> bool:
+    remaining = context.time_remaining()
+    if remaining is None:
+        _deadline.set(None)
+        return True
+
+    _deadline.set(time.monotonic() + remaining)
+    return remaining > 0
+
+
+def _wrap_unary_unary(behavior):
+    async def wrapper(request, context):
+        if not _start_call(context):
+            await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline exceeded")
+        return await behavior(request, context)
+
+    return wrapper
+
+
+def _wrap_unary_stream(behavior):
+    async def wrapper(request, context):
+        if not _start_call(context):
+            await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline exceeded")
+        async for response in behavior(request, context):
+            yield response
+
+    return wrapper
+
+
+class DeadlineInterceptor(grpc.aio.ServerInterceptor):
+    def __init__(self):
+        self._handlers = {}
+
+    async def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method
+        handler = self._handlers.get(method)
+        if handler is not None:
+            return handler
+
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        if handler.unary_unary is not None:
+            handler = grpc.unary_unary_rpc_method_handler(
+                _wrap_unary_unary(handler.unary_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        elif handler.unary_stream is not None:
+            handler = grpc.unary_stream_rpc_method_handler(
+                _wrap_unary_stream(handler.unary_stream),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        self._handlers[method] = handler
+        return handler
+
+
+class DeadlineConnection(asyncpg.Connection):
+    # asyncpg cancels the query on the server when its timeout fires
+    async def execute(self, query, *args, timeout=None):
+        return await super().execute(query, *args, timeout=timeout or db_timeout())
+
+    async def executemany(self, command, args, *, timeout=None):
+        return await super().executemany(
+            command, args, timeout=timeout or db_timeout()
+        )
+
+    async def fetch(self, query, *args, timeout=None, record_class=None):
+        return await super().fetch(
+            query, *args, timeout=timeout or db_timeout(), record_class=record_class
+        )
+
+    async def fetchval(self, query, *args, column=0, timeout=None):
+        return await super().fetchval(
+            query, *args, column=column, timeout=timeout or db_timeout()
+        )
+
+    async def fetchrow(self, query, *args, timeout=None, record_class=None):
+        return await super().fetchrow(
+            query, *args, timeout=timeout or db_timeout(), record_class=record_class
+        )
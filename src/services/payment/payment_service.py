@@ -5,6 +5,8 @@ import os
 import grpc
 from grpc import ServicerContext
 
+from lib.compression import CompressionInterceptor, get_server_compression
+from lib.deadlines import DeadlineExceededError, DeadlineInterceptor
 from grpc_build.payment_service_pb2_grpc import (
     PaymentServiceServicer,
     add_PaymentServiceServicer_to_server,
@@ -30,6 +32,9 @@ from repositories.delivery_repository import DeliveryRepository
 from models.decimal_models import DecimalModel
 from models.delivery_models import DeliveryModel
 
+# Methods returning lists, their large responses are compressed
+COMPRESSED_METHODS = ("SearchPayments",)
+
 
 def cargo_type_to_coef(cargo_type: str):
     if cargo_type in ["Glass"]:
@@ -125,6 +130,8 @@ class PaymentService(PaymentServiceServicer):
                 return MakePaymentResponse(
                     code=404, message=f"Delivery with passed id does not exist"
                 )
+        except (DeadlineExceededError, TimeoutError):
+            return MakePaymentResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return MakePaymentResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -156,6 +163,8 @@ class PaymentService(PaymentServiceServicer):
             else:
                 return AcceptPaymentResponse(code=400, message="Can't add receipt")
 
+        except (DeadlineExceededError, TimeoutError):
+            return AcceptPaymentResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return AcceptPaymentResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -181,6 +190,8 @@ class PaymentService(PaymentServiceServicer):
                     arr=[json.dumps(find_payment) for find_payment in find_payments]
                 ),
             )
+        except (DeadlineExceededError, TimeoutError):
+            return SearchPaymentsResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return SearchPaymentsResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -200,6 +211,8 @@ class PaymentService(PaymentServiceServicer):
                     code=400, message=f"Can't add new payment rule"
                 )
 
+        except (DeadlineExceededError, TimeoutError):
+            return AddPaymentRuleResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return AddPaymentRuleResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -208,7 +221,10 @@ class PaymentService(PaymentServiceServicer):
 
 async def serve():
 
-    server = grpc.aio.server()
+    server = grpc.aio.server(
+        interceptors=[DeadlineInterceptor(), CompressionInterceptor(COMPRESSED_METHODS)],
+        compression=get_server_compression(),
+    )
 
     async with PaymentRuleRepository() as payment_rule_rep, ReceiptRepository() as receipt_rep, DeliveryRepository() as delivery_rep:
 
@@ -2,6 +2,8 @@ import os
 
 import asyncpg
 
+from lib.deadlines import DeadlineConnection, db_timeout
+
 from models.delivery_models import DeliveryModel
 
 
@@ -30,7 +32,9 @@ class DeliveryRepository:
         self._db_page_size = db_page_size
 
     async def connect(self):
-        self._db_pool = await asyncpg.create_pool(self._connection_string)
+        self._db_pool = await asyncpg.create_pool(
+            self._connection_string, connection_class=DeadlineConnection
+        )
 
     async def disconnect(self):
         await self._db_pool.close()
@@ -48,7 +52,7 @@ class DeliveryRepository:
         await self.disconnect()
 
     async def set_delivery_bill(self, delivery_id: str, bill_id: str):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 delivery_record = await conn.fetchrow(
@@ -61,7 +65,7 @@ class DeliveryRepository:
                 return False
 
     async def get_delivery_by_id(self, delivery_id: str):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 delivery_record = await conn.fetchrow(
@@ -0,0 +1,94 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from passlib.context import CryptContext
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# bcrypt takes tens of milliseconds of cpu, so it runs in worker processes and never on the event loop
+HASHING_WORKERS = int(os.environ.get("HASHING_WORKERS", os.cpu_count() or 1))
+# Calls waiting for a free worker, calls beyond that are rejected instead of queueing for seconds
+HASHING_QUEUE_SIZE = int(os.environ.get("HASHING_QUEUE_SIZE", "64"))
+
+HASHING_IN_FLIGHT = Gauge(
+    "password_hashing_in_flight",
+    "Password hash and verify calls running or waiting for a worker",
+)
+HASHING_DURATION = Histogram(
+    "password_hashing_duration_seconds",
+    "Time from submitting a password hash or verify call to its result",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+HASHING_REJECTED = Counter(
+    "password_hashing_rejected_total",
+    "Password hash and verify calls rejected because the queue was full",
+)
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class HashingOverloadedError(Exception):
+    pass
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
+
+
+class PasswordHasher:
+    def __init__(self, workers: int = HASHING_WORKERS, queue_size: int = HASHING_QUEUE_SIZE):
+        self._workers = workers
+        self._max_in_flight = workers + queue_size
+        self._in_flight = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def start(self):
+        # Workers are spawned, forking a process with running gRPC threads is unsafe
+        self._executor = ProcessPoolExecutor(
+            self._workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        # Start every worker now, so the first logins do not wait for interpreter startup
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[loop.run_in_executor(self._executor, os.getpid) for _ in range(self._workers)]
+        )
+
+    async def close(self):
+        self._executor.shutdown(cancel_futures=True)
+        self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _run(self, operation: str, fn, *args):
+        if self._in_flight >= self._max_in_flight:
+            HASHING_REJECTED.inc()
+            raise HashingOverloadedError("Too many password checks, try again later")
+
+        self._in_flight += 1
+        HASHING_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._in_flight -= 1
+            HASHING_IN_FLIGHT.dec()
+            HASHING_DURATION.labels(operation).observe(time.perf_counter() - start)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", _hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", _verify, password, hashed_password)
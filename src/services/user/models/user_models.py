@@ -95,6 +95,7 @@ class UserModel(BaseModel):
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
     groups: list[GroupModel]
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_record(cls, data):
@@ -1,6 +1,8 @@
 import os
 import asyncpg
 
+from lib.deadlines import DeadlineConnection, db_timeout
+
 from models.user_models import (
     BriefUserModel,
     CreateUserModel,
@@ -26,6 +28,9 @@ DATABASE_URL = (
 
 DB_PAGE_SIZE = int(os.environ.get("DB_PAGE_SIZE", "1000"))
 
+# Group membership changes touch account.updated_at through triggers, group renames do not
+USER_UPDATED_AT = 'GREATEST(account.updated_at, (SELECT MAX("group".updated_at) FROM "group" JOIN account_group ON account_group.group_id = "group".id WHERE account_group.account_id = account.id)) AS updated_at'
+
 
 class UserRepository:
     def __init__(
@@ -40,7 +45,9 @@ class UserRepository:
         self._cache = cache_class
 
     async def connect(self):
-        self._db_pool = await asyncpg.create_pool(self._connection_string)
+        self._db_pool = await asyncpg.create_pool(
+            self._connection_string, connection_class=DeadlineConnection
+        )
 
     async def disconnect(self):
         await self._db_pool.close()
@@ -72,7 +79,7 @@ class UserRepository:
         )
 
     async def search_users(self, page: int, first_name: str, second_name: str):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
 
@@ -96,13 +103,15 @@ class UserRepository:
             if cache_res is not None:
                 return cache_res
 
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 user_record = await conn.fetchrow(
-                    "SELECT account.id, account.username, account.first_name, account.second_name, account.patronymic, account.email, account.phone FROM account WHERE id = $1 and is_active = TRUE",
+                    f"SELECT account.id, account.username, account.first_name, account.second_name, account.patronymic, account.email, account.phone, {USER_UPDATED_AT} FROM account WHERE id = $1 and is_active = TRUE",
                     user_id,
                 )
+                if user_record is None:
+                    return None
                 groups_records = await self._get_user_groups_by_user_id(conn, user_id)
                 return UserModel.from_record(
                     {
@@ -113,14 +122,24 @@ class UserRepository:
                     }
                 )
 
+    async def get_user_updated_at(self, user_id: str):
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
+            conn: asyncpg.Connection
+            return await conn.fetchval(
+                f"SELECT {USER_UPDATED_AT} FROM account WHERE id = $1 and is_active = TRUE",
+                user_id,
+            )
+
     async def get_user_by_username(self, username: str):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 user_record = await conn.fetchrow(
-                    "SELECT account.id, account.username, account.first_name, account.second_name, account.patronymic, account.email, account.phone FROM account WHERE username = $1 and is_active = TRUE",
+                    f"SELECT account.id, account.username, account.first_name, account.second_name, account.patronymic, account.email, account.phone, {USER_UPDATED_AT} FROM account WHERE username = $1 and is_active = TRUE",
                     username,
                 )
+                if user_record is None:
+                    return None
                 groups_records = await self._get_user_groups_by_username(conn, username)
                 return UserModel.from_record(
                     {
@@ -132,7 +151,7 @@ class UserRepository:
                 )
 
     async def deactivate_user(self, user_id: str):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 affected_columns = await conn.execute(
@@ -146,7 +165,7 @@ class UserRepository:
                 return False
 
     async def reactivate_user(self, user_id: str):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 affected_columns = await conn.execute(
@@ -162,7 +181,7 @@ class UserRepository:
                 return False
 
     async def update_user(self, user_id: str, user: UpdateUserModel | None):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 if user is not None:  # If we have fields for update
@@ -246,7 +265,7 @@ class UserRepository:
                     return user_model
 
     async def create_user(self, user: CreateUserModel):
-        async with self._db_pool.acquire() as conn:
+        async with self._db_pool.acquire(timeout=db_timeout()) as conn:
             conn: asyncpg.Connection
             async with conn.transaction():
                 usr_dmp = user.model_dump(exclude_none=True)
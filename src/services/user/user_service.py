@@ -3,6 +3,10 @@ import os
 import grpc
 from grpc import ServicerContext
 
+from lib.compression import CompressionInterceptor, get_server_compression
+from lib.conditional import has_conditions, is_not_modified
+from lib.deadlines import DeadlineExceededError, DeadlineInterceptor
+from lib.password_hasher import HashingOverloadedError, PasswordHasher
 from repositories.user_repository import UserRepository
 
 from grpc_build.user_service_pb2_grpc import (
@@ -29,23 +33,30 @@ from grpc_build.user_service_pb2 import (
 )
 from models.user_models import UpdateUserModel, UserModel, CreateUserModel
 
-from passlib.context import CryptContext
+from prometheus_client import start_http_server
 
 from models.group_models import GroupModel
 from clients.redis.user_cache import UserCache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Methods returning lists, their large responses are compressed
+COMPRESSED_METHODS = ("SearchUsers",)
 
 
 class UserService(UserServiceServicer):
-    def __init__(self, user_rep: UserRepository):
+    def __init__(self, user_rep: UserRepository, password_hasher: PasswordHasher):
         self._user_rep = user_rep
+        self._password_hasher = password_hasher
 
     async def GetUserData(
         self, request: GetUserDataRequest, context: ServicerContext
     ) -> GetUserDataResponse:
         user_id = request.user_id
         try:
+            if has_conditions(request):
+                updated_at = await self._user_rep.get_user_updated_at(user_id)
+                if updated_at is not None and is_not_modified(request, updated_at):
+                    return GetUserDataResponse(code=304, updated_at=updated_at)
+
             user = await self._user_rep.get_user_by_id(user_id)
 
             if user:
@@ -54,6 +65,8 @@ class UserService(UserServiceServicer):
                 return GetUserDataResponse(
                     code=404, message="User not found or deactivated"
                 )
+        except (DeadlineExceededError, TimeoutError):
+            return GetUserDataResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return GetUserDataResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -80,6 +93,8 @@ class UserService(UserServiceServicer):
                 users=BriefUserArray(arr=[user.to_BriefUserData() for user in users]),
             )
 
+        except (DeadlineExceededError, TimeoutError):
+            return SearchUsersResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return SearchUsersResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -98,6 +113,8 @@ class UserService(UserServiceServicer):
                 return GetUserDataResponse(
                     code=404, message="User not found or deactivated"
                 )
+        except (DeadlineExceededError, TimeoutError):
+            return GetUserDataResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return GetUserDataResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -111,7 +128,7 @@ class UserService(UserServiceServicer):
         if len(creating_user_data.groups.arr) == 0:
             return CreateUserResponse(code=400, message="Missing user group list")
         try:
-            exist_user = self._user_rep.get_user_by_username(
+            exist_user = await self._user_rep.get_user_by_username(
                 creating_user_data.username
             )
             if exist_user is not None:
@@ -124,7 +141,7 @@ class UserService(UserServiceServicer):
                     creating_user_data
                 )
 
-                creating_user_model.password = pwd_context.hash(
+                creating_user_model.password = await self._password_hasher.hash(
                     creating_user_model.password
                 )
 
@@ -138,6 +155,10 @@ class UserService(UserServiceServicer):
                     )
                 else:
                     return CreateUserResponse(code=400, message="Can not create user")
+        except HashingOverloadedError as ex:
+            return CreateUserResponse(code=429, message=str(ex))
+        except (DeadlineExceededError, TimeoutError):
+            return CreateUserResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return CreateUserResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -152,7 +173,7 @@ class UserService(UserServiceServicer):
             updating_user_model = UpdateUserModel.from_grpc_message(updating_user_data)
             if updating_user_model is not None:
                 if updating_user_model.password is not None:
-                    updating_user_model.password = pwd_context.hash(
+                    updating_user_model.password = await self._password_hasher.hash(
                         updating_user_model.password
                     )
 
@@ -169,6 +190,10 @@ class UserService(UserServiceServicer):
                     code=400,
                     message="Failed to update user. Not found user or received data is incorrect.",
                 )
+        except HashingOverloadedError as ex:
+            return UpdateUserDataResponse(code=429, message=str(ex))
+        except (DeadlineExceededError, TimeoutError):
+            return UpdateUserDataResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return UpdateUserDataResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -185,6 +210,8 @@ class UserService(UserServiceServicer):
                 return ReactivateUserResponse(
                     code=404, message="User not found or already activated"
                 )
+        except (DeadlineExceededError, TimeoutError):
+            return ReactivateUserResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return ReactivateUserResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -201,6 +228,8 @@ class UserService(UserServiceServicer):
                 return DeactivateUserResponse(
                     code=404, message="User not found or already deactivated"
                 )
+        except (DeadlineExceededError, TimeoutError):
+            return DeactivateUserResponse(code=504, message="Deadline exceeded")
         except Exception as ex:
             return DeactivateUserResponse(
                 code=500, message=f"Error : {ex}, args : {ex.args}"
@@ -209,12 +238,17 @@ class UserService(UserServiceServicer):
 
 async def serve():
 
-    server = grpc.aio.server()
+    server = grpc.aio.server(
+        interceptors=[DeadlineInterceptor(), CompressionInterceptor(COMPRESSED_METHODS)],
+        compression=get_server_compression(),
+    )
+
+    start_http_server(int(os.environ.get("USER_METRICS_PORT", 9052)))
 
     async with UserCache() as user_cache, UserRepository(
         cache_class=user_cache
-    ) as user_rep:
-        add_UserServiceServicer_to_server(UserService(user_rep), server)
+    ) as user_rep, PasswordHasher() as password_hasher:
+        add_UserServiceServicer_to_server(UserService(user_rep, password_hasher), server)
         server.add_insecure_port(f"[::]:{os.environ.get("USER_SERVICE_PORT", 50052)}")
         print(
             f"Async gRPC Server started at port {os.environ.get("USER_SERVICE_PORT", 50052)}"